@@ -5,3 +5,6 @@ class EquipmentError(CharacterCreationError): ...
 
 
 class ValidationError(CharacterCreationError): ...
+
+
+class SaveFormatError(CharacterCreationError): ...
@@ -6,7 +6,7 @@ from .races_loader import load_race_catalog
 from .progression_loader import load_progression
 from .resources_config_loader import load_resource_config
 from .status_effects_loader import load_status_effects
-from .save_loader import save_character, load_character
+from .save_loader import save_character, load_character, write_characters, iter_characters
 from .difficulty_loader import load_difficulty
 
 __all__ = [
@@ -22,4 +22,6 @@ __all__ = [
     "load_difficulty",
     "save_character",
     "load_character",
+    "write_characters",
+    "iter_characters",
 ]
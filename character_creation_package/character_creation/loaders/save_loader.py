@@ -1,25 +1,188 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator
+import json
+import os
+import struct
 
 import yaml
 
+from ..errors import SaveFormatError
 
-def save_character(character: Any, path: str | Path) -> None:
-    """Saves a character object to YAML."""
+# Version of the save record (the character fields and their encoding). Bump it when that
+# changes and register a migration from the previous version in MIGRATIONS.
+SAVE_SCHEMA = 1
+# .wsc container: magic, u16 container version, then frames of u32 length + compact JSON record
+STREAM_MAGIC = b"WSCS"
+STREAM_VERSION = 1
+_HEADER = struct.Struct("<4sH")
+_FRAME = struct.Struct("<I")
+
+YAML_SUFFIXES = {".yaml", ".yml"}
+JSON_SUFFIXES = {".json"}
+STREAM_SUFFIXES = {".wsc"}
+# fields stored as sets on Character and as sorted lists in saves
+SET_FIELDS = ("abilities", "equipped_abilities")
+
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _migrate_0_to_1(record: Dict[str, Any]) -> Dict[str, Any]:
+    # schema 0: the unversioned dataclass __dict__ of older saves; NPCs could also carry an
+    # instance-level xp_to_next_level number, which is not a field
+    record = {k: v for k, v in record.items() if k != "xp_to_next_level"}
+    record["schema"] = 1
+    return record
+
+
+# schema N -> function turning an N record into an N + 1 record
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    0: _migrate_0_to_1,
+}
+
+
+def migrate(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring a save record up to SAVE_SCHEMA (records without "schema" are version 0)."""
+    if not isinstance(record, dict):
+        raise SaveFormatError(f"save record must be a mapping, got {type(record).__name__}")
+    version = record.get("schema", 0)
+    if not isinstance(version, int) or version > SAVE_SCHEMA:
+        raise SaveFormatError(
+            f"save schema {version!r} is newer than supported ({SAVE_SCHEMA}); update the game"
+        )
+    while version < SAVE_SCHEMA:
+        record = MIGRATIONS[version](record)
+        version = record["schema"]
+    return record
+
+
+def character_to_record(character: Any) -> Dict[str, Any]:
+    """Plain-data, current-schema record of a character (sets become sorted lists)."""
+    data = character.to_dict() if hasattr(character, "to_dict") else dict(character.__dict__)
+    for key in SET_FIELDS:
+        if isinstance(data.get(key), (set, frozenset)):
+            data[key] = sorted(data[key])
+    return {"schema": SAVE_SCHEMA, **data}
+
+
+def record_to_character(record: Dict[str, Any], cls: type) -> Any:
+    data = dict(migrate(record))
+    data.pop("schema", None)
+    for key in SET_FIELDS:
+        if isinstance(data.get(key), list):
+            data[key] = set(data[key])
+    return cls(**data)
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """Compact UTF-8 JSON of a save record (the .json file / .wsc frame payload)."""
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _format(path: Path, fmt: str | None) -> str:
+    if fmt is not None:
+        return fmt
+    suffix = path.suffix.lower()
+    if suffix in JSON_SUFFIXES:
+        return "json"
+    if suffix in STREAM_SUFFIXES:
+        return "wsc"
+    return "yaml"  # .yaml/.yml and, as before, anything else
+
+
+def _write_atomic(path: Path, write: Callable[[BinaryIO], None]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as fh:
+            write(fh)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def save_character(character: Any, path: str | Path, fmt: str | None = None) -> None:
+    """
+    Saves a character. The format follows the extension (override with `fmt`): .json is
+    compact JSON, .wsc a one-record character stream, anything else YAML.
+    """
     if not isinstance(path, Path):
         path = Path(path)
-    data = character.__dict__
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fh:
-        yaml.safe_dump(data, fh)
+    fmt = _format(path, fmt)
+    if fmt == "wsc":
+        write_characters(path, [character])
+        return
+    record = character_to_record(character)
+    if fmt == "json":
+        payload = encode_record(record)
+    else:
+        payload = yaml.dump(record, Dumper=_YamlDumper, allow_unicode=True).encode("utf-8")
+    _write_atomic(path, lambda fh: fh.write(payload))
 
 
-def load_character(path: str | Path, cls: type) -> Any:
-    """Loads a character from YAML into the provided class."""
+def load_character(path: str | Path, cls: type, fmt: str | None = None) -> Any:
+    """Loads a character saved in any supported format/schema into the provided class."""
     if not isinstance(path, Path):
         path = Path(path)
-    with open(path, "r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
-    return cls(**data)
+    fmt = _format(path, fmt)
+    if fmt == "wsc":
+        for character in iter_characters(path, cls):
+            return character
+        raise SaveFormatError(f"{path} holds no characters")
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    if fmt == "json":
+        record = json.loads(raw)
+    else:
+        record = yaml.load(raw, Loader=_YamlLoader) or {}
+    return record_to_character(record, cls)
+
+
+def write_characters(path: str | Path, characters: Iterable[Any]) -> int:
+    """Stream characters into a .wsc file one frame at a time; returns how many were written."""
+    count = 0
+
+    def write(fh: BinaryIO) -> None:
+        nonlocal count
+        fh.write(_HEADER.pack(STREAM_MAGIC, STREAM_VERSION))
+        for character in characters:
+            payload = encode_record(character_to_record(character))
+            fh.write(_FRAME.pack(len(payload)))
+            fh.write(payload)
+            count += 1
+
+    _write_atomic(Path(path), write)
+    return count
+
+
+def iter_records(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """Yield the raw (unmigrated) records of a .wsc file, reading one frame at a time."""
+    with open(path, "rb") as fh:
+        header = fh.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise SaveFormatError(f"{path} is not a character stream")
+        magic, version = _HEADER.unpack(header)
+        if magic != STREAM_MAGIC:
+            raise SaveFormatError(f"{path} is not a character stream")
+        if version > STREAM_VERSION:
+            raise SaveFormatError(f"{path}: stream version {version} is newer than supported")
+        while True:
+            head = fh.read(_FRAME.size)
+            if not head:
+                return
+            if len(head) < _FRAME.size:
+                raise SaveFormatError(f"{path} is truncated")
+            (size,) = _FRAME.unpack(head)
+            payload = fh.read(size)
+            if len(payload) != size:
+                raise SaveFormatError(f"{path} is truncated")
+            yield json.loads(payload)
+
+
+def iter_characters(path: str | Path, cls: type) -> Iterator[Any]:
+    """Yield characters from a .wsc file lazily, migrating each record."""
+    for record in iter_records(path):
+        yield record_to_character(record, cls)
@@ -1,42 +1,161 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional, Any
 from pathlib import Path
-import json
 from character_creation.services.formula_eval import evaluate
 from character_creation.errors import EquipmentError
+from character_creation.models.stat_block import StatBlock
+
+# field name -> default (REQUIRED: positional, no default); a callable builds a fresh container
+REQUIRED = object()
+FIELDS: Dict[str, Any] = {
+    "name": REQUIRED,
+    "stats": REQUIRED,
+    "stat_xp": REQUIRED,
+    "classes": list,
+    "abilities": set,
+    "traits": list,
+    "race": None,
+    "hp": 20.0,
+    "mana": 20.0,
+    "hp_max": 0.0,
+    "mana_max": 0.0,
+    "last_regen_time_hp": 0.0,
+    "last_regen_time_mana": 0.0,
+    # Progression
+    "level": 1,
+    "xp_total": 0.0,
+    "stat_points": 0,
+    "inventory": list,
+    "equipment": dict,
+    "appearance": dict,
+    # Equipment bonuses
+    "equipped_stat_mods": dict,
+    "equipped_hp_bonus": 0.0,
+    "equipped_mana_bonus": 0.0,
+    "equipped_abilities": set,
+    "active_effects": list,
+    # Optional difficulty label (traceability)
+    "difficulty": None,
+}
+# container fields left unset until first access (most NPCs never touch them); equipment
+# and appearance are filled in for every created character, so they are plain slots
+LAZY = tuple(
+    f for f, d in FIELDS.items() if d in (list, set, dict) and f not in ("equipment", "appearance")
+)
+
+
+class _LazyField:
+    """Container attribute built by `factory` on first access, stored in slot `_<name>`."""
+
+    __slots__ = ("slot", "factory")
+
+    def __init__(self, slot: Any, factory: Any):
+        self.slot = slot
+        self.factory = factory
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, owner)
+        except AttributeError:
+            value = self.factory()
+            self.slot.__set__(obj, value)
+            return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.slot.__set__(obj, value)
+
+    def peek(self, obj: Any) -> Any:
+        """The value without materializing it (a fresh, unstored container if unset)."""
+        try:
+            return self.slot.__get__(obj, type(obj))
+        except AttributeError:
+            return self.factory()
 
 
-@dataclass
 class Character:
+    """
+    A character. Slotted (no per-instance __dict__), with stats in a StatBlock and the
+    list/set/dict fields created on first access; stat_xp, equipment and appearance stay
+    plain dicts. The constructor takes the same arguments, in the same order, as the former
+    dataclass and accepts a plain stats dict. to_dict() gives the plain-data form used by
+    saves.
+    """
+
+    __slots__ = tuple(f"_{f}" if f == "stats" or f in LAZY else f for f in FIELDS)
+
     name: str
-    stats: Dict[str, float]
     stat_xp: Dict[str, float]
-    classes: List[str] = field(default_factory=list)
-    abilities: Set[str] = field(default_factory=set)
-    traits: List[str] = field(default_factory=list)
-    race: str | None = None
-    hp: float = 20.0
-    mana: float = 20.0
-    hp_max: float = 0.0
-    mana_max: float = 0.0
-    last_regen_time_hp: float = 0.0
-    last_regen_time_mana: float = 0.0
-    # Progression
-    level: int = 1
-    xp_total: float = 0.0
-    stat_points: int = 0
-    inventory: List[str] = field(default_factory=list)
-    equipment: Dict[str, Optional[str]] = field(default_factory=dict)
-    appearance: Dict[str, Any] = field(default_factory=dict)
-    # Equipment bonuses
-    equipped_stat_mods: Dict[str, float] = field(default_factory=dict)
-    equipped_hp_bonus: float = 0.0
-    equipped_mana_bonus: float = 0.0
-    equipped_abilities: Set[str] = field(default_factory=set)
-    active_effects: list[dict] = field(default_factory=list)
-    # Optional difficulty label (traceability)
-    difficulty: str | None = None
+    classes: List[str]
+    abilities: Set[str]
+    traits: List[str]
+    race: str | None
+    hp: float
+    mana: float
+    hp_max: float
+    mana_max: float
+    last_regen_time_hp: float
+    last_regen_time_mana: float
+    level: int
+    xp_total: float
+    stat_points: int
+    inventory: List[str]
+    equipment: Dict[str, Optional[str]]
+    appearance: Dict[str, Any]
+    equipped_stat_mods: Dict[str, float]
+    equipped_hp_bonus: float
+    equipped_mana_bonus: float
+    equipped_abilities: Set[str]
+    active_effects: list[dict]
+    difficulty: str | None
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        if len(args) > len(FIELDS):
+            raise TypeError(f"Character() takes at most {len(FIELDS)} positional arguments")
+        values = dict(zip(FIELDS, args))
+        for key, value in kwargs.items():
+            if key not in FIELDS:
+                raise TypeError(f"Character() got an unexpected keyword argument '{key}'")
+            if key in values:
+                raise TypeError(f"Character() got multiple values for argument '{key}'")
+            values[key] = value
+        for key, default in FIELDS.items():
+            if key in values:
+                setattr(self, key, values[key])
+            elif default is REQUIRED:
+                raise TypeError(f"Character() missing required argument: '{key}'")
+            elif key not in LAZY:
+                setattr(self, key, default() if callable(default) else default)
+
+    @property
+    def stats(self) -> StatBlock:
+        return self._stats
+
+    @stats.setter
+    def stats(self, value: Any) -> None:
+        self._stats = StatBlock.coerce(value)
+
+    def _field(self, key: str) -> Any:
+        # lazy containers are read without being created
+        return _LAZY_FIELDS[key].peek(self) if key in _LAZY_FIELDS else getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Field name -> value, with stats as a plain dict (the former dataclass __dict__)."""
+        data = {key: self._field(key) for key in FIELDS}
+        data["stats"] = self._stats.to_dict()
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(self._field(key) == other._field(key) for key in FIELDS)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        body = ", ".join(f"{key}={self._field(key)!r}" for key in FIELDS)
+        return f"{type(self).__name__}({body})"
 
     def gain_xp(self, stat_key: str, amount: float, stat_template: Dict[str, dict]) -> None:
         xp_to_next = stat_template[stat_key].get("xp_to_next", 100)
@@ -50,7 +169,7 @@ class Character:
             self.stat_xp[stat_key] = max(0.0, self.stat_xp[stat_key] - amount)
 
     def increase_stat(self, stat_key: str, amt: float) -> None:
-        self.stats[stat_key] = self.stats.get(stat_key, 0.0) + amt
+        self._stats.add(stat_key, amt)
 
     def add_class(self, class_def: dict) -> None:
         class_id = class_def.get("id")
@@ -176,10 +295,12 @@ class Character:
         # Normalize stat key to match available keys (case-insensitive)
         stat_key_norm = stat_key.upper()
         # Try exact, then fallback to lower/upper
-        stat_val = self.stats.get(stat_key_norm)
-        if stat_val is None:
+        stats = self._stats
+        if stat_key_norm in stats:
+            stat_val = stats.value(stat_key_norm)
+        else:
             # Try lower-case fallback
-            stat_val = self.stats.get(stat_key_norm.lower(), 0.0)
+            stat_val = stats.value(stat_key_norm.lower(), 0.0)
         mod_val = self.equipped_stat_mods.get(stat_key_norm, 0.0)
         if mod_val == 0.0:
             mod_val = self.equipped_stat_mods.get(stat_key_norm.lower(), 0.0)
@@ -279,35 +400,6 @@ class Character:
                 remaining_effects.append(eff)
         self.active_effects = remaining_effects
 
-    def _value_for_context(self, v: Any) -> float:
-        """
-        Extract a numeric value from a stat representation for formula context.
-        Supports objects with .current, dicts with 'current', or numeric values.
-        """
-        if hasattr(v, "current"):
-            try:
-                return float(v.current)
-            except Exception:
-                return 0.0
-        if isinstance(v, dict):
-            # Prefer 'current' then 'base'
-            if "current" in v:
-                try:
-                    return float(v["current"])
-                except Exception:
-                    return 0.0
-            if "base" in v:
-                try:
-                    return float(v["base"])
-                except Exception:
-                    return 0.0
-        if isinstance(v, (int, float)):
-            return float(v)
-        try:
-            return float(v)
-        except Exception:
-            return 0.0
-
     def refresh_derived(
         self,
         formulas: dict,
@@ -321,9 +413,9 @@ class Character:
         If keep_percent=True, preserve current% fill when changing base; else set current=base.
         """
         # Build evaluation context
-        ctx: Dict[str, Any] = {"level": self.level}
-        for s_name, s_val in self.stats.items():
-            ctx[s_name] = self._value_for_context(s_val)
+        stats = self._stats
+        ctx: Dict[str, Any] = stats.context()
+        ctx["level"] = self.level
 
         # Compute new base values
         new_hp_base = float(evaluate(formulas["baseline"]["hp"], ctx))
@@ -339,60 +431,17 @@ class Character:
             except Exception:
                 pass
 
-        # Update HP structure
-        hp_obj = self.stats.get("HP")
-        hp_current: float | None = None
-        if hasattr(hp_obj, "base") and hasattr(hp_obj, "current"):
-            old_base = float(getattr(hp_obj, "base", new_hp_base)) or 1.0
-            percent = float(getattr(hp_obj, "current", old_base)) / old_base if old_base else 1.0
-            setattr(hp_obj, "base", new_hp_base)
-            hp_current = percent * new_hp_base if keep_percent else new_hp_base
-            setattr(hp_obj, "current", hp_current)
-        elif isinstance(hp_obj, dict) and ("base" in hp_obj or "current" in hp_obj):
-            old_base = float(hp_obj.get("base", new_hp_base)) or 1.0
-            percent = float(hp_obj.get("current", old_base)) / old_base if old_base else 1.0
-            hp_obj["base"] = new_hp_base
-            hp_current = percent * new_hp_base if keep_percent else new_hp_base
-            hp_obj["current"] = hp_current
-        else:
-            # Fall back to float attribute
-            hp_current = new_hp_base
-            self.hp = hp_current
-        # Update max values
+        # Update the HP/Mana pools (base/current) and the mirrored attributes
+        for pool, new_base in (("HP", new_hp_base), ("Mana", new_mana_base)):
+            current = new_base
+            if keep_percent and stats.is_pool(pool):
+                old_base = stats.base_value(pool) or 1.0
+                current = stats.value(pool) / old_base * new_base
+            stats.set_pool(pool, new_base, current)
         self.hp_max = new_hp_base
-        if hp_current is None:
-            # If we couldn't derive from structure, set current equal to base
-            hp_current = new_hp_base
-        self.hp = float(hp_current)
-
-        # Update Mana structure
-        mana_obj = self.stats.get("Mana")
-        mana_current: float | None = None
-        if hasattr(mana_obj, "base") and hasattr(mana_obj, "current"):
-            old_base = float(getattr(mana_obj, "base", new_mana_base)) or 1.0
-            percent = float(getattr(mana_obj, "current", old_base)) / old_base if old_base else 1.0
-            setattr(mana_obj, "base", new_mana_base)
-            mana_current = percent * new_mana_base if keep_percent else new_mana_base
-            setattr(mana_obj, "current", mana_current)
-        elif isinstance(mana_obj, dict) and ("base" in mana_obj or "current" in mana_obj):
-            old_base = float(mana_obj.get("base", new_mana_base)) or 1.0
-            percent = float(mana_obj.get("current", old_base)) / old_base if old_base else 1.0
-            mana_obj["base"] = new_mana_base
-            mana_current = percent * new_mana_base if keep_percent else new_mana_base
-            mana_obj["current"] = mana_current
-        else:
-            # Fall back to float attribute
-            mana_current = new_mana_base
-            self.mana = mana_current
-        # Update max values
+        self.hp = stats.value("HP")
         self.mana_max = new_mana_base
-        if mana_current is None:
-            mana_current = new_mana_base
-        self.mana = float(mana_current)
-
-        # Ensure stats dict has HP and Mana entries with base/current synced
-        self.stats["HP"] = {"base": self.hp_max, "current": self.hp}
-        self.stats["Mana"] = {"base": self.mana_max, "current": self.mana}
+        self.mana = stats.value("Mana")
 
     def xp_to_next_level(self, formulas: dict, balance: dict | None = None) -> float:
         """
@@ -517,32 +566,26 @@ class Character:
             self.appearance[field_id] = defaults.get(field_id, meta.get("default"))
 
     def to_json(self, path: str | Path) -> None:
-        # Convert sets to lists for JSON serialization
-        data = self.__dict__.copy()
-        for k, v in data.items():
-            if isinstance(v, set):
-                data[k] = list(v)
-        with open(str(path), "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """Save this character as compact JSON (whatever the file extension)."""
+        from character_creation.loaders import save_loader
+
+        save_loader.save_character(self, path, fmt="json")
 
     @classmethod
     def from_json(cls, path: str | Path) -> "Character":
-        with open(str(path), "r", encoding="utf-8") as f:
-            data = json.load(f)
-        # Convert abilities back to set if loaded as list
-        if isinstance(data.get("abilities"), list):
-            data["abilities"] = set(data["abilities"])
-        return cls(**data)
+        from character_creation.loaders import save_loader
+
+        return save_loader.load_character(path, cls, fmt="json")
 
     def save(self, save_path: str | Path) -> None:
-        """Save this character to a YAML file."""
+        """Save this character; .json / .wsc pick those formats, anything else is YAML."""
         from character_creation.loaders import save_loader
 
         save_loader.save_character(self, save_path)
 
     @classmethod
     def load(cls, save_path: str | Path) -> "Character":
-        """Load a character from YAML file."""
+        """Load a character saved by save() (format chosen by extension)."""
         from character_creation.loaders import save_loader
 
         return save_loader.load_character(save_path, cls)
@@ -573,3 +616,8 @@ class Character:
         except Exception:
             # Fail gracefully on malformed catalogs
             return
+
+
+_LAZY_FIELDS = {name: _LazyField(Character.__dict__[f"_{name}"], FIELDS[name]) for name in LAZY}
+for _name, _field in _LAZY_FIELDS.items():
+    setattr(Character, _name, _field)
@@ -1,5 +1,6 @@
 from typing import Dict, Any
 from .character import Character
+from .stat_block import StatBlock
 
 
 def create_new_character(
@@ -14,7 +15,7 @@ def create_new_character(
     formulas: Dict[str, Any] | None = None,
     race_id: str | None = None,
 ) -> Character:
-    stats = {k: v["initial"] for k, v in stat_tmpl.items()}
+    stats = StatBlock.from_template(stat_tmpl)
     stat_xp = {k: 0.0 for k in stat_tmpl}
     hp = resources["baseline"]["hp"]
     mana = resources["baseline"]["mana"]
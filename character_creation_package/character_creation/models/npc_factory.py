@@ -1,9 +1,12 @@
 # character_creation/models/npc_factory.py
 
+import hashlib
 import random
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 
 from character_creation.models.character import Character
 from character_creation.models import factory
@@ -12,36 +15,6 @@ from character_creation.services.seed import set_seed
 from character_creation.loaders import yaml_utils
 
 
-def _add_stat_value(character: Character, stat_name: str, delta: float) -> None:
-    """
-    Add `delta` to a stat, regardless of whether the stat is an object (.base/.current),
-    a dict with 'base'/'current', or a plain number. Gracefully no-op if unknown.
-    """
-    if stat_name not in character.stats:
-        return
-
-    val = character.stats[stat_name]
-
-    # Object with attributes
-    if hasattr(val, "base") and hasattr(val, "current"):
-        val.base += delta
-        val.current += delta
-        return
-
-    # Dict with keys
-    if isinstance(val, dict) and "base" in val and "current" in val:
-        val["base"] += delta
-        val["current"] += delta
-        return
-
-    # Numeric fallback
-    try:
-        base_val = float(val) if isinstance(val, (int, float, str)) else 0.0
-        character.stats[stat_name] = base_val + delta
-    except Exception:
-        pass
-
-
 def _add_abilities(collection: Any, abilities: List[str]) -> None:
     """Add ability names to either a set or list, de-duplicating when needed."""
     if not abilities or collection is None:
@@ -68,162 +41,346 @@ def _append_collection(collection: Any, item: Any) -> None:
             collection.add(item)
 
 
-def _stat_value_for_ctx(v: Any) -> float:
-    """Extract a numeric 'current' value from various stat representations for formula context."""
-    if hasattr(v, "current"):
-        return float(v.current)
-    if isinstance(v, dict) and "current" in v:
-        return float(v["current"])
-    if isinstance(v, (int, float)):
-        return float(v)
-    try:
-        return float(v)
-    except Exception:
-        return 0.0
+class _GlobalRolls:
+    """Draws from the global `random` module via random_utils (generate_npc's behaviour)."""
 
+    def randint(self, a: int, b: int) -> int:
+        return random.randint(a, b)
 
-def generate_npc(
-    name_prefix: str,
-    stat_tmpl: Dict[str, Any],
-    slot_tmpl: Dict[str, Any],
-    appearance_fields: Dict[str, Any],
-    appearance_tables_dir: Path,
-    appearance_ranges_dir: Path,
-    class_catalog: List[Dict[str, Any]],
-    trait_catalog: Dict[str, Any],
-    resources: Dict[str, Any],
+    def sample(self, population: List[Any], k: int) -> List[Any]:
+        return random.sample(population, k=k)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        return random_utils.choice(seq)
+
+    def normal(self, mean: float, sd: float) -> float:
+        return random_utils.roll_normal(mean=mean, sd=sd)
+
+    def uniform(self, min_val: float, max_val: float) -> float:
+        return random_utils.roll_uniform(min_val=min_val, max_val=max_val)
+
+
+class _Rolls(_GlobalRolls):
+    """The same draws from a private random.Random (no global state touched)."""
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def randint(self, a: int, b: int) -> int:
+        return self.rng.randint(a, b)
+
+    def sample(self, population: List[Any], k: int) -> List[Any]:
+        return self.rng.sample(population, k=k)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        return self.rng.choice(seq) if seq else None
+
+    def normal(self, mean: float, sd: float) -> float:
+        return self.rng.gauss(mean, sd)
+
+    def uniform(self, min_val: float, max_val: float) -> float:
+        return self.rng.uniform(min_val, max_val)
+
+
+def _ref_path(info: Dict[str, Any], keys: Tuple[str, str], legacy_dir: Path) -> Path | None:
+    # `table_ref: {file: tables/x.yaml}` is relative to the appearance dir (as in
+    # appearance_logic); the older `table_file: x.yaml` is relative to the tables/ranges dir
+    ref = info.get(keys[0])
+    if isinstance(ref, dict):
+        ref = ref.get("file")
+    if isinstance(ref, str) and ref:
+        return legacy_dir.parent / ref
+    legacy = info.get(keys[1])
+    if isinstance(legacy, str) and legacy:
+        return legacy_dir / legacy
+    return None
+
+
+def _appearance_roll(
+    field_name: str,
+    field_info: Dict[str, Any],
+    tables_dir: Path,
+    ranges_dir: Path,
     formulas: Dict[str, Any],
-    seed: int | None = None,
-) -> Character:
+) -> Tuple[Any, ...]:
+    field_type = field_info.get("type")
+    default = field_info.get("default")
+    if field_type == "enum":
+        path = _ref_path(field_info, ("table_ref", "table_file"), tables_dir)
+        if path is not None and path.exists():
+            data = yaml_utils.load_yaml(path)
+            values = data.get("values") or [] if isinstance(data, dict) else data or []
+            if values:
+                return ("enum", list(values))
+        return ("value", default if default is not None else "Unknown")
+    if field_type == "float":
+        block = field_info.get("range") if isinstance(field_info.get("range"), dict) else None
+        path = _ref_path(field_info, ("range_ref", "range_file"), ranges_dir)
+        if block is None and path is not None and path.exists():
+            data = yaml_utils.load_yaml(path) or {}
+            block = data.get("range", data) if isinstance(data, dict) else None
+        if block is None:
+            return ("value", default) if default is not None else ("unit",)
+        dist_key = f"{field_name}_distribution"
+        distribution = formulas.get("rng", {}).get(dist_key, block.get("distribution", "uniform"))
+        lo, hi = block.get("min"), block.get("max")
+        if distribution == "normal":
+            return ("normal", block.get("mean", 0.0), block.get("sd", 1.0), lo, hi)
+        return ("uniform", lo if lo is not None else 0.0, hi if hi is not None else 1.0)
+    return ("keep", field_info.get("default", ""))
+
+
+@dataclass
+class NpcTables:
     """
-    Generates a complete NPC character with randomized attributes.
+    Everything NPC generation reads, loaded once: templates, catalogs, appearance defaults and
+    each appearance field resolved to a roll — ("enum", values), ("normal", mean, sd, min, max)
+    (min/max clamp, may be None), ("uniform", min, max), ("value", v), ("unit",) for an
+    unranged float without default, or ("keep", default) for untyped fields.
+    Picklable, so process pools ship it to each worker once.
     """
 
-    # 0) Optional deterministic seeding
-    set_seed(seed)
+    stat_tmpl: Dict[str, Any]
+    slot_tmpl: Dict[str, Any]
+    appearance_fields: Dict[str, Any]
+    appearance_defaults: Dict[str, Any]
+    class_catalog: List[Dict[str, Any]]
+    trait_catalog: Dict[str, Any]
+    resources: Dict[str, Any]
+    formulas: Dict[str, Any]
+    appearance_rolls: List[Tuple[str, Tuple[Any, ...]]] = field(default_factory=list)
+
+    @classmethod
+    def load(
+        cls,
+        stat_tmpl: Dict[str, Any],
+        slot_tmpl: Dict[str, Any],
+        appearance_fields: Dict[str, Any],
+        appearance_tables_dir: Path,
+        appearance_ranges_dir: Path,
+        class_catalog: List[Dict[str, Any]],
+        trait_catalog: Dict[str, Any],
+        resources: Dict[str, Any],
+        formulas: Dict[str, Any],
+    ) -> "NpcTables":
+        """Resolve every appearance field to its roll, reading each table/range file once."""
+        # appearance_tables_dir = .../appearance/tables  -> parent is .../appearance
+        appearance_defaults_path = appearance_tables_dir.parent / "defaults.yaml"
+        appearance_defaults = (
+            yaml_utils.load_yaml(appearance_defaults_path) or {}
+            if appearance_defaults_path.exists()
+            else {}
+        )
+        rolls = [
+            (
+                field_name,
+                _appearance_roll(
+                    field_name, field_info, appearance_tables_dir, appearance_ranges_dir, formulas
+                ),
+            )
+            for field_name, field_info in appearance_fields.items()
+        ]
+        return cls(
+            stat_tmpl=stat_tmpl,
+            slot_tmpl=slot_tmpl,
+            appearance_fields=appearance_fields,
+            appearance_defaults=appearance_defaults,
+            class_catalog=class_catalog,
+            trait_catalog=trait_catalog,
+            resources=resources,
+            formulas=formulas,
+            appearance_rolls=rolls,
+        )
+
+    @classmethod
+    def from_data(cls, data_root: str | Path | None = None) -> "NpcTables":
+        """Tables for a data directory (package data by default) via the shared registry."""
+        from character_creation.services.catalog_registry import shared_registry
+
+        catalogs = shared_registry(data_root)
+        root = catalogs.data_root
+        return cls.load(
+            stat_tmpl=catalogs.get("stats"),
+            slot_tmpl=catalogs.get("slots"),
+            appearance_fields=catalogs.get("appearance_fields").get("fields", {}),
+            appearance_tables_dir=root / "appearance" / "tables",
+            appearance_ranges_dir=root / "appearance" / "ranges",
+            class_catalog=catalogs.get("classes").get("classes", []),
+            trait_catalog=catalogs.get("traits"),
+            resources=catalogs.get("resources"),
+            formulas=catalogs.get("formulas"),
+        )
+
 
+def _build_npc(tables: NpcTables, npc_name: str, rolls: _GlobalRolls) -> Character:
     # 1) Randomize stats from template
-    randomized_stats = {k: v.copy() for k, v in stat_tmpl.items()}
+    randomized_stats = {k: v.copy() for k, v in tables.stat_tmpl.items()}
     for stat_data in randomized_stats.values():
-        bumps = random.randint(0, 3)
+        bumps = rolls.randint(0, 3)
         stat_data["initial"] += bumps * 0.1
 
     # 2) Choose class and traits
-    if not class_catalog:
+    if not tables.class_catalog:
         raise ValueError("Class catalog is empty, cannot generate NPC.")
-    starter_class = random_utils.choice(
-        class_catalog
+    starter_class = rolls.choice(
+        tables.class_catalog
     )  # dict: {id, grants_stats, grants_abilities, ...}
 
     # trait_catalog is a mapping with key 'traits' -> dict of trait_id -> def
-    trait_names = list(trait_catalog.get("traits", {}).keys())
+    trait_names = list(tables.trait_catalog.get("traits", {}).keys())
     max_traits = min(len(trait_names), 2)
-    num_traits = random.randint(0, max_traits)
-    chosen_trait_names = random.sample(trait_names, k=num_traits)
-
-    # 3) Load appearance defaults (sibling to fields.yaml)
-    # appearance_tables_dir = .../appearance/tables  -> parent is .../appearance
-    appearance_defaults_path = appearance_tables_dir.parent / "defaults.yaml"
-    appearance_defaults = (
-        yaml_utils.load_yaml(appearance_defaults_path) if appearance_defaults_path.exists() else {}
-    )
+    num_traits = rolls.randint(0, max_traits)
+    chosen_trait_names = rolls.sample(trait_names, k=num_traits)
 
     # 4) Create the character
-    unique_id = str(uuid.uuid4()).split("-")[0]
-    npc_name = f"{name_prefix}_{unique_id}"
     character = factory.create_new_character(
         name=npc_name,
         stat_tmpl=randomized_stats,
-        slot_tmpl=slot_tmpl,
-        appearance_fields=appearance_fields,
-        appearance_defaults=appearance_defaults,
-        resources=resources,
+        slot_tmpl=tables.slot_tmpl,
+        appearance_fields=tables.appearance_fields,
+        appearance_defaults=tables.appearance_defaults,
+        resources=tables.resources,
     )
 
     # 5) Apply class and traits via Character API (IDs only, effects inside)
     character.add_class(starter_class)
-    character.add_traits(chosen_trait_names, trait_catalog)
+    character.add_traits(chosen_trait_names, tables.trait_catalog)
 
     # 7) Roll random appearance values (override defaults where appropriate)
-    for field_name, field_info in appearance_fields.items():
-        field_type = field_info.get("type")
-        if field_type == "enum":
-            table_file_name = field_info.get("table_file")
-            if table_file_name:
-                table_file = appearance_tables_dir / table_file_name
-                if table_file.exists():
-                    values = yaml_utils.load_yaml(table_file)
-                    character.appearance[field_name] = random_utils.choice(values)
-                    continue
-            # Fallbacks if table missing
-            if "default" in field_info and field_info["default"] is not None:
-                character.appearance[field_name] = field_info["default"]
-            else:
-                character.appearance[field_name] = "Unknown"
-        elif field_type == "float":
-            range_file_name = field_info.get("range_file")
-            if range_file_name:
-                range_file = appearance_ranges_dir / range_file_name
-                if range_file.exists():
-                    range_data = yaml_utils.load_yaml(range_file)
-                    dist_key = f"{field_name}_distribution"
-                    distribution = formulas.get("rng", {}).get(dist_key, "uniform")
-                    if distribution == "normal":
-                        character.appearance[field_name] = random_utils.roll_normal(
-                            mean=range_data.get("mean", 0.0),
-                            sd=range_data.get("sd", 1.0),
-                        )
-                    else:
-                        character.appearance[field_name] = random_utils.roll_uniform(
-                            min_val=range_data.get("min", 0.0),
-                            max_val=range_data.get("max", 1.0),
-                        )
-                    continue
-            # Fallbacks if range missing
-            if "default" in field_info and field_info["default"] is not None:
-                character.appearance[field_name] = field_info["default"]
-            else:
-                # deterministic enough for tests but non-None
-                character.appearance[field_name] = random_utils.roll_uniform(0.0, 1.0)
+    for field_name, roll in tables.appearance_rolls:
+        kind = roll[0]
+        if kind == "enum":
+            character.appearance[field_name] = rolls.choice(roll[1])
+        elif kind == "normal":
+            value = rolls.normal(mean=roll[1], sd=roll[2])
+            if roll[3] is not None:
+                value = max(value, roll[3])
+            if roll[4] is not None:
+                value = min(value, roll[4])
+            character.appearance[field_name] = value
+        elif kind == "uniform":
+            character.appearance[field_name] = rolls.uniform(min_val=roll[1], max_val=roll[2])
+        elif kind == "value":
+            character.appearance[field_name] = roll[1]
+        elif kind == "unit":
+            # deterministic enough for tests but non-None
+            character.appearance[field_name] = rolls.uniform(0.0, 1.0)
         else:
             # For 'any' and other types, keep defaults or set to a non-None placeholder
             if field_name not in character.appearance or character.appearance[field_name] is None:
-                character.appearance[field_name] = field_info.get("default", "")
+                character.appearance[field_name] = roll[1]
 
     # 8) Set starting level
     character.level = 1
 
     # 9) Recalculate HP/Mana via formulas
-    ctx = {"level": character.level}
-    for s_name, s_val in character.stats.items():
-        ctx[s_name] = _stat_value_for_ctx(s_val)
+    formulas = tables.formulas
+    ctx = character.stats.context()
+    ctx["level"] = character.level
 
     hp_val = int(formula_eval.evaluate(formulas["baseline"]["hp"], ctx))
     mana_val = int(formula_eval.evaluate(formulas["baseline"]["mana"], ctx))
-
-    # Set HP
-    hp_obj = character.stats.get("HP")
-    if hasattr(hp_obj, "base") and hasattr(hp_obj, "current"):
-        hp_obj.base = hp_val
-        hp_obj.current = hp_val
-    elif isinstance(hp_obj, dict):
-        hp_obj["base"] = hp_val
-        hp_obj["current"] = hp_val
-    else:
-        character.stats["HP"] = {"base": hp_val, "current": hp_val}
-
-    # Set Mana
-    mana_obj = character.stats.get("Mana")
-    if hasattr(mana_obj, "base") and hasattr(mana_obj, "current"):
-        mana_obj.base = mana_val
-        mana_obj.current = mana_val
-    elif isinstance(mana_obj, dict):
-        mana_obj["base"] = mana_val
-        mana_obj["current"] = mana_val
-    else:
-        character.stats["Mana"] = {"base": mana_val, "current": mana_val}
-
-    # XP to next
-    character.xp_to_next_level = int(formula_eval.evaluate(formulas["baseline"]["xp_to_next"], ctx))
+    character.stats.set_pool("HP", hp_val, hp_val)
+    character.stats.set_pool("Mana", mana_val, mana_val)
 
     return character
+
+
+def generate_npc(
+    name_prefix: str,
+    stat_tmpl: Dict[str, Any],
+    slot_tmpl: Dict[str, Any],
+    appearance_fields: Dict[str, Any],
+    appearance_tables_dir: Path,
+    appearance_ranges_dir: Path,
+    class_catalog: List[Dict[str, Any]],
+    trait_catalog: Dict[str, Any],
+    resources: Dict[str, Any],
+    formulas: Dict[str, Any],
+    seed: int | None = None,
+) -> Character:
+    """
+    Generates a complete NPC character with randomized attributes.
+    Draws from the global `random` module (re-seeded when `seed` is given); for many NPCs use
+    generate_npcs, which loads the tables once and never touches global state.
+    """
+
+    # 0) Optional deterministic seeding
+    set_seed(seed)
+
+    tables = NpcTables.load(
+        stat_tmpl,
+        slot_tmpl,
+        appearance_fields,
+        appearance_tables_dir,
+        appearance_ranges_dir,
+        class_catalog,
+        trait_catalog,
+        resources,
+        formulas,
+    )
+    if not class_catalog:
+        raise ValueError("Class catalog is empty, cannot generate NPC.")
+    unique_id = str(uuid.uuid4()).split("-")[0]
+    return _build_npc(tables, f"{name_prefix}_{unique_id}", _GlobalRolls())
+
+
+def derive_seed(base_seed: int, index: int) -> int:
+    """Independent 64-bit seed of NPC `index` in a batch seeded with `base_seed`."""
+    digest = hashlib.blake2b(f"{base_seed}:{index}".encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _generate_range(
+    tables: NpcTables, start: int, stop: int, base_seed: int, name_prefix: str
+) -> List[Character]:
+    out = []
+    for i in range(start, stop):
+        npc_seed = derive_seed(base_seed, i)
+        out.append(_build_npc(tables, f"{name_prefix}_{npc_seed:016x}", _Rolls(npc_seed)))
+    return out
+
+
+_WORKER_TABLES: NpcTables | None = None
+
+
+def _init_worker(tables: NpcTables) -> None:
+    global _WORKER_TABLES
+    _WORKER_TABLES = tables
+
+
+def _worker_range(args: Tuple[int, int, int, str]) -> List[Character]:
+    assert _WORKER_TABLES is not None
+    return _generate_range(_WORKER_TABLES, *args)
+
+
+def generate_npcs(
+    n: int,
+    tables: NpcTables | None = None,
+    name_prefix: str = "NPC",
+    seed: int | None = None,
+    workers: int = 1,
+    chunk_size: int = 256,
+) -> Iterator[Character]:
+    """
+    Stream `n` NPCs. Tables are loaded once (NpcTables.from_data() by default); NPC i draws
+    from its own random.Random(derive_seed(seed, i)) and is named after that seed, so the
+    output for a given seed is identical for any number of workers. seed=None picks a random
+    base seed. workers > 1 spreads chunks of `chunk_size` NPCs over a process pool (results
+    still arrive in order).
+    """
+    tables = tables if tables is not None else NpcTables.from_data()
+    if not tables.class_catalog:
+        raise ValueError("Class catalog is empty, cannot generate NPC.")
+    base_seed = seed if seed is not None else random.SystemRandom().getrandbits(63)
+    step = max(1, int(chunk_size))
+    ranges = [(s, min(s + step, n), base_seed, name_prefix) for s in range(0, n, step)]
+    if workers <= 1 or len(ranges) <= 1:
+        for start, stop, _, _ in ranges:
+            yield from _generate_range(tables, start, stop, base_seed, name_prefix)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(tables,)
+    ) as pool:
+        for chunk in pool.map(_worker_range, ranges):
+            yield from chunk
@@ -0,0 +1,236 @@
+# character_creation/models/npc_population.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List
+
+from character_creation.models import factory
+from character_creation.models.character import Character
+from character_creation.models.npc_factory import NpcTables, derive_seed
+from character_creation.services import formula_eval
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+STAT_PREFIX = "stat:"
+APPEARANCE_PREFIX = "app:"
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError(
+            "numpy is required for population generation "
+            "(pip install character_creation[population])."
+        )
+
+
+def trait_words(n_traits: int) -> int:
+    """Number of uint64 words in a trait bitset over `n_traits` traits."""
+    return max(1, (n_traits + 63) // 64)
+
+
+def pack_bits(mask: Any) -> Any:
+    """(rows, n_traits) bool matrix -> (rows, words) uint64 bitsets; bit j = trait code j."""
+    rows, n = mask.shape
+    out = np.zeros((rows, trait_words(n)), dtype=np.uint64)
+    for j in range(n):
+        out[:, j // 64] |= mask[:, j].astype(np.uint64) << np.uint64(j % 64)
+    return out
+
+
+def unpack_bits(words: Any, n_traits: int) -> List[int]:
+    """Trait codes set in one row's bitset words."""
+    return [j for j in range(n_traits) if int(words[j // 64]) >> (j % 64) & 1]
+
+
+@dataclass
+class Population:
+    """
+    NPCs as columns, one row per NPC (same layout idea as combat's EventColumns):
+
+    - ``stat:<name>`` float32 stat values (template initial + bumps + class/trait grants)
+    - ``class`` int16 code into ``dictionaries["class"]``
+    - ``traits`` (rows, words) uint64 bitset; bit j = ``dictionaries["trait"][j]``
+    - ``level`` int16, ``hp`` / ``mana`` / ``xp_to_next`` int32 from formulas.yaml
+    - ``app:<field>`` int16 code into ``dictionaries[<field>]`` for enum fields, float32
+      for ranged ones; fields with a fixed value are in ``constants``
+
+    ``trait_order`` keeps the order traits were picked in (-1 padded), because Character
+    stores traits as an ordered list. Characters are only built by character()/characters().
+    """
+
+    tables: NpcTables
+    seed: int
+    cols: Dict[str, Any]
+    dictionaries: Dict[str, List[Any]]
+    constants: Dict[str, Any] = field(default_factory=dict)
+    trait_order: Any = None
+    name_prefix: str = "NPC"
+
+    def __len__(self) -> int:
+        return int(len(self.cols["class"]))
+
+    @property
+    def stat_names(self) -> List[str]:
+        return [k[len(STAT_PREFIX) :] for k in self.cols if k.startswith(STAT_PREFIX)]
+
+    def name(self, row: int) -> str:
+        return f"{self.name_prefix}_{derive_seed(self.seed, row):016x}"
+
+    def traits(self, row: int) -> List[str]:
+        ids = self.dictionaries["trait"]
+        return [ids[c] for c in self.trait_order[row].tolist() if c >= 0]
+
+    def appearance(self, row: int) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for field_name in self.tables.appearance_fields:
+            col = self.cols.get(APPEARANCE_PREFIX + field_name)
+            if col is None:
+                out[field_name] = self.constants.get(field_name)
+            elif field_name in self.dictionaries:
+                out[field_name] = self.dictionaries[field_name][int(col[row])]
+            else:
+                out[field_name] = round(float(col[row]), 4)
+        return out
+
+    def character(self, row: int) -> Character:
+        """
+        Build the Character for one row, in the state generate_npc leaves an NPC in. Stats and
+        ranged appearance values come back from float32 columns, rounded to 4 decimals.
+        """
+        t = self.tables
+        hero = factory.create_new_character(
+            name=self.name(row),
+            stat_tmpl=t.stat_tmpl,
+            slot_tmpl=t.slot_tmpl,
+            appearance_fields=t.appearance_fields,
+            appearance_defaults=t.appearance_defaults,
+            resources=t.resources,
+        )
+        for stat in self.stat_names:
+            hero.stats[stat] = round(float(self.cols[STAT_PREFIX + stat][row]), 4)
+        class_def = t.class_catalog[int(self.cols["class"][row])]
+        hero.classes.append(class_def.get("id"))
+        hero.abilities.update(class_def.get("grants_abilities", class_def.get("abilities", [])))
+        for trait_id in self.traits(row):
+            hero.traits.append(trait_id)
+            trait_def = t.trait_catalog.get("traits", {}).get(trait_id, {})
+            abilities = trait_def.get("grants_abilities", trait_def.get("abilities", []))
+            hero.abilities.update(abilities or [])
+        hero.appearance.update(self.appearance(row))
+        hero.level = int(self.cols["level"][row])
+        hp, mana = int(self.cols["hp"][row]), int(self.cols["mana"][row])
+        hero.stats.set_pool("HP", hp, hp)
+        hero.stats.set_pool("Mana", mana, mana)
+        return hero
+
+    def characters(self, rows: Iterable[int] | None = None) -> Iterator[Character]:
+        for row in range(len(self)) if rows is None else rows:
+            yield self.character(int(row))
+
+
+def generate_population(
+    n: int,
+    tables: NpcTables | None = None,
+    seed: int | None = None,
+    name_prefix: str = "NPC",
+) -> Population:
+    """
+    Draw `n` NPCs at once with NumPy: stat bumps, class picks, trait subsets and appearance
+    rolls are whole arrays, and HP/mana/xp_to_next are formulas.yaml evaluated over columns.
+    Same distributions as generate_npc (not the same draws). Requires numpy.
+    """
+    _require_numpy()
+    tables = tables if tables is not None else NpcTables.from_data()
+    if not tables.class_catalog:
+        raise ValueError("Class catalog is empty, cannot generate NPC.")
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy) & (2**63 - 1)
+    rng = np.random.default_rng(seed)
+    n = int(n)
+
+    # 1) stats: template initial + 0..3 bumps of 0.1
+    stats: Dict[str, Any] = {}
+    for stat, spec in tables.stat_tmpl.items():
+        stats[stat] = spec["initial"] + rng.integers(0, 4, size=n) * 0.1
+
+    # 2) class
+    class_code = rng.integers(0, len(tables.class_catalog), size=n).astype(np.int16)
+    for code, class_def in enumerate(tables.class_catalog):
+        rows = class_code == code
+        for stat, val in class_def.get("grants_stats", {}).items():
+            stats.setdefault(stat, np.zeros(n))[rows] += val
+
+    # 3) traits: 0..min(T, 2) distinct traits, in the order they were picked
+    trait_ids = list(tables.trait_catalog.get("traits", {}).keys())
+    n_traits = len(trait_ids)
+    count = rng.integers(0, min(n_traits, 2) + 1, size=n)
+    order = np.argsort(rng.random((n, n_traits)), axis=1)[:, : min(n_traits, 2)]
+    trait_order = np.where(np.arange(order.shape[1]) < count[:, None], order, -1)
+    trait_order = trait_order.astype(np.int16)
+    mask = np.zeros((n, n_traits), dtype=bool)
+    for slot in range(trait_order.shape[1]):
+        picked = trait_order[:, slot] >= 0
+        mask[picked, trait_order[picked, slot]] = True
+    for code, trait_id in enumerate(trait_ids):
+        trait_def = tables.trait_catalog["traits"][trait_id] or {}
+        for stat, val in trait_def.get("grants_stats", {}).items():
+            try:
+                stats.setdefault(stat, np.zeros(n))[mask[:, code]] += float(val)
+            except (TypeError, ValueError):
+                continue
+
+    # 4) derived values, evaluated over whole columns
+    level = np.ones(n, dtype=np.int16)
+    ctx: Dict[str, Any] = dict(stats)
+    ctx["level"] = level.astype(np.float64)
+    baseline = tables.formulas["baseline"]
+    cols: Dict[str, Any] = {STAT_PREFIX + k: v.astype(np.float32) for k, v in stats.items()}
+    cols["class"] = class_code
+    cols["traits"] = pack_bits(mask)
+    cols["level"] = level
+    for key in ("hp", "mana", "xp_to_next"):
+        value = formula_eval.evaluate_columns(baseline[key], ctx)
+        cols[key] = np.broadcast_to(value, (n,)).astype(np.int32)
+
+    # 5) appearance
+    dictionaries: Dict[str, List[Any]] = {
+        "class": [c.get("id") for c in tables.class_catalog],
+        "trait": trait_ids,
+    }
+    constants: Dict[str, Any] = {}
+    for field_name, roll in tables.appearance_rolls:
+        kind = roll[0]
+        key = APPEARANCE_PREFIX + field_name
+        if kind == "enum":
+            dictionaries[field_name] = list(roll[1])
+            cols[key] = rng.integers(0, len(roll[1]), size=n).astype(np.int16)
+        elif kind == "normal":
+            values = rng.normal(roll[1], roll[2], size=n)
+            lo = -np.inf if roll[3] is None else roll[3]
+            hi = np.inf if roll[4] is None else roll[4]
+            cols[key] = np.clip(values, lo, hi).astype(np.float32)
+        elif kind == "uniform":
+            cols[key] = rng.uniform(roll[1], roll[2], size=n).astype(np.float32)
+        elif kind == "unit":
+            cols[key] = rng.uniform(0.0, 1.0, size=n).astype(np.float32)
+        elif kind == "value":
+            constants[field_name] = roll[1]
+        else:
+            value = tables.appearance_defaults.get(field_name)
+            constants[field_name] = value if value is not None else roll[1]
+
+    return Population(
+        tables=tables,
+        seed=int(seed),
+        cols=cols,
+        dictionaries=dictionaries,
+        constants=constants,
+        trait_order=trait_order,
+        name_prefix=name_prefix,
+    )
@@ -0,0 +1,526 @@
+# character_creation/models/population_store.py
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+import json
+import numbers
+import os
+
+from character_creation.models.character import Character
+from character_creation.models.npc_factory import derive_seed
+from character_creation.models.npc_population import (
+    APPEARANCE_PREFIX,
+    NUMPY_AVAILABLE,
+    STAT_PREFIX,
+    Population,
+    trait_words,
+)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+STORE_FORMAT = 1
+MANIFEST = "store.json"
+# columns with a secondary index (sorted row order + sorted keys)
+INDEXED = ("race", "class", "level", "location")
+# code column -> dictionary it indexes into
+CODE_COLUMNS = {"race": "race", "class": "class", "location": "location"}
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError(
+            "numpy is required for PopulationStore (pip install character_creation[population])."
+        )
+
+
+def _column_file(name: str) -> str:
+    return name.replace(":", "-") + ".npy"
+
+
+def _bitset_rows(bits: Any, code: int) -> Any:
+    """Bool column: which rows have bit `code` set in a (rows, words) uint64 bitset."""
+    word = bits[:, code // 64]
+    return ((word >> np.uint64(code % 64)) & np.uint64(1)).astype(bool)
+
+
+def _rows(rows: Iterable[int] | Any) -> Any:
+    return np.asarray(rows if hasattr(rows, "__array__") else list(rows), dtype=np.int64)
+
+
+def _bits_of(words: Any, dictionary: List[Any]) -> List[Any]:
+    out = []
+    for j, value in enumerate(dictionary):
+        if int(words[j // 64]) >> (j % 64) & 1:
+            out.append(value)
+    return out
+
+
+def _pool_values(character: Character, stat: str, cur: str, top: str) -> Tuple[float, float]:
+    # generate_npc keeps HP/Mana as stat pools; other paths only set the attributes
+    stats = character.stats
+    if stats.is_pool(stat):
+        return stats.value(stat), stats.base_value(stat)
+    return float(getattr(character, cur)), float(getattr(character, top) or getattr(character, cur))
+
+
+class CharacterView:
+    """
+    Lazy, row-backed view of one NPC in a PopulationStore. Attributes are read from the
+    columns on access; level and location write through. to_character() builds a Character.
+    """
+
+    __slots__ = ("store", "row")
+
+    def __init__(self, store: "PopulationStore", row: int):
+        self.store = store
+        self.row = row
+
+    def __repr__(self) -> str:
+        return f"CharacterView(row={self.row}, name={self.name!r})"
+
+    @property
+    def name(self) -> str:
+        return self.store.name(self.row)
+
+    @property
+    def level(self) -> int:
+        return int(self.store.cols["level"][self.row])
+
+    @level.setter
+    def level(self, value: int) -> None:
+        self.store.set_level([self.row], value)
+
+    @property
+    def location(self) -> str | None:
+        return self.store.decode("location", self.row)
+
+    @location.setter
+    def location(self, value: str | None) -> None:
+        self.store.move([self.row], value)
+
+    @property
+    def race(self) -> str | None:
+        return self.store.decode("race", self.row)
+
+    @property
+    def classes(self) -> List[str]:
+        cls = self.store.decode("class", self.row)
+        return [cls] if cls is not None else []
+
+    @property
+    def traits(self) -> List[str]:
+        return _bits_of(self.store.cols["traits"][self.row], self.store.dictionaries["trait"])
+
+    @property
+    def abilities(self) -> set[str]:
+        words = self.store.cols["abilities"][self.row]
+        return set(_bits_of(words, self.store.dictionaries["ability"]))
+
+    def stat(self, name: str) -> float:
+        return float(self.store.cols[STAT_PREFIX + name][self.row])
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {s: round(self.stat(s), 4) for s in self.store.stat_names}
+
+    @property
+    def hp(self) -> float:
+        return float(self.store.cols["hp"][self.row])
+
+    @property
+    def mana(self) -> float:
+        return float(self.store.cols["mana"][self.row])
+
+    @property
+    def appearance(self) -> Dict[str, Any]:
+        return self.store.appearance(self.row)
+
+    def to_character(self) -> Character:
+        cols, row = self.store.cols, self.row
+        hp, hp_max = float(cols["hp"][row]), float(cols["hp_max"][row])
+        mana, mana_max = float(cols["mana"][row]), float(cols["mana_max"][row])
+        stats: Dict[str, Any] = dict(self.stats)
+        stats["HP"] = {"base": hp_max, "current": hp}
+        stats["Mana"] = {"base": mana_max, "current": mana}
+        return Character(
+            name=self.name,
+            stats=stats,
+            stat_xp={s: 0.0 for s in self.store.stat_names},
+            classes=self.classes,
+            abilities=self.abilities,
+            traits=self.traits,
+            race=self.race,
+            hp=hp,
+            mana=mana,
+            hp_max=hp_max,
+            mana_max=mana_max,
+            level=self.level,
+            xp_total=float(cols["xp_total"][row]),
+            appearance=self.appearance,
+        )
+
+
+class PopulationStore:
+    """
+    NPCs as struct-of-arrays for populations too large for Character objects:
+
+    - ``stat:<name>``, ``hp``/``hp_max``/``mana``/``mana_max``, ``xp_total`` float32
+    - ``race``/``class`` int16 and ``location`` int32 codes into ``dictionaries`` (-1 = none)
+    - ``level`` int16
+    - ``traits``/``abilities`` (rows, words) uint64 bitsets over ``dictionaries["trait"]``
+      and ``dictionaries["ability"]``
+    - ``app:<field>`` int16 codes (enum-like fields) or float32 (numeric fields)
+    - names packed as UTF-8 into ``name_bytes`` with ``name_offsets``, or, for generated
+      populations, derived from ``names`` = (prefix, base seed) like generate_npcs names
+
+    race, class, level and location have secondary indexes, built lazily and dropped when a
+    column changes. save() writes one .npy per column; open() memory-maps them.
+    Requires numpy.
+    """
+
+    def __init__(
+        self,
+        cols: Dict[str, Any],
+        dictionaries: Dict[str, List[Any]],
+        constants: Dict[str, Any] | None = None,
+        names: Tuple[str, int] | None = None,
+    ):
+        _require_numpy()
+        self.cols = cols
+        self.dictionaries = dictionaries
+        self.constants = dict(constants or {})
+        # (prefix, base seed) when names are derived like generate_npcs names, else packed
+        self.names = tuple(names) if names else None
+        self._codes = {d: {v: i for i, v in enumerate(vals)} for d, vals in dictionaries.items()}
+        self._indexes: Dict[str, Tuple[Any, Any]] = {}
+        # directory of a store opened with mode="r+", and whether its store.json is behind
+        self._root: Path | None = None
+        self._manifest_stale = False
+
+    def __len__(self) -> int:
+        return int(len(self.cols["level"]))
+
+    # --- building -------------------------------------------------------------------------
+
+    def code(self, dictionary: str, value: Any) -> int:
+        """Code of a string in a dictionary, interning it if new (None -> -1)."""
+        if value is None:
+            return -1
+        codes = self._codes.setdefault(dictionary, {})
+        c = codes.get(value)
+        if c is None:
+            c = codes[value] = len(self.dictionaries.setdefault(dictionary, []))
+            self.dictionaries[dictionary].append(value)
+            self._manifest_stale = True
+        return c
+
+    @classmethod
+    def from_population(
+        cls, pop: Population, location: str | Sequence[str | None] | None = None
+    ) -> "PopulationStore":
+        """Take over a generated Population's columns (no per-row Python objects)."""
+        _require_numpy()
+        n = len(pop)
+        tables = pop.tables
+        dictionaries: Dict[str, List[Any]] = {
+            "race": [],
+            "class": list(pop.dictionaries["class"]),
+            "location": [],
+            "trait": list(pop.dictionaries["trait"]),
+            "ability": [],
+        }
+        cols: Dict[str, Any] = {k: v for k, v in pop.cols.items() if k.startswith(STAT_PREFIX)}
+        for k in ("hp", "mana"):
+            cols[k] = pop.cols[k].astype(np.float32)
+            cols[f"{k}_max"] = cols[k].copy()
+        cols["xp_total"] = np.zeros(n, dtype=np.float32)
+        cols["level"] = pop.cols["level"].astype(np.int16)
+        cols["race"] = np.full(n, -1, dtype=np.int16)
+        cols["class"] = pop.cols["class"].astype(np.int16)
+        cols["traits"] = pop.cols["traits"]
+        for k, v in pop.cols.items():
+            if k.startswith(APPEARANCE_PREFIX):
+                cols[k] = v
+        for field_name, values in pop.dictionaries.items():
+            if field_name not in ("class", "trait"):
+                dictionaries[APPEARANCE_PREFIX + field_name] = list(values)
+        store = cls(cols, dictionaries, pop.constants, names=(pop.name_prefix, pop.seed))
+
+        # abilities: class grants per class code, OR-ed with the grants of each set trait
+        def grant_bits(defs: List[Dict[str, Any]]) -> Any:
+            rows = []
+            for d in defs:
+                ids = [store.code("ability", a) for a in d.get("grants_abilities", []) or []]
+                rows.append(ids)
+            bits = np.zeros((len(defs), trait_words(len(dictionaries["ability"]))), np.uint64)
+            for i, ids in enumerate(rows):
+                for a in ids:
+                    bits[i, a // 64] |= np.uint64(1) << np.uint64(a % 64)
+            return bits
+
+        trait_defs = [
+            tables.trait_catalog.get("traits", {}).get(t) or {} for t in pop.dictionaries["trait"]
+        ]
+        class_bits = grant_bits(list(tables.class_catalog))
+        trait_bits = grant_bits(trait_defs)
+        width = trait_words(len(dictionaries["ability"]))
+        class_bits = np.pad(class_bits, ((0, 0), (0, width - class_bits.shape[1])))
+        trait_bits = np.pad(trait_bits, ((0, 0), (0, width - trait_bits.shape[1])))
+        abilities = class_bits[cols["class"]]
+        for j in range(len(dictionaries["trait"])):
+            abilities[_bitset_rows(cols["traits"], j)] |= trait_bits[j]
+        cols["abilities"] = abilities
+
+        store.cols["location"] = store._location_codes(location, n)
+        return store
+
+    @classmethod
+    def from_characters(
+        cls,
+        characters: Iterable[Character],
+        locations: str | Sequence[str | None] | None = None,
+    ) -> "PopulationStore":
+        """Column-ize existing Character objects (one Python pass)."""
+        _require_numpy()
+        chars = list(characters)
+        n = len(chars)
+        store = cls({}, {"race": [], "class": [], "location": [], "trait": [], "ability": []})
+        stat_names: List[str] = []
+        app_fields: List[str] = []
+        for c in chars:
+            for k in c.stats:
+                if not c.stats.is_pool(k) and k not in stat_names:
+                    stat_names.append(k)
+            for k in c.appearance:
+                if k not in app_fields:
+                    app_fields.append(k)
+        cols = store.cols
+        for s in stat_names:
+            cols[STAT_PREFIX + s] = np.array([c.stats.value(s) for c in chars], dtype=np.float32)
+        hp = [_pool_values(c, "HP", "hp", "hp_max") for c in chars]
+        mana = [_pool_values(c, "Mana", "mana", "mana_max") for c in chars]
+        cols["hp"] = np.array([h[0] for h in hp], dtype=np.float32)
+        cols["hp_max"] = np.array([h[1] for h in hp], dtype=np.float32)
+        cols["mana"] = np.array([m[0] for m in mana], dtype=np.float32)
+        cols["mana_max"] = np.array([m[1] for m in mana], dtype=np.float32)
+        cols["xp_total"] = np.array([c.xp_total for c in chars], dtype=np.float32)
+        cols["level"] = np.array([c.level for c in chars], dtype=np.int16)
+        cols["race"] = np.array([store.code("race", c.race) for c in chars], dtype=np.int16)
+        cols["class"] = np.array(
+            [store.code("class", c.classes[0] if c.classes else None) for c in chars],
+            dtype=np.int16,
+        )
+        trait_codes = [[store.code("trait", t) for t in c.traits] for c in chars]
+        ability_codes = [[store.code("ability", a) for a in sorted(c.abilities)] for c in chars]
+        for name, per_row in (("traits", trait_codes), ("abilities", ability_codes)):
+            words = trait_words(len(store.dictionaries["trait" if name == "traits" else "ability"]))
+            bits = np.zeros((n, words), dtype=np.uint64)
+            for i, codes in enumerate(per_row):
+                for j in codes:
+                    bits[i, j // 64] |= np.uint64(1) << np.uint64(j % 64)
+            cols[name] = bits
+        for f in app_fields:
+            values = [c.appearance.get(f) for c in chars]
+            key = APPEARANCE_PREFIX + f
+            numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+            if numeric and values:
+                cols[key] = np.array(values, dtype=np.float32)
+            else:
+                cols[key] = np.array([store.code(key, v) for v in values], dtype=np.int16)
+                store.dictionaries.setdefault(key, [])
+        store._set_names([c.name.encode("utf-8") for c in chars])
+        cols["location"] = store._location_codes(locations, n)
+        return store
+
+    def _set_names(self, encoded: List[bytes]) -> None:
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        self.cols["name_offsets"] = offsets
+        self.cols["name_bytes"] = np.frombuffer(b"".join(encoded), dtype=np.uint8).copy()
+
+    def _location_codes(self, location: str | Sequence[str | None] | None, n: int) -> Any:
+        if location is None or isinstance(location, str):
+            return np.full(n, self.code("location", location), dtype=np.int32)
+        if len(location) != n:
+            raise ValueError(f"expected {n} locations, got {len(location)}")
+        return np.array([self.code("location", loc) for loc in location], dtype=np.int32)
+
+    # --- reading --------------------------------------------------------------------------
+
+    @property
+    def stat_names(self) -> List[str]:
+        return [k[len(STAT_PREFIX) :] for k in self.cols if k.startswith(STAT_PREFIX)]
+
+    def name(self, row: int) -> str:
+        if self.names is not None:
+            return f"{self.names[0]}_{derive_seed(self.names[1], row):016x}"
+        o = self.cols["name_offsets"]
+        return bytes(self.cols["name_bytes"][o[row] : o[row + 1]]).decode("utf-8")
+
+    def decode(self, column: str, row: int) -> Any:
+        code = int(self.cols[column][row])
+        return self.dictionaries[CODE_COLUMNS.get(column, column)][code] if code >= 0 else None
+
+    def appearance(self, row: int) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for key, col in self.cols.items():
+            if not key.startswith(APPEARANCE_PREFIX):
+                continue
+            if key in self.dictionaries:
+                out[key[len(APPEARANCE_PREFIX) :]] = self.decode(key, row)
+            else:
+                out[key[len(APPEARANCE_PREFIX) :]] = round(float(col[row]), 4)
+        out.update(self.constants)
+        return out
+
+    def view(self, row: int) -> CharacterView:
+        if not 0 <= row < len(self):
+            raise IndexError(f"row {row} out of range")
+        return CharacterView(self, int(row))
+
+    def views(self, rows: Iterable[int] | None = None) -> Iterator[CharacterView]:
+        for row in range(len(self)) if rows is None else rows:
+            yield CharacterView(self, int(row))
+
+    # --- indexes and queries --------------------------------------------------------------
+
+    def index(self, column: str) -> Tuple[Any, Any]:
+        """(row order sorted by the column, the column's values in that order), cached."""
+        idx = self._indexes.get(column)
+        if idx is None:
+            col = np.asarray(self.cols[column])
+            order = np.argsort(col, kind="stable")
+            idx = self._indexes[column] = (order, col[order])
+        return idx
+
+    def _lookup(self, column: str, lo: Any, hi: Any) -> Any:
+        order, keys = self.index(column)
+        start = np.searchsorted(keys, lo, side="left")
+        stop = np.searchsorted(keys, hi, side="right")
+        return order[start:stop]
+
+    def _codes_for(self, column: str, value: Any) -> List[int]:
+        values = [value] if value is None or isinstance(value, str) else list(value)
+        codes = self._codes.get(CODE_COLUMNS[column], {})
+        return [-1 if v is None else codes[v] for v in values if v is None or v in codes]
+
+    def query(
+        self,
+        race: str | Sequence[str] | None = None,
+        class_id: str | Sequence[str] | None = None,
+        level: int | Tuple[int, int] | None = None,
+        location: str | Sequence[str] | None = None,
+        traits: Iterable[str] = (),
+    ) -> Any:
+        """
+        Sorted row numbers matching every given filter: race / class_id / location are an id
+        or a list of ids (any of), level is an int or an inclusive (lo, hi) range, traits must
+        all be present. The most selective indexed filter picks the candidate rows; the
+        others are checked against the columns of just those rows.
+        """
+        filters: List[Tuple[str, List[Tuple[Any, Any]]]] = []
+        for column, value in (("race", race), ("class", class_id), ("location", location)):
+            if value is not None:
+                filters.append((column, [(c, c) for c in self._codes_for(column, value)]))
+        if level is not None:
+            lo, hi = (level, level) if isinstance(level, numbers.Integral) else level
+            filters.append(("level", [(lo, hi)]))
+
+        candidates = None
+        if filters:
+            sized = []
+            for column, ranges in filters:
+                order, keys = self.index(column)
+                count = sum(
+                    int(np.searchsorted(keys, hi, "right") - np.searchsorted(keys, lo, "left"))
+                    for lo, hi in ranges
+                )
+                sized.append((count, column, ranges))
+            sized.sort(key=lambda s: s[0])
+            _, column, ranges = sized[0]
+            parts = [self._lookup(column, lo, hi) for lo, hi in ranges]
+            candidates = np.sort(np.concatenate(parts)) if parts else np.empty(0, np.int64)
+            for _, column, ranges in sized[1:]:
+                values = np.asarray(self.cols[column])[candidates]
+                keep = np.zeros(len(candidates), dtype=bool)
+                for lo, hi in ranges:
+                    keep |= (values >= lo) & (values <= hi)
+                candidates = candidates[keep]
+        if candidates is None:
+            candidates = np.arange(len(self))
+        for trait in traits:
+            code = self._codes.get("trait", {}).get(trait)
+            if code is None:
+                return np.empty(0, dtype=np.int64)
+            candidates = candidates[_bitset_rows(self.cols["traits"][candidates], code)]
+        return candidates
+
+    # --- updates --------------------------------------------------------------------------
+
+    def move(self, rows: Iterable[int] | Any, location: str | None) -> None:
+        """Set the location of some rows (drops the location index)."""
+        self.cols["location"][_rows(rows)] = self.code("location", location)
+        self._indexes.pop("location", None)
+
+    def set_level(self, rows: Iterable[int] | Any, level: int) -> None:
+        """Set the level of some rows (drops the level index)."""
+        self.cols["level"][_rows(rows)] = level
+        self._indexes.pop("level", None)
+
+    # --- persistence ----------------------------------------------------------------------
+
+    def save(self, path: str | Path) -> Path:
+        """Write one .npy per column plus store.json (written last) under directory `path`."""
+        root = Path(path)
+        root.mkdir(parents=True, exist_ok=True)
+        for name, col in self.cols.items():
+            np.save(root / _column_file(name), np.asarray(col))
+        self._write_manifest(root)
+        return root
+
+    def _write_manifest(self, root: Path) -> None:
+        doc = {
+            "format": STORE_FORMAT,
+            "rows": len(self),
+            "columns": {name: _column_file(name) for name in self.cols},
+            "dictionaries": self.dictionaries,
+            "constants": self.constants,
+            "names": self.names,
+        }
+        tmp = root / (MANIFEST + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(doc, indent=1), encoding="utf-8")
+        os.replace(tmp, root / MANIFEST)
+
+    def flush(self) -> None:
+        """
+        Push in-place edits of a store opened with mode="r+" to disk. Values interned since
+        opening (e.g. move() to a new location) are written to store.json first; dictionaries
+        only grow, so the old columns stay valid against the new manifest.
+        """
+        if self._root is not None and self._manifest_stale:
+            self._write_manifest(self._root)
+            self._manifest_stale = False
+        for col in self.cols.values():
+            if hasattr(col, "flush"):
+                col.flush()
+
+    @classmethod
+    def open(cls, path: str | Path, mode: str = "r") -> "PopulationStore":
+        """
+        Memory-map a saved store: "r" read-only, "r+" edits go to the files (see flush()),
+        "c" copy-on-write. Columns are paged in on access, so opening is O(columns).
+        """
+        _require_numpy()
+        root = Path(path)
+        doc = json.loads((root / MANIFEST).read_text(encoding="utf-8"))
+        if doc.get("format") != STORE_FORMAT:
+            raise ValueError(f"unsupported population store format: {doc.get('format')!r}")
+        cols = {name: np.load(root / f, mmap_mode=mode) for name, f in doc["columns"].items()}
+        store = cls(cols, doc["dictionaries"], doc.get("constants"), doc.get("names"))
+        if mode == "r+":
+            store._root = root
+        return store
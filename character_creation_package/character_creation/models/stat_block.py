@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, Tuple
+import threading
+
+# stat name tuple -> layout; every block with the same stats shares one layout
+_layouts: Dict[Tuple[str, ...], "StatLayout"] = {}
+_layouts_lock = threading.Lock()
+
+
+class StatLayout:
+    """A fixed stat order (normally stats.yaml's) and name -> slot lookup, shared and immutable."""
+
+    __slots__ = ("names", "index")
+
+    def __init__(self, names: Tuple[str, ...]):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+
+    @classmethod
+    def of(cls, names: Any) -> "StatLayout":
+        key = tuple(names)
+        layout = _layouts.get(key)
+        if layout is None:
+            with _layouts_lock:
+                layout = _layouts.setdefault(key, cls(key))
+        return layout
+
+    def __reduce__(self) -> Any:
+        return (StatLayout.of, (self.names,))
+
+    def __repr__(self) -> str:
+        return f"StatLayout({list(self.names)!r})"
+
+
+class PoolView(MutableMapping):
+    """{"base", "current"} view of one pooled stat (HP/Mana); writes go to the block."""
+
+    __slots__ = ("block", "slot")
+
+    def __init__(self, block: "StatBlock", slot: int):
+        self.block = block
+        self.slot = slot
+
+    def __getitem__(self, key: str) -> float:
+        if key == "base":
+            return self.block.base[self.slot]
+        if key == "current":
+            return self.block.current[self.slot]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: float) -> None:
+        if key == "base":
+            self.block.base[self.slot] = float(value)
+        elif key == "current":
+            self.block.current[self.slot] = float(value)
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("pool entries always have base and current")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(("base", "current"))
+
+    def __len__(self) -> int:
+        return 2
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class StatBlock(MutableMapping):
+    """
+    A character's stats as two float arrays (base, current) in a shared StatLayout order.
+
+    As a mapping it behaves like the old stats dict: plain stats read and write as floats
+    (base == current), pooled stats (HP/Mana, or anything assigned a {"base", "current"}
+    mapping) as a PoolView. Code that needs numbers uses value()/base_value()/add() and
+    context() instead of inspecting entry types. Unknown names extend the layout.
+    """
+
+    __slots__ = ("layout", "base", "current", "pools")
+
+    def __init__(self, values: Mapping[str, Any] | None = None, layout: StatLayout | None = None):
+        self.layout = layout if layout is not None else StatLayout.of(values or ())
+        n = len(self.layout.names)
+        self.base = array("d", bytes(8 * n))
+        self.current = array("d", bytes(8 * n))
+        self.pools = 0  # bit i set -> slot i is a pool
+        for name, value in (values or {}).items():
+            self[name] = value
+
+    @classmethod
+    def from_template(cls, stat_tmpl: Mapping[str, Mapping[str, Any]]) -> "StatBlock":
+        """Block in stats.yaml order with each stat at its `initial` value."""
+        block = cls(layout=StatLayout.of(stat_tmpl))
+        for i, spec in enumerate(stat_tmpl.values()):
+            block.base[i] = block.current[i] = float(spec["initial"])
+        return block
+
+    @classmethod
+    def coerce(cls, stats: Any) -> "StatBlock":
+        return stats if isinstance(stats, StatBlock) else cls(stats)
+
+    def _slot(self, name: str) -> int:
+        i = self.layout.index.get(name)
+        if i is None:
+            self.layout = StatLayout.of(self.layout.names + (name,))
+            self.base.append(0.0)
+            self.current.append(0.0)
+            i = len(self.base) - 1
+        return i
+
+    # --- numeric access ------------------------------------------------------------------
+
+    def value(self, name: str, default: float = 0.0) -> float:
+        """Current value of a stat (pools included), or `default` if absent."""
+        i = self.layout.index.get(name)
+        return self.current[i] if i is not None else default
+
+    def base_value(self, name: str, default: float = 0.0) -> float:
+        i = self.layout.index.get(name)
+        return self.base[i] if i is not None else default
+
+    def is_pool(self, name: str) -> bool:
+        i = self.layout.index.get(name)
+        return i is not None and bool(self.pools >> i & 1)
+
+    def add(self, name: str, delta: float) -> None:
+        """Add to base and current (a missing stat starts at 0)."""
+        i = self._slot(name)
+        self.base[i] += delta
+        self.current[i] += delta
+
+    def set_pool(self, name: str, base: float, current: float) -> None:
+        i = self._slot(name)
+        self.base[i] = float(base)
+        self.current[i] = float(current)
+        self.pools |= 1 << i
+
+    def context(self) -> Dict[str, float]:
+        """{name: current} for formula evaluation."""
+        return dict(zip(self.layout.names, self.current))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data copy (floats, {"base", "current"} dicts for pools) for saves and UIs."""
+        out: Dict[str, Any] = {}
+        for i, name in enumerate(self.layout.names):
+            if self.pools >> i & 1:
+                out[name] = {"base": self.base[i], "current": self.current[i]}
+            else:
+                out[name] = self.current[i]
+        return out
+
+    def copy(self) -> "StatBlock":
+        block = StatBlock(layout=self.layout)
+        block.base = array("d", self.base)
+        block.current = array("d", self.current)
+        block.pools = self.pools
+        return block
+
+    # --- mapping protocol ----------------------------------------------------------------
+
+    def __getitem__(self, name: str) -> Any:
+        i = self.layout.index[name]
+        if self.pools >> i & 1:
+            return PoolView(self, i)
+        return self.current[i]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        if isinstance(value, Mapping):
+            base = float(value.get("base", value.get("current", 0.0)))
+            self.set_pool(name, base, float(value.get("current", base)))
+        elif hasattr(value, "base") and hasattr(value, "current"):
+            self.set_pool(name, value.base, value.current)
+        else:
+            i = self._slot(name)
+            self.base[i] = self.current[i] = float(value)
+            self.pools &= ~(1 << i)
+
+    def __delitem__(self, name: str) -> None:
+        values = self.to_dict()
+        del values[name]
+        fresh = StatBlock(values)
+        self.layout, self.base, self.current, self.pools = (
+            fresh.layout,
+            fresh.base,
+            fresh.current,
+            fresh.pools,
+        )
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.layout.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.layout.names)
+
+    def __len__(self) -> int:
+        return len(self.layout.names)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StatBlock):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"StatBlock({self.to_dict()!r})"
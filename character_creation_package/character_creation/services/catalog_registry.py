@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+import os
+import threading
+
+import yaml
+
+from ..loaders import (
+    stats_loader,
+    slots_loader,
+    appearance_loader,
+    resources_loader,
+    resources_config_loader,
+    progression_loader,
+    classes_loader,
+    traits_loader,
+    items_loader,
+    races_loader,
+    difficulty_loader,
+    status_effects_loader,
+    content_packs_loader,
+    yaml_utils,
+)
+
+DEFAULT_DATA_ROOT = Path(__file__).parents[1] / "data"
+
+
+class FrozenDict(dict):
+    """A dict that refuses in-place changes. dict(x) / x.copy() give a mutable copy."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("catalogs from CatalogRegistry are read-only; copy before modifying")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> Any:
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """A list that refuses in-place changes. list(x) / x.copy() give a mutable copy."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("catalogs from CatalogRegistry are read-only; copy before modifying")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __reduce__(self) -> Any:
+        return (FrozenList, (list(self),))
+
+
+# frozen catalogs still serialize like the plain YAML they came from, with either dumper
+# (save_loader prefers the libyaml CSafeDumper when it is available)
+for _dumper in {yaml.SafeDumper, getattr(yaml, "CSafeDumper", yaml.SafeDumper)}:
+    _dumper.add_representer(FrozenDict, yaml.SafeDumper.represent_dict)
+    _dumper.add_representer(FrozenList, yaml.SafeDumper.represent_list)
+
+
+def freeze(obj: Any) -> Any:
+    """Recursively convert dicts/lists into FrozenDict/FrozenList (other values unchanged)."""
+    if isinstance(obj, (FrozenDict, FrozenList)):
+        return obj  # built by freeze(), so already frozen all the way down
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+def _load_optional_yaml(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    return yaml_utils.load_yaml(path) or {}
+
+
+# name -> (path relative to the data root, loader(path))
+CATALOGS: Dict[str, Tuple[str, Callable[[Path], Any]]] = {
+    "stats": ("stats/stats.yaml", stats_loader.load_stat_template),
+    "slots": ("slots.yaml", slots_loader.load_slot_template),
+    "appearance_fields": ("appearance/fields.yaml", appearance_loader.load_appearance_fields),
+    "appearance_defaults": (
+        "appearance/defaults.yaml",
+        appearance_loader.load_appearance_defaults,
+    ),
+    "resources": ("resources.yaml", resources_loader.load_resources),
+    "resource_config": ("resources_config.yaml", resources_config_loader.load_resource_config),
+    "progression": ("progression.yaml", progression_loader.load_progression),
+    "classes": ("classes.yaml", classes_loader.load_class_catalog),
+    "traits": ("traits.yaml", traits_loader.load_trait_catalog),
+    "items": ("items.yaml", items_loader.load_item_catalog),
+    "races": ("races.yaml", races_loader.load_race_catalog),
+    "formulas": ("formulas.yaml", yaml_utils.load_yaml),
+    "difficulty": ("difficulty.yaml", difficulty_loader.load_difficulty),
+    "status_effects": ("status_effects.yaml", status_effects_loader.load_status_effects),
+    "creation_limits": ("creation_limits.yaml", _load_optional_yaml),
+    "content_packs": ("content_packs.yaml", content_packs_loader.load_packs_config),
+}
+
+
+class CatalogRegistry:
+    """
+    Process-wide cache of parsed data files. Each (path, loader) result is kept with the
+    file's (mtime_ns, size) stamp; access re-stats the file and reparses only when the stamp
+    moved, so repeated lookups cost one os.stat. Results are frozen (FrozenDict/FrozenList)
+    because every caller shares the same objects. Thread-safe.
+    """
+
+    def __init__(self, data_root: str | Path | None = None):
+        root = Path(data_root) if data_root is not None else DEFAULT_DATA_ROOT
+        self.data_root = root.resolve()
+        self._cache: Dict[Tuple[Path, Callable[[Path], Any]], Tuple[Any, Any]] = {}
+        self._lock = threading.RLock()
+        self.loads = 0  # number of actual parses, for diagnostics
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int] | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def path(self, rel: str | Path) -> Path:
+        """Absolute path of a file; relative paths are taken under the data root."""
+        p = Path(rel)
+        return p if p.is_absolute() else self.data_root / p
+
+    def load(self, rel: str | Path, loader: Callable[[Path], Any] = yaml_utils.load_yaml) -> Any:
+        """Frozen loader(path) for a file under the data root (or an absolute path)."""
+        path = self.path(rel)
+        key = (path, loader)
+        stamp = self._stamp(path)
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] == stamp:
+                return hit[1]
+            value = freeze(loader(path))
+            self.loads += 1
+            self._cache[key] = (stamp, value)
+            return value
+
+    def seed(self, rel: str | Path, loader: Callable[[Path], Any], value: Any) -> None:
+        """Store an already-parsed result for a file as of its current stamp (snapshot loads)."""
+        path = self.path(rel)
+        with self._lock:
+            self._cache[(path, loader)] = (self._stamp(path), freeze(value))
+
+    def _packs_stamp(self, enabled: Any) -> Any:
+        files = []
+        for name in enabled:
+            pack_dir = self.data_root / "content_packs" / str(name)
+            if pack_dir.is_dir():
+                files.extend(sorted(p for p in pack_dir.rglob("*") if p.is_file()))
+        return (
+            self._stamp(self.path("content_packs.yaml")),
+            tuple((str(p), self._stamp(p)) for p in files),
+        )
+
+    def pack_overlay(self) -> Any:
+        """
+        Merged overlay of the enabled content packs (load_and_merge_enabled_packs), cached
+        against the stamps of content_packs.yaml and every file in the enabled pack dirs.
+        """
+        cfg = self.get("content_packs")
+        key = (self.data_root / "content_packs", content_packs_loader.load_and_merge_enabled_packs)
+        stamp = self._packs_stamp(cfg.get("enabled") or [])
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] == stamp:
+                return hit[1]
+            value = freeze(
+                content_packs_loader.load_and_merge_enabled_packs(self.data_root, dict(cfg))
+            )
+            self.loads += 1
+            self._cache[key] = (stamp, value)
+            return value
+
+    def seed_pack_overlay(self, value: Any) -> None:
+        cfg = self.get("content_packs")
+        key = (self.data_root / "content_packs", content_packs_loader.load_and_merge_enabled_packs)
+        with self._lock:
+            self._cache[key] = (self._packs_stamp(cfg.get("enabled") or []), freeze(value))
+
+    def yaml(self, rel: str | Path) -> Any:
+        return self.load(rel, yaml_utils.load_yaml)
+
+    def get(self, name: str) -> Any:
+        """A named catalog (see CATALOGS), e.g. registry.get("classes")."""
+        try:
+            rel, loader = CATALOGS[name]
+        except KeyError:
+            raise KeyError(f"unknown catalog '{name}'") from None
+        return self.load(rel, loader)
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """Drop cached entries for one file (or all); the next access reparses."""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                return
+            target = self.path(path)
+            for key in [k for k in self._cache if k[0] == target]:
+                del self._cache[key]
+
+
+_shared: Dict[Path, CatalogRegistry] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_registry(data_root: str | Path | None = None) -> CatalogRegistry:
+    """The process-wide registry of a data root (package data by default)."""
+    root = Path(data_root) if data_root is not None else DEFAULT_DATA_ROOT
+    key = root.resolve()
+    with _shared_lock:
+        reg = _shared.get(key)
+        if reg is None:
+            reg = _shared[key] = CatalogRegistry(root)
+        return reg
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+import hashlib
+import json
+import os
+
+from ..loaders import yaml_utils
+from .catalog_registry import CATALOGS, DEFAULT_DATA_ROOT, shared_registry
+from .live_reload import CatalogReloader
+
+# 2: JSON (format 1 was a pickle, which a dropped-in file could use to run code)
+SNAPSHOT_FORMAT = 2
+SNAPSHOT_NAME = "catalogs.snapshot"
+
+
+def default_snapshot_path(data_root: str | Path | None = None) -> Path:
+    root = Path(data_root) if data_root is not None else DEFAULT_DATA_ROOT
+    return root / SNAPSHOT_NAME
+
+
+def source_hashes(data_root: str | Path) -> Dict[str, str]:
+    """sha256 of every YAML file under the data root, keyed by posix path relative to it."""
+    root = Path(data_root)
+    out: Dict[str, str] = {}
+    for p in sorted(root.rglob("*.yaml")):
+        out[p.relative_to(root).as_posix()] = hashlib.sha256(p.read_bytes()).hexdigest()
+    return out
+
+
+def _raw_yaml(rel: str) -> bool:
+    return rel.startswith("appearance/") or rel == "content_packs.yaml"
+
+
+def compile_snapshot(data_root: str | Path | None = None, out: str | Path | None = None) -> Path:
+    """
+    Parse, merge and validate all catalogs once and write the parsed files, with the hashes
+    of their sources, as one JSON document (plain data only: loading a snapshot never runs
+    code). Raises the usual loader/validation errors on bad data, and ValueError for data
+    JSON cannot represent exactly (e.g. non-string mapping keys).
+    """
+    root = Path(data_root) if data_root is not None else DEFAULT_DATA_ROOT
+    out = Path(out) if out is not None else default_snapshot_path(root)
+    sources = source_hashes(root)
+    registry = shared_registry(root)
+    CatalogReloader(root).reload_once()  # validates the merged catalogs
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "sources": sources,
+        "catalogs": {name: registry.get(name) for name in CATALOGS},
+        # raw YAML the reloader reads besides the named catalogs
+        "files": {rel: registry.yaml(rel) for rel in sources if _raw_yaml(rel)},
+        "pack_overlay": registry.pack_overlay(),
+    }
+    text = json.dumps(payload, separators=(",", ":"))
+    if json.loads(text) != payload:
+        raise ValueError(f"catalogs under {root} do not round-trip through JSON")
+    if source_hashes(root) != sources:
+        raise RuntimeError(f"data under {root} changed while compiling; run again")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f"{out.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, out)
+    return out
+
+
+def load_snapshot(data_root: str | Path | None = None, path: str | Path | None = None) -> bool:
+    """
+    Read a snapshot written by compile_snapshot if it matches the current sources and seed
+    the shared CatalogRegistry with it (so registry lookups, and CatalogReloader merges, hit
+    without parsing). Returns False when the snapshot is missing, unreadable, of another
+    format or stale — the registry then parses the YAML as usual.
+    """
+    root = Path(data_root) if data_root is not None else DEFAULT_DATA_ROOT
+    path = Path(path) if path is not None else default_snapshot_path(root)
+    try:
+        payload = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return False
+    if not isinstance(payload, dict) or payload.get("format") != SNAPSHOT_FORMAT:
+        return False
+    if payload.get("sources") != source_hashes(root):
+        return False
+    registry = shared_registry(root)
+    for name, value in payload["catalogs"].items():
+        if name in CATALOGS:
+            rel, loader = CATALOGS[name]
+            registry.seed(rel, loader, value)
+    for rel, value in payload["files"].items():
+        registry.seed(rel, yaml_utils.load_yaml, value)
+    registry.seed_pack_overlay(payload["pack_overlay"])
+    return True
+
+
+def load_catalogs(data_root: str | Path | None = None) -> Dict[str, Any]:
+    """Merged, validated catalogs: from a fresh snapshot if there is one, else from YAML."""
+    root = Path(data_root) if data_root is not None else DEFAULT_DATA_ROOT
+    load_snapshot(root)
+    return CatalogReloader(root).reload_once()
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+import json
+import numbers
+import sqlite3
+import threading
+import time
+
+from ..loaders import save_loader
+from ..models.character import Character
+
+DB_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    race TEXT,
+    classes TEXT NOT NULL,
+    difficulty TEXT,
+    schema INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS characters_name ON characters(name);
+CREATE INDEX IF NOT EXISTS characters_level ON characters(level);
+CREATE INDEX IF NOT EXISTS characters_race ON characters(race, level);
+CREATE INDEX IF NOT EXISTS characters_difficulty ON characters(difficulty);
+CREATE TABLE IF NOT EXISTS character_classes (
+    class_id TEXT NOT NULL,
+    character_id INTEGER NOT NULL REFERENCES characters(id) ON DELETE CASCADE,
+    PRIMARY KEY (class_id, character_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS character_classes_owner ON character_classes(character_id);
+"""
+
+# statement texts are constants so sqlite3's statement cache reuses the prepared statements
+_UPSERT = (
+    "INSERT INTO characters (id, name, level, race, classes, difficulty, schema, updated, body)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT(id) DO UPDATE SET name = excluded.name, level = excluded.level,"
+    " race = excluded.race, classes = excluded.classes, difficulty = excluded.difficulty,"
+    " schema = excluded.schema, updated = excluded.updated, body = excluded.body"
+)
+_DROP_CLASSES = "DELETE FROM character_classes WHERE character_id = ?"
+_ADD_CLASS = "INSERT OR IGNORE INTO character_classes (class_id, character_id) VALUES (?, ?)"
+_SUMMARY_COLUMNS = "id, name, level, race, classes, difficulty"
+ORDER_BY = {"name": "name, id", "level": "level, id", "id": "id", "updated": "updated, id"}
+
+
+@dataclass(frozen=True)
+class CharacterSummary:
+    """The indexed summary columns of one stored character (no body parse needed)."""
+
+    id: int
+    name: str
+    level: int
+    race: str | None
+    classes: List[str]
+    difficulty: str | None
+
+
+def _summary(row: Tuple[Any, ...]) -> CharacterSummary:
+    return CharacterSummary(row[0], row[1], row[2], row[3], json.loads(row[4]), row[5])
+
+
+class CharacterRepository:
+    """
+    Characters in one SQLite file (WAL mode). Hot summary fields (name, level, race,
+    classes, difficulty) are indexed columns; the full save record (save_loader's
+    current-schema record, compact JSON) is a blob that is migrated on load. Multi-class
+    lookups go through an indexed character_classes table. save_many() writes in batched
+    transactions. One connection guarded by a lock, so instances can be shared by threads.
+    """
+
+    def __init__(self, path: str | Path, cls: type = Character):
+        self.path = Path(path) if str(path) != ":memory:" else path
+        self.cls = cls
+        self._lock = threading.RLock()
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), isolation_level=None, check_same_thread=False, cached_statements=64
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > DB_VERSION:
+            raise RuntimeError(f"{path}: repository version {version} is newer than supported")
+        if version < DB_VERSION:
+            with self._transaction():
+                for statement in filter(str.strip, _SCHEMA.split(";")):
+                    self._conn.execute(statement)
+                self._conn.execute(f"PRAGMA user_version={DB_VERSION}")
+
+    # --- plumbing -------------------------------------------------------------------------
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._conn, self._lock)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "CharacterRepository":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _row(self, char_id: int, character: Any, now: float) -> Tuple[Any, ...]:
+        record = save_loader.character_to_record(character)
+        return (
+            char_id,
+            record.get("name") or "",
+            int(record.get("level") or 0),
+            record.get("race"),
+            json.dumps(list(record.get("classes") or [])),
+            record.get("difficulty"),
+            record["schema"],
+            now,
+            save_loader.encode_record(record),
+        )
+
+    # --- writes ---------------------------------------------------------------------------
+
+    def save(self, character: Any, char_id: int | None = None) -> int:
+        """Insert a character (char_id=None) or replace the one stored under char_id."""
+        return self.save_many([character], None if char_id is None else [char_id])[0]
+
+    def save_many(
+        self,
+        characters: Iterable[Any],
+        ids: Sequence[int] | None = None,
+        batch_size: int = 1000,
+    ) -> List[int]:
+        """
+        Store many characters, `batch_size` per transaction (executemany on prepared
+        statements). New characters get fresh ids; pass `ids` to overwrite stored ones.
+        Returns the ids in input order. ValueError if `ids` and `characters` differ in length.
+        """
+        if ids is not None:
+            characters = list(characters)
+            if len(ids) != len(characters):
+                raise ValueError(f"{len(characters)} characters but {len(ids)} ids")
+        out: List[int] = []
+        batch: List[Any] = []
+        id_iter = iter(ids) if ids is not None else None
+        for character in characters:
+            batch.append(character)
+            if len(batch) >= batch_size:
+                out.extend(self._write_batch(batch, id_iter))
+                batch = []
+        if batch:
+            out.extend(self._write_batch(batch, id_iter))
+        return out
+
+    def _write_batch(self, batch: List[Any], id_iter: Iterator[int] | None) -> List[int]:
+        now = time.time()
+        with self._transaction() as conn:
+            if id_iter is None:
+                # allocate ids up front (the write lock is held) so executemany can be used
+                start = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM characters")
+                first = start.fetchone()[0]
+                ids = list(range(first, first + len(batch)))
+            else:
+                ids = [int(next(id_iter)) for _ in batch]
+            rows = [self._row(i, c, now) for i, c in zip(ids, batch)]
+            conn.executemany(_UPSERT, rows)
+            conn.executemany(_DROP_CLASSES, [(i,) for i in ids])
+            conn.executemany(
+                _ADD_CLASS,
+                [(cls_id, row[0]) for row in rows for cls_id in json.loads(row[4])],
+            )
+        return ids
+
+    def delete(self, char_id: int) -> bool:
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM characters WHERE id = ?", (char_id,)).rowcount > 0
+
+    def import_files(self, paths: Iterable[str | Path], batch_size: int = 1000) -> List[int]:
+        """Load loose save files (any save_loader format) into the repository."""
+        loaded = (save_loader.load_character(p, self.cls) for p in paths)
+        return self.save_many(loaded, batch_size=batch_size)
+
+    # --- reads ----------------------------------------------------------------------------
+
+    def _where(
+        self,
+        name: str | None,
+        name_prefix: str | None,
+        level: int | Tuple[int, int] | None,
+        race: str | None,
+        class_id: str | None,
+        difficulty: str | None,
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if name is not None:
+            clauses.append("name = ?")
+            params.append(name)
+        if name_prefix:
+            # range scan on the name index (LIKE would bypass it)
+            clauses.append("name >= ? AND name < ?")
+            params += [name_prefix, name_prefix + "\U0010ffff"]
+        if level is not None:
+            lo, hi = (level, level) if isinstance(level, numbers.Integral) else level
+            clauses.append("level BETWEEN ? AND ?")
+            params += [lo, hi]
+        if race is not None:
+            clauses.append("race = ?")
+            params.append(race)
+        if difficulty is not None:
+            clauses.append("difficulty = ?")
+            params.append(difficulty)
+        if class_id is not None:
+            clauses.append("id IN (SELECT character_id FROM character_classes WHERE class_id = ?)")
+            params.append(class_id)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(
+        self,
+        name: str | None = None,
+        name_prefix: str | None = None,
+        level: int | Tuple[int, int] | None = None,
+        race: str | None = None,
+        class_id: str | None = None,
+        difficulty: str | None = None,
+        order_by: str = "name",
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> List[CharacterSummary]:
+        """Summaries matching every given filter (level: int or inclusive (lo, hi))."""
+        where, params = self._where(name, name_prefix, level, race, class_id, difficulty)
+        sql = f"SELECT {_SUMMARY_COLUMNS} FROM characters{where} ORDER BY {ORDER_BY[order_by]}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        with self._lock:
+            return [_summary(row) for row in self._conn.execute(sql, params)]
+
+    def count(self, **filters: Any) -> int:
+        where, params = self._where(
+            filters.get("name"),
+            filters.get("name_prefix"),
+            filters.get("level"),
+            filters.get("race"),
+            filters.get("class_id"),
+            filters.get("difficulty"),
+        )
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM characters{where}", params).fetchone()[
+                0
+            ]
+
+    def load(self, char_id: int) -> Any:
+        """The full character stored under char_id (KeyError if there is none)."""
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM characters WHERE id = ?", (char_id,))
+            found = row.fetchone()
+        if found is None:
+            raise KeyError(char_id)
+        return save_loader.record_to_character(json.loads(found[0]), self.cls)
+
+    def load_many(self, ids: Iterable[int], chunk_size: int = 500) -> Iterator[Any]:
+        """Full characters for `ids`, in that order, fetched `chunk_size` per statement."""
+        ids = list(ids)
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            marks = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT id, body FROM characters WHERE id IN ({marks})", chunk
+                ).fetchall()
+            bodies: Dict[int, bytes] = dict(rows)
+            for char_id in chunk:
+                if char_id not in bodies:
+                    raise KeyError(char_id)
+                yield save_loader.record_to_character(json.loads(bodies[char_id]), self.cls)
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT (ROLLBACK on error) under the repository lock."""
+
+    def __init__(self, conn: sqlite3.Connection, lock: Any):
+        self.conn = conn
+        self.lock = lock
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.lock.acquire()
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.conn
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        try:
+            self.conn.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+        finally:
+            self.lock.release()
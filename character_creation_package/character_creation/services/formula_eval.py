@@ -1,5 +1,6 @@
 import ast
 import math
+from functools import lru_cache
 from typing import Any, Dict
 
 # Allowed built-in functions
@@ -25,7 +26,9 @@ ALLOWED_NODE_TYPES = {
 }
 
 
-def _eval_node(node: ast.AST, context: Dict[str, Any]) -> float:
+def _eval_node(
+    node: ast.AST, context: Dict[str, Any], functions: Dict[str, Any] = ALLOWED_FUNCTIONS
+) -> Any:
     """Recursively evaluate an AST node."""
     node_type = type(node)
 
@@ -33,7 +36,7 @@ def _eval_node(node: ast.AST, context: Dict[str, Any]) -> float:
         raise ValueError(f"Unsafe node type found: {node_type.__name__}")
 
     if isinstance(node, ast.Expression):
-        return _eval_node(node.body, context)
+        return _eval_node(node.body, context, functions)
 
     elif isinstance(node, ast.Constant):
         if not isinstance(node.value, (int, float)):
@@ -46,8 +49,8 @@ def _eval_node(node: ast.AST, context: Dict[str, Any]) -> float:
         raise NameError(f"The name '{node.id}' is not defined in the provided context.")
 
     elif isinstance(node, ast.BinOp):
-        left = _eval_node(node.left, context)
-        right = _eval_node(node.right, context)
+        left = _eval_node(node.left, context, functions)
+        right = _eval_node(node.right, context, functions)
         op_map = {
             ast.Add: lambda a, b: a + b,
             ast.Sub: lambda a, b: a - b,
@@ -60,23 +63,33 @@ def _eval_node(node: ast.AST, context: Dict[str, Any]) -> float:
         raise TypeError(f"Unsupported binary operator: {type(node.op).__name__}")
 
     elif isinstance(node, ast.Call):
-        if isinstance(node.func, ast.Name) and node.func.id in ALLOWED_FUNCTIONS:
-            func = ALLOWED_FUNCTIONS[node.func.id]
-            args = [_eval_node(arg, context) for arg in node.args]
+        if isinstance(node.func, ast.Name) and node.func.id in functions:
+            func = functions[node.func.id]
+            args = [_eval_node(arg, context, functions) for arg in node.args]
             return func(*args)
         func_name = node.func.id if isinstance(node.func, ast.Name) else "[complex expression]"
         raise ValueError(f"Unsupported function call: '{func_name}'")
 
     elif isinstance(node, ast.UAdd):
-        return +_eval_node(node.operand, context)
+        return +_eval_node(node.operand, context, functions)
 
     elif isinstance(node, ast.USub):
-        return -_eval_node(node.operand, context)
+        return -_eval_node(node.operand, context, functions)
 
     # This line should not be reachable given the initial check
     raise TypeError(f"Evaluation failed for node type: {node_type.__name__}")
 
 
+@lru_cache(maxsize=512)
+def _parse(expr: str) -> ast.Expression:
+    # formulas come from a handful of YAML strings; parse each once
+    try:
+        # Using mode='eval' ensures we get a single expression
+        return ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid syntax in expression: '{expr}'") from e
+
+
 def evaluate(expr: str, context: Dict[str, Any]) -> float:
     """
     Safely evaluates a mathematical expression string using a restricted AST evaluator.
@@ -96,14 +109,22 @@ def evaluate(expr: str, context: Dict[str, Any]) -> float:
     if not isinstance(expr, str):
         raise TypeError("Expression must be a string.")
 
-    try:
-        # Using mode='eval' ensures we get a single expression
-        tree = ast.parse(expr, mode="eval")
-    except SyntaxError as e:
-        raise ValueError(f"Invalid syntax in expression: '{expr}'") from e
-
-    result = _eval_node(tree, context)
+    result = _eval_node(_parse(expr), context)
     if not isinstance(result, (int, float)):
         raise TypeError(f"Evaluation resulted in a non-numeric type: {type(result).__name__}")
 
     return float(result)
+
+
+def evaluate_columns(expr: str, context: Dict[str, Any]) -> Any:
+    """
+    Evaluate an expression over NumPy columns: same grammar as evaluate(), but names map to
+    arrays (or scalars) and floor() is numpy.floor, so one call computes a whole column.
+    Requires numpy.
+    """
+    import numpy as np
+
+    if not isinstance(expr, str):
+        raise TypeError("Expression must be a string.")
+    result = _eval_node(_parse(expr), context, {"floor": np.floor})
+    return np.asarray(result, dtype=np.float64)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Callable
+from typing import Any, Dict, Callable, Iterable, List, Set
+import threading
 import time
 
-import yaml
-
 try:
     from watchfiles import watch
 
@@ -13,18 +13,8 @@ try:
 except ImportError:
     WATCHFILES_AVAILABLE = False
 
-from ..loaders import (
-    stats_loader,
-    slots_loader,
-    appearance_loader,
-    resources_loader,
-    progression_loader,
-    classes_loader,
-    traits_loader,
-    items_loader,
-    races_loader,
-)
 from ..loaders import content_packs_loader
+from .catalog_registry import shared_registry
 from .validate_data import (
     validate_stats,
     validate_classes,
@@ -39,8 +29,207 @@ from .validate_data import (
     validate_merged_catalogs,
 )
 
+# data file (relative to the data root) -> catalog key it feeds
+BASE_FILES: Dict[str, str] = {
+    "stats/stats.yaml": "stats",
+    "slots.yaml": "slots",
+    "appearance/fields.yaml": "appearance_fields",
+    "appearance/defaults.yaml": "appearance_defaults",
+    "resources.yaml": "resources",
+    "classes.yaml": "class_catalog",
+    "traits.yaml": "trait_catalog",
+    "items.yaml": "items_catalog",
+    "races.yaml": "race_catalog",
+    "progression.yaml": "progression",
+    "formulas.yaml": "formulas",
+    "creation_limits.yaml": "creation_limits",
+}
+
+# catalog key -> CatalogRegistry name
+_REGISTRY_NAMES: Dict[str, str] = {
+    "stats": "stats",
+    "slots": "slots",
+    "appearance_fields": "appearance_fields",
+    "appearance_defaults": "appearance_defaults",
+    "resources": "resources",
+    "class_catalog": "classes",
+    "trait_catalog": "traits",
+    "items_catalog": "items",
+    "race_catalog": "races",
+    "progression": "progression",
+    "formulas": "formulas",
+    "creation_limits": "creation_limits",
+}
+
+# catalog key -> content pack key that overlays it
+MERGED_KEYS: Dict[str, str] = {
+    "class_catalog": "classes",
+    "trait_catalog": "traits",
+    "race_catalog": "races",
+    "items_catalog": "items",
+    "appearance_tables": "appearance_tables",
+}
+
+_DEFAULT_PACKS_CFG: Dict[str, Any] = {"enabled": [], "merge": {"on_conflict": "skip"}}
+
+
+@dataclass
+class ReloadPlan:
+    """What a set of changed files touches. `full` rebuilds everything."""
+
+    full: bool = False
+    keys: Set[str] = field(default_factory=set)  # base catalogs to reparse
+    tables: Set[str] = field(default_factory=set)  # appearance table stems
+    all_tables: bool = False
+    ranges: Set[str] = field(default_factory=set)  # appearance range stems
+    packs: Set[str] = field(default_factory=set)  # content pack names
+    packs_cfg: bool = False
+
+    def empty(self) -> bool:
+        return not (
+            self.full
+            or self.keys
+            or self.tables
+            or self.all_tables
+            or self.ranges
+            or self.packs
+            or self.packs_cfg
+        )
+
+
+# Normalize loaders that may return list-only or dict wrappers
+def _ensure_dict_list(wrapper_key: str, data_obj: Any) -> Dict[str, Any]:
+    if isinstance(data_obj, dict) and wrapper_key in data_obj:
+        return {wrapper_key: list(data_obj[wrapper_key])}
+    if isinstance(data_obj, list):
+        return {wrapper_key: list(data_obj)}
+    return {wrapper_key: []}
+
+
+def _normalize_traits(traits: Any) -> Dict[str, Any]:
+    # traits should be mapping under 'traits'
+    if isinstance(traits, dict) and "traits" in traits:
+        return {"traits": dict(traits["traits"])}
+    if isinstance(traits, dict):
+        return {"traits": dict(traits)}
+    return {"traits": {}}
+
+
+def _normalize_items(items: Any) -> Dict[str, Any]:
+    # items should be list under 'items'
+    if isinstance(items, dict) and "items" in items:
+        return {
+            "items": (
+                list(items["items"]) if isinstance(items["items"], list) else list(items.values())
+            )
+        }
+    if isinstance(items, list):
+        return {"items": list(items)}
+    return {"items": []}
+
+
+def _list_merge(base_list: Any, add_list: Any, key: str = "id") -> List[Any]:
+    base_list = list(base_list) if isinstance(base_list, list) else []
+    seen = {x.get(key) for x in base_list if isinstance(x, dict)}
+    for it in add_list or []:
+        if isinstance(it, dict) and it.get(key) not in seen:
+            base_list.append(it)
+            seen.add(it.get(key))
+    return base_list
+
+
+def _table_values(loaded: Any) -> List[Any]:
+    if isinstance(loaded, dict) and "values" in loaded:
+        return loaded.get("values") or []
+    if isinstance(loaded, list):
+        return loaded
+    return []
+
+
+class ReloadScheduler:
+    """
+    Trailing-edge debounce for file change bursts. add(changes) accumulates changes; a single
+    background worker calls reload(union_of_changes) once nothing new arrived for `quiet_ms`,
+    or once the oldest pending change is `max_delay_ms` old during a continuous stream.
+    Reloads never overlap; changes arriving during a reload are batched into the next one.
+    """
+
+    def __init__(
+        self,
+        reload: Callable[[Set[Any]], None],
+        quiet_ms: int = 300,
+        max_delay_ms: int = 2000,
+    ):
+        self._reload = reload
+        self.quiet = quiet_ms / 1000.0
+        self.max_delay = max(max_delay_ms, quiet_ms) / 1000.0
+        self._cond = threading.Condition()
+        self._pending: Set[Any] = set()
+        self._first = 0.0
+        self._last = 0.0
+        self._busy = False
+        self._closed = False
+        self.reloads = 0
+        self._worker = threading.Thread(target=self._run, name="catalog-reload", daemon=True)
+        self._worker.start()
+
+    def add(self, changes: Iterable[Any]) -> None:
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first = now
+            self._pending.update(changes)
+            self._last = now
+            self._cond.notify_all()
+
+    def _due(self) -> float:
+        # seconds until the pending batch should fire (<= 0: now)
+        now = time.monotonic()
+        return min(self._last + self.quiet, self._first + self.max_delay) - now
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and (not self._pending or self._due() > 0):
+                    self._cond.wait(self._due() if self._pending else None)
+                if not self._pending:
+                    return  # closed and drained
+                batch, self._pending = self._pending, set()
+                self._busy = True
+            try:
+                self._reload(batch)
+            except Exception as e:  # noqa: BLE001
+                print(f"[LiveReload] Reload failed: {e}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self.reloads += 1
+                    self._cond.notify_all()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until nothing is pending or running; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, flush: bool = True) -> None:
+        """Stop the worker; with flush, pending changes are reloaded first (no quiet wait)."""
+        with self._cond:
+            if not flush:
+                self._pending.clear()
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join()
+
 
 class CatalogReloader:
+    """
+    Builds the merged, validated catalogs and rebuilds them incrementally: reload_once(changed)
+    maps the changed paths to the catalogs, appearance tables/ranges and content packs they
+    feed, reparses only those, re-merges only the overlays the touched packs contribute to and
+    re-validates only the touched catalogs plus their cross-references (items vs slots, merged
+    id uniqueness). Without a change set (or before the first load) it rebuilds everything.
+    """
+
     def __init__(self, data_root: Path):
         self.data_root = Path(data_root)
         # Be robust to different working directories: if provided path doesn't contain
@@ -55,134 +244,196 @@ class CatalogReloader:
             pass
         self.version = 0
         self._last_ok: Dict[str, Any] | None = None
+        # state behind _last_ok: unmerged base catalogs, parsed packs, packs config
+        self._base: Dict[str, Any] = {}
+        self._packs: Dict[str, Dict[str, Any]] = {}
+        self._packs_cfg: Dict[str, Any] = dict(_DEFAULT_PACKS_CFG)
+        self.last_reload: Dict[str, Any] = {}  # what the last reload_once did
 
-    def _load_base(self) -> Dict[str, Any]:
-        dr = self.data_root
-        stats = stats_loader.load_stat_template(dr / "stats" / "stats.yaml")
-        slots = slots_loader.load_slot_template(dr / "slots.yaml")
-        fields = appearance_loader.load_appearance_fields(dr / "appearance" / "fields.yaml")
-        defaults = appearance_loader.load_appearance_defaults(dr / "appearance" / "defaults.yaml")
-        resources = resources_loader.load_resources(dr / "resources.yaml")
-        classes = classes_loader.load_class_catalog(dr / "classes.yaml")
-        traits = traits_loader.load_trait_catalog(dr / "traits.yaml")
-        items = items_loader.load_item_catalog(dr / "items.yaml")
-        races = races_loader.load_race_catalog(dr / "races.yaml")
-        progression = progression_loader.load_progression(dr / "progression.yaml")
-        with open(dr / "formulas.yaml", "r", encoding="utf-8") as f:
-            formulas = yaml.safe_load(f)
-        limits_path = dr / "creation_limits.yaml"
-        if limits_path.exists():
-            with open(limits_path, "r", encoding="utf-8") as f:
-                creation_limits = yaml.safe_load(f) or {}
-        else:
-            creation_limits = {}
+    # -------- change mapping --------
 
-        # Optional content packs
-        packs_cfg_path = dr / "content_packs.yaml"
-        if packs_cfg_path.exists():
-            with open(packs_cfg_path, "r", encoding="utf-8") as f:
-                packs_cfg = yaml.safe_load(f) or {
-                    "enabled": [],
-                    "merge": {"on_conflict": "skip"},
-                }
-        else:
-            packs_cfg = {"enabled": [], "merge": {"on_conflict": "skip"}}
-        merged_from_packs = content_packs_loader.load_and_merge_enabled_packs(dr, packs_cfg)
-
-        # Merge helper
-        def list_merge(base_list, add_list, key="id"):
-            if not isinstance(base_list, list):
-                base_list = []
-            seen = {x.get(key) for x in base_list if isinstance(x, dict)}
-            for it in add_list or []:
-                if isinstance(it, dict) and it.get(key) not in seen:
-                    base_list.append(it)
-                    seen.add(it.get(key))
-            return base_list
-
-        # Normalize loaders that may return list-only or dict wrappers
-        def ensure_dict_list(wrapper_key: str, data_obj: Any) -> Dict[str, Any]:
-            if isinstance(data_obj, dict) and wrapper_key in data_obj:
-                return {wrapper_key: list(data_obj[wrapper_key])}
-            if isinstance(data_obj, list):
-                return {wrapper_key: list(data_obj)}
-            return {wrapper_key: []}
-
-        classes = ensure_dict_list("classes", classes)
-        races = ensure_dict_list("races", races)
-        # traits should be mapping under 'traits'
-        if isinstance(traits, dict) and "traits" in traits:
-            traits = {"traits": dict(traits["traits"])}
-        elif isinstance(traits, dict):
-            traits = {"traits": dict(traits)}
-        else:
-            traits = {"traits": {}}
-        # items should be list under 'items'
-        if isinstance(items, dict) and "items" in items:
-            items = {
-                "items": (
-                    list(items["items"])
-                    if isinstance(items["items"], list)
-                    else list(items.values())
-                )
-            }
-        elif isinstance(items, list):
-            items = {"items": list(items)}
-        else:
-            items = {"items": []}
+    def plan(self, changed: Iterable[Any]) -> ReloadPlan:
+        """
+        Map changed paths (strings/Paths, or watchfiles (Change, path) tuples) to a plan.
+        Paths outside the data root or not read by any catalog are ignored.
+        """
+        root = self.data_root.resolve()
+        plan = ReloadPlan()
+        for entry in changed:
+            raw = entry[1] if isinstance(entry, tuple) else entry
+            try:
+                rel = Path(raw).resolve().relative_to(root)
+            except ValueError:
+                continue
+            key = rel.as_posix()
+            parts = rel.parts
+            if key in BASE_FILES:
+                plan.keys.add(BASE_FILES[key])
+            elif key == "content_packs.yaml":
+                plan.packs_cfg = True
+            elif parts[:1] == ("content_packs",) and len(parts) >= 2:
+                plan.packs.add(parts[1])
+            elif parts[:2] == ("appearance", "tables"):
+                if len(parts) == 3 and rel.suffix == ".yaml":
+                    plan.tables.add(rel.stem)
+                elif len(parts) == 2:
+                    plan.all_tables = True
+            elif parts[:2] == ("appearance", "ranges") and len(parts) == 3:
+                if rel.suffix == ".yaml":
+                    plan.ranges.add(rel.stem)
+            elif key in ("", "."):
+                plan.full = True
+        return plan
 
-        # Apply merged overlays
-        if "classes" in merged_from_packs:
-            classes = {
-                "classes": list_merge(classes.get("classes", []), merged_from_packs["classes"])
-            }
-        if "traits" in merged_from_packs:
-            merged_traits = dict(traits.get("traits", {}))
-            merged_traits.update(merged_from_packs["traits"])
-            traits = {"traits": merged_traits}
-        if "races" in merged_from_packs:
-            races = {"races": list_merge(races.get("races", []), merged_from_packs["races"])}
-        if "items" in merged_from_packs:
-            items = {"items": list_merge(items.get("items", []), merged_from_packs["items"])}
-
-        # Appearance tables union (base + packs)
-        appearance_tables: Dict[str, Any] = {}
-        tables_dir = dr / "appearance" / "tables"
+    # -------- loading --------
+
+    def _load_key(self, key: str) -> Any:
+        value = shared_registry(self.data_root).get(_REGISTRY_NAMES[key])
+        if key == "class_catalog":
+            return _ensure_dict_list("classes", value)
+        if key == "race_catalog":
+            return _ensure_dict_list("races", value)
+        if key == "trait_catalog":
+            return _normalize_traits(value)
+        if key == "items_catalog":
+            return _normalize_items(value)
+        return value
+
+    def _load_table(self, path: Path) -> List[Any]:
+        return _table_values(shared_registry(self.data_root).yaml(path) or [])
+
+    def _load_tables(self) -> Dict[str, Any]:
+        # Appearance tables (base; packs are unioned in by _merge)
+        tables: Dict[str, Any] = {}
+        tables_dir = self.data_root / "appearance" / "tables"
         if tables_dir.exists():
             for p in tables_dir.glob("*.yaml"):
-                with open(p, "r", encoding="utf-8") as f:
-                    loaded = yaml.safe_load(f) or []
-                if isinstance(loaded, dict) and "values" in loaded:
-                    values = loaded.get("values") or []
-                elif isinstance(loaded, list):
-                    values = loaded
-                else:
-                    values = []
-                appearance_tables[p.stem] = values
-        if "appearance_tables" in merged_from_packs:
-            for k, vals in merged_from_packs["appearance_tables"].items():
-                base_vals = list(appearance_tables.get(k, []))
+                tables[p.stem] = self._load_table(p.resolve())
+        return tables
+
+    def _load_packs_cfg(self) -> Dict[str, Any]:
+        # Optional content packs
+        if (self.data_root / "content_packs.yaml").exists():
+            return shared_registry(self.data_root).yaml("content_packs.yaml") or dict(
+                _DEFAULT_PACKS_CFG
+            )
+        return dict(_DEFAULT_PACKS_CFG)
+
+    def _load_pack(self, name: str) -> Dict[str, Any]:
+        return content_packs_loader.load_pack_dir(self.data_root / "content_packs" / name)
+
+    def _merge(
+        self,
+        key: str,
+        base: Dict[str, Any],
+        packs: Dict[str, Dict[str, Any]],
+        packs_cfg: Dict[str, Any],
+    ) -> Any:
+        """Base catalog `key` with the enabled packs' overlay for it applied."""
+        kind = MERGED_KEYS[key]
+        on_conflict = ((packs_cfg or {}).get("merge") or {}).get("on_conflict", "skip")
+        if on_conflict not in {"skip", "override", "error"}:
+            on_conflict = "skip"
+        # fold the packs for this kind only (merge_catalogs treats kinds independently)
+        acc: Dict[str, Any] = {}
+        for name in list((packs_cfg or {}).get("enabled") or []):
+            pack = packs.get(name) or {}
+            acc = content_packs_loader.merge_catalogs(
+                acc, {kind: pack[kind]} if kind in pack else {}, on_conflict
+            )
+        overlay = acc.get(kind)
+        value = base[key]
+        if overlay is None:
+            return value
+        if key == "trait_catalog":
+            merged_traits = dict(value.get("traits", {}))
+            merged_traits.update(overlay)
+            return {"traits": merged_traits}
+        if key == "appearance_tables":
+            # Appearance tables union (base + packs)
+            tables = dict(value)
+            for k, vals in overlay.items():
+                base_vals = list(tables.get(k, []))
                 for v in vals or []:
                     if v not in base_vals:
                         base_vals.append(v)
-                appearance_tables[k] = base_vals
+                tables[k] = base_vals
+            return tables
+        return {kind: _list_merge(value.get(kind, []), overlay)}
 
+    def _build(self, plan: ReloadPlan) -> Dict[str, Any]:
+        """
+        Staged rebuild for `plan`; returns the new catalogs plus the state and validation scope
+        to commit once validation passes.
+        """
+        full = plan.full or self._last_ok is None
+        base = {} if full else dict(self._base)
+        packs = {} if full else dict(self._packs)
+        cats = {} if full else dict(self._last_ok or {})
+        keys = set(BASE_FILES.values()) if full else set(plan.keys)
+        for key in keys:
+            base[key] = self._load_key(key)
+        if full or plan.all_tables:
+            base["appearance_tables"] = self._load_tables()
+        elif plan.tables:
+            tables = dict(base["appearance_tables"])
+            for stem in plan.tables:
+                p = self.data_root / "appearance" / "tables" / f"{stem}.yaml"
+                if p.exists():
+                    tables[stem] = self._load_table(p.resolve())
+                else:
+                    tables.pop(stem, None)
+            base["appearance_tables"] = tables
+        tables_changed = full or plan.all_tables or bool(plan.tables)
+
+        packs_cfg = self._load_packs_cfg() if (full or plan.packs_cfg) else self._packs_cfg
+        enabled = list((packs_cfg or {}).get("enabled") or [])
+        reloaded_packs = [n for n in enabled if n not in packs or n in plan.packs]
+        pack_kinds: Set[str] = set()
+        for name in reloaded_packs:
+            old = packs.get(name) or {}
+            packs[name] = self._load_pack(name)
+            pack_kinds.update(old.keys(), packs[name].keys())
+
+        remerge = set(MERGED_KEYS) if (full or plan.packs_cfg) else set()
+        remerge.update(k for k in keys if k in MERGED_KEYS)
+        if tables_changed:
+            remerge.add("appearance_tables")
+        remerge.update(k for k, kind in MERGED_KEYS.items() if kind in pack_kinds)
+
+        for key in keys | {"appearance_tables"}:
+            if key not in MERGED_KEYS:
+                cats[key] = base[key]
+        for key in remerge:
+            cats[key] = self._merge(key, base, packs, packs_cfg)
+
+        # keep the original key order for callers that iterate
+        order = list(BASE_FILES.values())
+        order.insert(order.index("race_catalog") + 1, "appearance_tables")
+        cats = {k: cats[k] for k in order if k in cats}
+        if full:
+            tables: Set[str] | None = None
+        elif plan.all_tables:
+            tables = set(base["appearance_tables"])
+        else:
+            tables = plan.tables
         return {
-            "stats": stats,
-            "slots": slots,
-            "appearance_fields": fields,
-            "appearance_defaults": defaults,
-            "resources": resources,
-            "class_catalog": classes,
-            "trait_catalog": traits,
-            "items_catalog": items,
-            "race_catalog": races,
-            "appearance_tables": appearance_tables,
-            "progression": progression,
-            "formulas": formulas,
-            "creation_limits": creation_limits,
+            "cats": cats,
+            "base": base,
+            "packs": {n: packs[n] for n in enabled if n in packs},
+            "packs_cfg": packs_cfg,
+            "full": full,
+            "touched": (keys | remerge) if not full else set(cats),
+            "tables": tables,
+            "ranges": plan.ranges,
+            "reloaded_packs": reloaded_packs,
         }
 
+    def _load_base(self) -> Dict[str, Any]:
+        return self._build(ReloadPlan(full=True))["cats"]
+
+    # -------- validation --------
+
     def _validate_all(self, cats: Dict[str, Any]) -> None:
         validate_stats(cats["stats"])
         validate_classes(cats["class_catalog"])
@@ -197,13 +448,11 @@ class CatalogReloader:
         ranges_dir = dr / "appearance" / "ranges"
         if tables_dir.exists():
             for p in tables_dir.glob("*.yaml"):
-                with open(p, "r", encoding="utf-8") as f:
-                    validate_appearance_table(yaml.safe_load(f), p.stem)
+                validate_appearance_table(shared_registry(dr).yaml(p.relative_to(dr)), p.stem)
                 break
         if ranges_dir.exists():
             for p in ranges_dir.glob("*.yaml"):
-                with open(p, "r", encoding="utf-8") as f:
-                    validate_numeric_range(yaml.safe_load(f), p.stem)
+                validate_numeric_range(shared_registry(dr).yaml(p.relative_to(dr)), p.stem)
                 break
         validate_creation_limits(cats.get("creation_limits", {}))
         validate_merged_catalogs(
@@ -216,32 +465,117 @@ class CatalogReloader:
             }
         )
 
-    def reload_once(self) -> Dict[str, Any]:
-        cats = self._load_base()
-        self._validate_all(cats)
+    def _validate_touched(
+        self,
+        cats: Dict[str, Any],
+        touched: Set[str],
+        tables: Set[str],
+        ranges: Set[str],
+    ) -> List[str]:
+        """Validate only what changed (plus cross-references); returns what was checked."""
+        checked: List[str] = []
+        single = {
+            "stats": validate_stats,
+            "class_catalog": validate_classes,
+            "trait_catalog": validate_traits,
+            "slots": validate_slots,
+            "race_catalog": validate_races,
+            "appearance_fields": validate_appearance_fields,
+            "creation_limits": validate_creation_limits,
+        }
+        for key, fn in single.items():
+            if key in touched:
+                fn(cats.get(key, {}))
+                checked.append(key)
+        # items reference slots
+        if "items_catalog" in touched or "slots" in touched:
+            validate_items(cats["items_catalog"], cats["slots"])
+            checked.append("items_catalog")
+        dr = self.data_root
+        for stem in sorted(tables):
+            p = dr / "appearance" / "tables" / f"{stem}.yaml"
+            if p.exists():
+                validate_appearance_table(shared_registry(dr).yaml(p.resolve()), stem)
+                checked.append(f"table:{stem}")
+        for stem in sorted(ranges):
+            p = dr / "appearance" / "ranges" / f"{stem}.yaml"
+            if p.exists():
+                validate_numeric_range(shared_registry(dr).yaml(p.resolve()), stem)
+                checked.append(f"range:{stem}")
+        # merged id uniqueness across base + packs, for the overlays that were rebuilt
+        merged: Dict[str, Any] = {}
+        for key, kind in MERGED_KEYS.items():
+            if key in touched:
+                merged[kind] = cats[key] if key == "appearance_tables" else cats[key].get(kind, [])
+        if merged:
+            validate_merged_catalogs(merged)
+            checked.append("merged:" + ",".join(sorted(merged)))
+        return checked
+
+    # -------- public API --------
+
+    def reload_once(self, changed: Iterable[Any] | None = None) -> Dict[str, Any]:
+        """
+        Rebuild and validate the catalogs. With `changed` (paths or watchfiles change tuples)
+        only the affected parts are rebuilt; if nothing relevant changed, the last good
+        catalogs are returned as they are (version unchanged). On a validation error the
+        previous state is kept and the error propagates.
+        """
+        plan = ReloadPlan(full=True) if changed is None else self.plan(changed)
+        if self._last_ok is not None and plan.empty():
+            self.last_reload = {"full": False, "touched": [], "packs": [], "validated": []}
+            return self._last_ok
+        staged = self._build(plan)
+        cats = staged["cats"]
+        if staged["full"]:
+            self._validate_all(cats)
+            checked = ["all"]
+        else:
+            checked = self._validate_touched(
+                cats, staged["touched"], staged["tables"] or set(), staged["ranges"]
+            )
+        self._base = staged["base"]
+        self._packs = staged["packs"]
+        self._packs_cfg = staged["packs_cfg"]
         self.version += 1
         self._last_ok = cats
+        self.last_reload = {
+            "full": staged["full"],
+            "touched": sorted(staged["touched"]),
+            "packs": list(staged["reloaded_packs"]),
+            "validated": checked,
+        }
         return cats
 
     def watch(
         self,
         callback: Callable[[Dict[str, Any], int, list], None],
         debounce_ms: int = 300,
+        max_delay_ms: int = 2000,
     ) -> None:
+        """
+        Watch the data root and call callback(cats, version, changes) after each effective
+        reload. Bursts are coalesced (see ReloadScheduler): one reload with the union of the
+        changes once the tree was quiet for debounce_ms, at most max_delay_ms after the first
+        change. Blocks until the watcher stops.
+        """
         if not WATCHFILES_AVAILABLE:
             raise ImportError(
                 "watchfiles is not installed. Install it with: pip install watchfiles"
             )
 
-        data_dir = str(self.data_root)
-        last_emit = 0.0
-        for changes in watch(data_dir, recursive=True):
-            now = time.time()
-            if (now - last_emit) * 1000 < debounce_ms:
-                continue
-            last_emit = now
+        def _reload(changes: Set[Any]) -> None:
             try:
-                cats = self.reload_once()
-                callback(cats, self.version, list(changes))
+                version = self.version
+                cats = self.reload_once(changes)
+                if self.version != version:
+                    callback(cats, self.version, sorted(changes, key=str))
             except Exception as e:  # noqa: BLE001
                 print(f"[LiveReload] Validation error: {e}")
+
+        scheduler = ReloadScheduler(_reload, quiet_ms=debounce_ms, max_delay_ms=max_delay_ms)
+        try:
+            for changes in watch(str(self.data_root), recursive=True):
+                scheduler.add(changes)
+        finally:
+            scheduler.close()
@@ -25,24 +25,14 @@ from .widgets import ParchmentCard, HeroViewport, StatGrid, ClassCardList
 from .sprites import sprite_for_class
 
 # data & model
-from character_creation.loaders import (
-    stats_loader,
-    slots_loader,
-    classes_loader,
-    traits_loader,
-    appearance_loader,
-    resources_loader,
-    progression_loader,
-    races_loader,
-)
 from character_creation.models.factory import create_new_character
+from character_creation.services.catalog_registry import shared_registry
+from character_creation.services.catalog_snapshot import load_snapshot
 
 # optional difficulty
 try:
-    from character_creation.loaders import difficulty_loader
     from character_creation.services.balance import current_profile
 except Exception:  # pragma: no cover
-    difficulty_loader = None
     current_profile = None
 
 
@@ -55,28 +45,24 @@ class WizardWindow(QMainWindow):
 
         # --- load data ---
         self.data_root = data_root
-        self.stat_tmpl = stats_loader.load_stat_template(data_root / "stats" / "stats.yaml")
-        self.slot_tmpl = slots_loader.load_slot_template(data_root / "slots.yaml")
-        self.class_catalog = classes_loader.load_class_catalog(data_root / "classes.yaml")
-        self.trait_catalog = traits_loader.load_trait_catalog(data_root / "traits.yaml")
-        self.appearance_fields = appearance_loader.load_appearance_fields(
-            data_root / "appearance" / "fields.yaml"
-        )
-        self.appearance_defaults = appearance_loader.load_appearance_defaults(
-            data_root / "appearance" / "defaults.yaml"
-        )
-        self.resources = resources_loader.load_resources(data_root / "resources.yaml")
-        self.progression = progression_loader.load_progression(data_root / "progression.yaml")
-        self.race_catalog = races_loader.load_race_catalog(data_root / "races.yaml")
-        import yaml
-
-        self.formulas = yaml.safe_load(open(data_root / "formulas.yaml", "r", encoding="utf-8"))
+        load_snapshot(data_root)  # pre-fills the registry when a fresh compiled snapshot exists
+        catalogs = shared_registry(data_root)
+        self.stat_tmpl = catalogs.get("stats")
+        self.slot_tmpl = catalogs.get("slots")
+        self.class_catalog = catalogs.get("classes")
+        self.trait_catalog = catalogs.get("traits")
+        self.appearance_fields = catalogs.get("appearance_fields")
+        self.appearance_defaults = catalogs.get("appearance_defaults")
+        self.resources = catalogs.get("resources")
+        self.progression = catalogs.get("progression")
+        self.race_catalog = catalogs.get("races")
+        self.formulas = catalogs.get("formulas")
 
         self.balance_cfg = {}
         self.balance_prof = None
-        if difficulty_loader and current_profile:
+        if current_profile:
             try:
-                self.balance_cfg = difficulty_loader.load_difficulty(data_root / "difficulty.yaml")
+                self.balance_cfg = catalogs.get("difficulty")
                 self.balance_prof = current_profile(self.balance_cfg)
             except Exception:
                 pass
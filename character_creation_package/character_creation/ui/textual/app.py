@@ -10,28 +10,14 @@ from textual.screen import Screen
 from textual.containers import Vertical, Horizontal
 from textual.widgets import Static, Input, ListView, ListItem, Checkbox, Button
 
-from ...loaders import (
-    stats_loader,
-    classes_loader,
-    traits_loader,
-    races_loader,
-    slots_loader,
-    appearance_loader,
-    resources_loader,
-)
-from ...loaders import difficulty_loader
 from . import state
 from ...services.appearance_logic import get_enum_values, get_numeric_bounds
-from ...loaders.yaml_utils import load_yaml
-from ...loaders.content_packs_loader import (
-    load_packs_config,
-    load_and_merge_enabled_packs,
-    merge_catalogs,
-)
+from ...services.catalog_registry import shared_registry
+from ...services.catalog_snapshot import load_snapshot
+from ...loaders.content_packs_loader import merge_catalogs
 from ...services.live_reload import CatalogReloader
 from ...services.balance import current_profile
 
-
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 
 
@@ -553,46 +539,33 @@ class CreationApp(App):
         self.traits_max: int = 2
 
     def on_mount(self) -> None:
-        # Load all YAML at startup
-        stats_path = DATA_DIR / "stats" / "stats.yaml"
-        classes_path = DATA_DIR / "classes.yaml"
-        traits_path = DATA_DIR / "traits.yaml"
-        races_path = DATA_DIR / "races.yaml"
-        slots_path = DATA_DIR / "slots.yaml"
-        fields_path = DATA_DIR / "appearance" / "fields.yaml"
-        defaults_path = DATA_DIR / "appearance" / "defaults.yaml"
-        resources_path = DATA_DIR / "resources.yaml"
-        limits_path = DATA_DIR / "creation_limits.yaml"
-        formulas_path = DATA_DIR / "formulas.yaml"
-        difficulty_path = DATA_DIR / "difficulty.yaml"
-
-        self.stat_tmpl = stats_loader.load_stat_template(stats_path)
-        self.class_catalog = classes_loader.load_class_catalog(classes_path)
-        self.trait_catalog = traits_loader.load_trait_catalog(traits_path)
-        self.race_catalog = races_loader.load_race_catalog(races_path)
-        self.slot_tmpl = slots_loader.load_slot_template(slots_path)
-        self.appearance_fields = appearance_loader.load_appearance_fields(fields_path)
-        self.appearance_defaults = appearance_loader.load_appearance_defaults(defaults_path)
-        self.resources = resources_loader.load_resources(resources_path)
+        # Load all YAML at startup (parsed once per process, shared with other entry points);
+        # a fresh compiled snapshot (worldseed-compile-data) pre-fills the registry
+        load_snapshot(DATA_DIR)
+        catalogs = shared_registry(DATA_DIR)
+        self.stat_tmpl = catalogs.get("stats")
+        self.class_catalog = catalogs.get("classes")
+        self.trait_catalog = catalogs.get("traits")
+        self.race_catalog = catalogs.get("races")
+        self.slot_tmpl = catalogs.get("slots")
+        self.appearance_fields = catalogs.get("appearance_fields")
+        self.appearance_defaults = catalogs.get("appearance_defaults")
+        self.resources = catalogs.get("resources")
         # Formulas
         try:
-            with open(formulas_path, "r", encoding="utf-8") as f:
-                self.formulas = yaml.safe_load(f) or {}
+            self.formulas = catalogs.get("formulas") or {}
         except Exception:
             self.formulas = {}
         # Difficulty profile
         try:
-            self.balance_cfg = difficulty_loader.load_difficulty(difficulty_path)
+            self.balance_cfg = catalogs.get("difficulty")
             self.balance_profile = current_profile(self.balance_cfg)
         except Exception:
             self.balance_cfg = {"current": "normal", "difficulties": {}}
             self.balance_profile = None
         # Load creation limits (optional)
         try:
-            if limits_path.exists():
-                data = load_yaml(limits_path)
-            else:
-                data = {}
+            data = catalogs.get("creation_limits")
             lm = data.get("limits", data) if isinstance(data, dict) else {}
             self.traits_max = int(lm.get("traits_max", 2))
         except Exception:
@@ -600,8 +573,8 @@ class CreationApp(App):
 
         # Apply content packs (if any)
         try:
-            packs_cfg = load_packs_config(DATA_DIR / "content_packs.yaml")
-            merged_overlay = load_and_merge_enabled_packs(DATA_DIR, packs_cfg)
+            packs_cfg = catalogs.get("content_packs")
+            merged_overlay = catalogs.pack_overlay()
             if merged_overlay:
                 policy = packs_cfg.get("merge", {}).get("on_conflict", "skip")
                 base = {
@@ -87,6 +87,11 @@ def build_character_from_selections(
     return hero
 
 
+def _plain_stats(stats: Any) -> Dict[str, Any]:
+    # StatBlock -> plain dict so the summary stays simple data
+    return stats.to_dict() if hasattr(stats, "to_dict") else dict(stats or {})
+
+
 def summarize_character(
     hero: Any,
     starter_classes: List[Dict[str, Any]],
@@ -142,7 +147,7 @@ def summarize_character(
         "stat_points": getattr(hero, "stat_points", None),
         "hp": getattr(hero, "hp", None),
         "mana": getattr(hero, "mana", None),
-        "core_stats": getattr(hero, "stats", {}),
+        "core_stats": _plain_stats(getattr(hero, "stats", {})),
         "appearance_peek": appearance_peek,
     }
 
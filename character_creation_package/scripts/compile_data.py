@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+from character_creation.services.catalog_snapshot import (
+    compile_snapshot,
+    default_snapshot_path,
+)
+from character_creation.services.validate_data import DataValidationError
+
+
+def main(argv: list[str] | None = None) -> int:
+    default_root = Path(__file__).parents[1] / "character_creation" / "data"
+    ap = argparse.ArgumentParser(
+        description="Compile the validated, merged catalogs into one snapshot file."
+    )
+    ap.add_argument("--data-root", type=Path, default=default_root, help="data directory")
+    ap.add_argument(
+        "-o", "--out", type=Path, help="snapshot path (default: <data-root>/catalogs.snapshot)"
+    )
+    args = ap.parse_args(argv)
+    out = args.out or default_snapshot_path(args.data_root)
+    t0 = time.perf_counter()
+    try:
+        compile_snapshot(args.data_root, out)
+    except DataValidationError as e:
+        print(f"Validation failed: {e}")
+        return 1
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+    size = out.stat().st_size
+    print(f"Wrote {out} ({size} bytes) in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
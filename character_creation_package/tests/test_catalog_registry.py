@@ -0,0 +1,56 @@
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+import yaml
+
+from character_creation.services.catalog_registry import (
+    CatalogRegistry,
+    FrozenDict,
+    shared_registry,
+)
+from character_creation.services.live_reload import CatalogReloader
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+def test_named_catalogs_parse_once_and_are_read_only():
+    reg = CatalogRegistry(DATA_ROOT)
+    classes = reg.get("classes")
+    assert reg.get("classes") is classes
+    assert reg.loads == 1
+    with pytest.raises(TypeError):
+        classes["classes"].append({"id": "x"})
+    with pytest.raises(TypeError):
+        reg.get("stats")["STR"]["initial"] = 9
+    # copies are ordinary, mutable containers
+    stats = {k: v.copy() for k, v in reg.get("stats").items()}
+    stats["STR"]["initial"] += 1
+    assert type(stats["STR"]) is dict
+    # and frozen values still round-trip through YAML / pickle
+    assert yaml.safe_load(yaml.safe_dump(classes)) == classes
+    assert isinstance(pickle.loads(pickle.dumps(classes)), FrozenDict)
+
+
+def test_changed_file_is_reparsed(tmp_path):
+    path = tmp_path / "difficulty.yaml"
+    path.write_text("balance: {current: normal, difficulties: {normal: {}}}\n", encoding="utf-8")
+    reg = CatalogRegistry(tmp_path)
+    assert reg.get("difficulty")["current"] == "normal"
+    path.write_text("balance: {current: hard, difficulties: {hard: {}}}\n", encoding="utf-8")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert reg.get("difficulty")["current"] == "hard"
+    assert reg.get("difficulty")["current"] == "hard"
+    assert reg.loads == 2
+    with pytest.raises(KeyError):
+        reg.get("nope")
+
+
+def test_reloader_shares_the_registry():
+    cats = CatalogReloader(DATA_ROOT).reload_once()
+    assert cats["stats"] is shared_registry(DATA_ROOT).get("stats")
+    before = shared_registry(DATA_ROOT).loads
+    CatalogReloader(DATA_ROOT).reload_once()
+    assert shared_registry(DATA_ROOT).loads == before
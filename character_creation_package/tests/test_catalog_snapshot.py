@@ -0,0 +1,49 @@
+import pickle
+import shutil
+from pathlib import Path
+
+from character_creation.services.catalog_registry import shared_registry
+from character_creation.services.catalog_snapshot import (
+    compile_snapshot,
+    load_catalogs,
+    load_snapshot,
+)
+from character_creation.services.live_reload import CatalogReloader
+from scripts import compile_data
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+def _copy(tmp_path, name):
+    root = tmp_path / name
+    shutil.copytree(DATA_ROOT, root)
+    return root
+
+
+def test_snapshot_round_trip_seeds_registry(tmp_path):
+    src = _copy(tmp_path, "src")
+    path = compile_snapshot(src, tmp_path / "cats.snapshot")
+    expected = CatalogReloader(src).reload_once()
+    # a second, identical tree has its own (empty) registry
+    dst = _copy(tmp_path, "dst")
+    assert load_snapshot(dst, path)
+    assert CatalogReloader(dst).reload_once() == expected
+    reg = shared_registry(dst)
+    reg.get("classes"), reg.get("difficulty"), reg.pack_overlay()
+    assert reg.loads == 0
+
+
+def test_stale_or_broken_snapshot_falls_back_to_yaml(tmp_path):
+    root = _copy(tmp_path, "data")
+    assert compile_data.main(["--data-root", str(root)]) == 0
+    snap = root / "catalogs.snapshot"
+    assert load_snapshot(root)
+    traits = root / "traits.yaml"
+    traits.write_text(traits.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    assert not load_snapshot(root)
+    assert load_catalogs(root)["trait_catalog"]["traits"]
+    snap.write_bytes(b"not json")
+    assert not load_snapshot(root)
+    # a pickle in the data dir is data, never unpickled
+    snap.write_bytes(pickle.dumps({"format": 2}))
+    assert not load_snapshot(root)
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+from character_creation import Character
+from character_creation.loaders import save_loader
+from character_creation.models.npc_factory import NpcTables, generate_npcs
+from character_creation.services.character_repository import CharacterRepository
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+@pytest.fixture(scope="module")
+def npcs():
+    heroes = list(generate_npcs(30, NpcTables.from_data(DATA_ROOT), seed=4))
+    for i, hero in enumerate(heroes):
+        hero.level = 1 + i % 5
+        hero.race = "elf" if i % 3 == 0 else "human"
+        hero.difficulty = "hard" if i % 2 else "normal"
+    return heroes
+
+
+@pytest.fixture
+def repo(tmp_path):
+    with CharacterRepository(tmp_path / "chars.db") as repo:
+        yield repo
+
+
+def test_roundtrip_and_wal(repo, npcs):
+    char_id = repo.save(npcs[0])
+    assert repo.load(char_id) == npcs[0]
+    mode = repo._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+    with pytest.raises(KeyError):
+        repo.load(char_id + 100)
+
+
+def test_save_many_batches_and_query(repo, npcs):
+    ids = repo.save_many(npcs, batch_size=7)
+    assert ids == list(range(1, len(npcs) + 1))
+    assert len(repo) == len(npcs)
+    assert list(repo.load_many(ids[::-1], chunk_size=4)) == npcs[::-1]
+
+    elves = repo.query(race="elf", level=(2, 4), order_by="id")
+    expected = [i + 1 for i, h in enumerate(npcs) if h.race == "elf" and 2 <= h.level <= 4]
+    assert [s.id for s in elves] == expected
+    assert all(s.race == "elf" for s in elves)
+
+    class_id = npcs[0].classes[0]
+    by_class = repo.query(class_id=class_id, difficulty="hard")
+    assert {s.id for s in by_class} == {
+        i + 1 for i, h in enumerate(npcs) if class_id in h.classes and h.difficulty == "hard"
+    }
+    assert repo.count(class_id=class_id) == sum(class_id in h.classes for h in npcs)
+
+    prefix = npcs[5].name[:8]
+    assert npcs[5].name in {s.name for s in repo.query(name_prefix=prefix)}
+    assert [s.name for s in repo.query(limit=3)] == sorted(h.name for h in npcs)[:3]
+
+
+def test_update_and_delete(repo, npcs):
+    char_id = repo.save(npcs[1])
+    hero = repo.load(char_id)
+    hero.level = 9
+    hero.classes = ["wizard", "rogue"]
+    assert repo.save(hero, char_id) == char_id
+    assert repo.load(char_id).level == 9
+    assert [s.id for s in repo.query(class_id="rogue")] == [char_id]
+    assert repo.delete(char_id)
+    assert not repo.delete(char_id)
+    assert repo.query(class_id="rogue") == []
+    assert len(repo) == 0
+    with pytest.raises(ValueError):
+        repo.save_many(npcs[:3], ids=[1, 2])
+    assert len(repo) == 0
+
+
+def test_import_files_and_reopen(tmp_path, npcs):
+    paths = []
+    for i, hero in enumerate(npcs[:4]):
+        path = tmp_path / f"hero_{i}{('.yaml', '.json')[i % 2]}"
+        save_loader.save_character(hero, path)
+        paths.append(path)
+    db = tmp_path / "chars.db"
+    with CharacterRepository(db) as repo:
+        ids = repo.import_files(paths)
+    with CharacterRepository(db, Character) as repo:
+        assert list(repo.load_many(ids)) == npcs[:4]
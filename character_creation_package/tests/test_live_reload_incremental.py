@@ -0,0 +1,125 @@
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from character_creation.services import live_reload
+from character_creation.services.live_reload import CatalogReloader, ReloadScheduler
+from character_creation.services.validate_data import DataValidationError
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+def _touch_write(path: Path, text: str) -> None:
+    # bump mtime explicitly: fast consecutive writes can share a timestamp
+    old = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text, encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, max(st.st_mtime_ns, old + 1_000_000)))
+
+
+@pytest.fixture
+def data(tmp_path):
+    root = tmp_path / "data"
+    shutil.copytree(DATA_ROOT, root)
+    return root
+
+
+def test_pack_edit_reparses_only_that_pack(data):
+    rel = CatalogReloader(data)
+    rel.reload_once()
+    classes = data / "content_packs" / "starter_pack" / "classes.yaml"
+    _touch_write(
+        classes,
+        classes.read_text(encoding="utf-8")
+        + "  - id: tinker\n    name: Tinker\n    grants_stats: {INT: 1.0}\n"
+        + "    grants_abilities: [Gadget]\n",
+    )
+    cats = rel.reload_once([str(classes), str(data / "dev_config.yaml")])
+    assert "tinker" in [c["id"] for c in cats["class_catalog"]["classes"]]
+    info = rel.last_reload
+    assert not info["full"] and info["packs"] == ["starter_pack"]
+    assert "stats" not in info["touched"] and "class_catalog" in info["touched"]
+    # same result as a rebuild from scratch
+    assert cats == CatalogReloader(data).reload_once()
+
+
+def test_unrelated_change_keeps_catalogs_and_version(data):
+    rel = CatalogReloader(data)
+    cats = rel.reload_once()
+    assert rel.reload_once([str(data / "dev_config.yaml")]) is cats
+    assert rel.version == 1
+
+
+def test_table_and_slot_changes_validate_their_cross_refs(data):
+    rel = CatalogReloader(data)
+    rel.reload_once()
+    table = data / "appearance" / "tables" / "genders.yaml"
+    _touch_write(table, "values: [a, b]\n")
+    cats = rel.reload_once([str(table)])
+    assert cats["appearance_tables"]["genders"][:2] == ["a", "b"]
+    assert "table:genders" in rel.last_reload["validated"]
+    slots = data / "slots.yaml"
+    _touch_write(slots, slots.read_text(encoding="utf-8"))
+    rel.reload_once([str(slots)])
+    assert {"slots", "items_catalog"} <= set(rel.last_reload["validated"])
+
+
+def test_invalid_edit_keeps_last_good_state(data):
+    rel = CatalogReloader(data)
+    good = rel.reload_once()
+    traits = data / "traits.yaml"
+    _touch_write(traits, "traits: {bad: {name: Bad}}\n")
+    with pytest.raises(DataValidationError):
+        rel.reload_once([str(traits)])
+    assert rel.version == 1 and rel._last_ok is good
+
+
+def test_scheduler_coalesces_a_burst_into_one_reload():
+    calls = []
+    sched = ReloadScheduler(lambda batch: calls.append(set(batch)), quiet_ms=80)
+    for i in range(20):
+        sched.add([f"f{i}.yaml"])
+    assert sched.wait_idle(5)
+    sched.close()
+    assert calls == [{f"f{i}.yaml" for i in range(20)}]
+
+
+def test_scheduler_caps_delay_and_never_overlaps():
+    state = {"running": 0, "overlap": False}
+    batches = []
+
+    def slow_reload(batch):
+        state["running"] += 1
+        state["overlap"] |= state["running"] > 1
+        time.sleep(0.03)
+        batches.append(batch)
+        state["running"] -= 1
+
+    sched = ReloadScheduler(slow_reload, quiet_ms=100, max_delay_ms=120)
+    for i in range(40):  # a change every 10ms never leaves a 100ms quiet gap
+        sched.add([i])
+        time.sleep(0.01)
+    sched.close()
+    assert len(batches) >= 2 and not state["overlap"]
+    assert set().union(*batches) == set(range(40))
+
+
+def test_watch_bulk_edit_reloads_once(data, monkeypatch):
+    classes = data / "classes.yaml"
+    traits = data / "traits.yaml"
+
+    def fake_watch(path, recursive=True):
+        for p in (classes, traits, classes):
+            _touch_write(p, p.read_text(encoding="utf-8"))
+            yield {(2, str(p))}
+
+    monkeypatch.setattr(live_reload, "WATCHFILES_AVAILABLE", True)
+    monkeypatch.setattr(live_reload, "watch", fake_watch, raising=False)
+    rel = CatalogReloader(data)
+    rel.reload_once()
+    seen = []
+    rel.watch(lambda cats, version, changes: seen.append((version, changes)), debounce_ms=50)
+    assert seen == [(2, sorted({(2, str(classes)), (2, str(traits))}, key=str))]
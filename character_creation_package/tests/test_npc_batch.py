@@ -0,0 +1,41 @@
+import random
+from pathlib import Path
+
+from character_creation.loaders import yaml_utils
+from character_creation.models import npc_factory
+from character_creation.models.npc_factory import NpcTables, derive_seed, generate_npcs
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+def _summary(npc):
+    return (npc.name, npc.classes, npc.traits, dict(npc.appearance), npc.stats["HP"])
+
+
+def test_batch_is_reproducible_for_any_worker_count():
+    tables = NpcTables.from_data(DATA_ROOT)
+    one = [_summary(n) for n in generate_npcs(40, tables, seed=7, chunk_size=8)]
+    two = [_summary(n) for n in generate_npcs(40, tables, seed=7, workers=2, chunk_size=8)]
+    assert one == two
+    assert len({name for name, *_ in one}) == 40
+    assert one[3][0] == f"NPC_{derive_seed(7, 3):016x}"
+    assert [_summary(n) for n in generate_npcs(5, tables, seed=8)] != one[:5]
+
+
+def test_batch_leaves_global_random_state_alone():
+    tables = NpcTables.from_data(DATA_ROOT)
+    state = random.getstate()
+    list(generate_npcs(10, tables, seed=1))
+    assert random.getstate() == state
+
+
+def test_batch_reads_no_files_after_loading_tables(monkeypatch):
+    tables = NpcTables.from_data(DATA_ROOT)
+
+    def no_io(*args, **kwargs):
+        raise AssertionError("YAML read during generation")
+
+    monkeypatch.setattr(yaml_utils, "load_yaml", no_io)
+    monkeypatch.setattr(npc_factory.uuid, "uuid4", no_io)
+    npcs = list(generate_npcs(20, tables, name_prefix="Guard", seed=3))
+    assert all(n.name.startswith("Guard_") and n.classes for n in npcs)
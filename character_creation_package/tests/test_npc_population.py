@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from character_creation.models.npc_factory import NpcTables
+from character_creation.services import formula_eval
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+def test_population_columns_match_formulas_and_catalogs():
+    np = pytest.importorskip("numpy")
+    from character_creation.models.npc_population import generate_population, unpack_bits
+
+    tables = NpcTables.from_data(DATA_ROOT)
+    pop = generate_population(2000, tables, seed=11)
+    assert len(pop) == 2000
+    assert pop.cols["stat:STR"].dtype == np.float32 and pop.cols["class"].dtype == np.int16
+    assert set(np.unique(pop.cols["class"]).tolist()) == set(range(len(tables.class_catalog)))
+    heights = pop.cols["app:height_cm"]
+    assert heights.min() >= 140.0 and heights.max() <= 210.0
+    assert abs(float(heights.mean()) - 170.0) < 2.0
+    # trait bitsets agree with the ordered picks, at most two distinct traits
+    n_traits = len(pop.dictionaries["trait"])
+    for row in range(50):
+        picked = pop.traits(row)
+        assert len(picked) == len(set(picked)) <= 2
+        bits = unpack_bits(pop.cols["traits"][row], n_traits)
+        assert sorted(pop.dictionaries["trait"][j] for j in bits) == sorted(picked)
+    # same seed, same table
+    again = generate_population(2000, tables, seed=11)
+    assert all(np.array_equal(pop.cols[k], again.cols[k]) for k in pop.cols)
+
+
+def test_population_rows_materialize_as_characters():
+    pytest.importorskip("numpy")
+    from character_creation.models.npc_population import generate_population
+
+    tables = NpcTables.from_data(DATA_ROOT)
+    pop = generate_population(10, tables, seed=3, name_prefix="Villager")
+    hero = pop.character(4)
+    assert hero.name == pop.name(4) and hero.name.startswith("Villager_")
+    assert hero.classes == [pop.dictionaries["class"][int(pop.cols["class"][4])]]
+    assert hero.traits == pop.traits(4)
+    assert set(hero.appearance) == set(tables.appearance_fields)
+    ctx = {"level": hero.level}
+    ctx.update({k: v for k, v in hero.stats.items() if not isinstance(v, dict)})
+    assert hero.stats["HP"]["base"] == int(
+        formula_eval.evaluate(tables.formulas["baseline"]["hp"], ctx)
+    )
+    assert len(list(pop.characters([0, 1, 2]))) == 3
+
+
+def test_evaluate_columns_matches_scalar_evaluate():
+    np = pytest.importorskip("numpy")
+    expr = "20 + STA * 5 + floor(level / 2)"
+    sta = np.array([1.0, 1.3, 2.5])
+    level = np.array([1.0, 4.0, 7.0])
+    got = formula_eval.evaluate_columns(expr, {"STA": sta, "level": level})
+    want = [formula_eval.evaluate(expr, {"STA": s, "level": lv}) for s, lv in zip(sta, level)]
+    assert got.tolist() == want
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import pytest
+
+from character_creation.models.npc_factory import NpcTables, generate_npcs
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+@pytest.fixture
+def store():
+    np = pytest.importorskip("numpy")
+    from character_creation.models.npc_population import generate_population
+    from character_creation.models.population_store import PopulationStore
+
+    pop = generate_population(3000, NpcTables.from_data(DATA_ROOT), seed=21)
+    regions = ["north", "south", "east"]
+    store = PopulationStore.from_population(pop, location=[regions[i % 3] for i in range(3000)])
+    store.set_level(np.arange(0, 3000, 2), 6)
+    return store
+
+
+def _brute(store, cls, lo, hi, region):
+    out = []
+    for row in range(len(store)):
+        v = store.view(row)
+        if v.classes == [cls] and lo <= v.level <= hi and v.location == region:
+            out.append(row)
+    return out
+
+
+def test_store_columns_are_compact(store):
+    np = pytest.importorskip("numpy")
+    assert store.cols["stat:STR"].dtype == np.float32
+    assert store.cols["class"].dtype == np.int16 and store.cols["traits"].dtype == np.uint64
+    assert "name_bytes" not in store.cols  # generated names are derived, not stored
+
+
+def test_indexed_query_matches_a_scan(store):
+    rows = store.query(class_id="mage", level=(5, 8), location="north")
+    assert rows.tolist() == _brute(store, "mage", 5, 8, "north")
+    assert len(rows) > 0
+    assert store.query(class_id="nope").tolist() == []
+    both = store.query(class_id=["mage", "thief"], level=1)
+    np = pytest.importorskip("numpy")
+    assert store.query(level=np.int64(1)).tolist() == store.query(level=1).tolist()
+    assert all(store.view(r).classes[0] in ("mage", "thief") for r in both)
+    trait = store.dictionaries["trait"][0]
+    assert all(trait in store.view(r).traits for r in store.query(traits=[trait]))
+
+
+def test_updates_drop_stale_indexes(store):
+    before = store.query(location="west").tolist()
+    rows = store.query(class_id="mage", location="north")[:5]
+    store.view(int(rows[0])).location = "west"
+    store.move(rows[1:], "west")
+    assert before == [] and store.query(location="west").tolist() == sorted(rows.tolist())
+    view = store.view(int(rows[0]))
+    view.level = 9
+    assert int(rows[0]) in store.query(level=9).tolist()
+
+
+def test_view_materializes_and_store_roundtrips_via_mmap(store, tmp_path):
+    np = pytest.importorskip("numpy")
+    from character_creation.models.population_store import PopulationStore
+
+    hero = store.view(10).to_character()
+    assert hero.name == store.view(10).name and hero.classes == store.view(10).classes
+    store.save(tmp_path / "pop")
+    opened = PopulationStore.open(tmp_path / "pop")
+    assert isinstance(opened.cols["level"], np.memmap)
+    assert opened.view(10).to_character() == hero
+    q = dict(class_id="mage", level=(5, 8), location="north")
+    assert opened.query(**q).tolist() == store.query(**q).tolist()
+    with pytest.raises(ValueError):
+        opened.move([0], "south")  # read-only map
+    writable = PopulationStore.open(tmp_path / "pop", mode="r+")
+    writable.move([0], "south")
+    writable.flush()
+    assert PopulationStore.open(tmp_path / "pop").view(0).location == "south"
+
+    # a location the saved dictionaries do not know yet reaches store.json on flush()
+    writable.move([1, 2], "harbor")
+    writable.flush()
+    reopened = PopulationStore.open(tmp_path / "pop")
+    assert [reopened.view(r).location for r in (0, 1, 2)] == ["south", "harbor", "harbor"]
+    assert reopened.query(location="harbor").tolist() == [1, 2]
+
+
+def test_store_from_characters():
+    pytest.importorskip("numpy")
+    from character_creation.models.population_store import PopulationStore
+
+    npcs = list(generate_npcs(12, NpcTables.from_data(DATA_ROOT), seed=4))
+    store = PopulationStore.from_characters(npcs, locations="town")
+    for npc, view in zip(npcs, store.views()):
+        hero = view.to_character()
+        assert (hero.name, hero.classes, hero.abilities) == (npc.name, npc.classes, npc.abilities)
+        assert sorted(hero.traits) == sorted(npc.traits)
+        assert hero.stats["HP"]["base"] == npc.stats["HP"]["base"]
+        assert view.location == "town"
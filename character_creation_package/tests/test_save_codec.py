@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from character_creation import Character
+from character_creation.errors import SaveFormatError
+from character_creation.loaders import save_loader
+from character_creation.models.npc_factory import NpcTables, generate_npcs
+from character_creation.services.catalog_registry import shared_registry
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+@pytest.fixture(scope="module")
+def npcs():
+    return list(generate_npcs(5, NpcTables.from_data(DATA_ROOT), seed=9))
+
+
+def _loaded(hero):
+    hero.inventory = [f"item_{i}" for i in range(200)]
+    hero.active_effects = [
+        {"name": "bleed", "data": {"duration": 5, "tick_damage": 1.5}, "start_time": 1.0}
+    ]
+    hero.equipped_abilities = {"Parry", "Block"}
+    return hero
+
+
+@pytest.mark.parametrize("suffix", [".yaml", ".json", ".wsc", ".sav"])
+def test_roundtrip_by_extension(tmp_path, npcs, suffix):
+    hero = _loaded(npcs[0])
+    path = tmp_path / f"hero{suffix}"
+    hero.save(path)
+    assert Character.load(path) == hero
+    if suffix == ".json":
+        record = json.loads(path.read_text(encoding="utf-8"))
+        assert record["schema"] == save_loader.SAVE_SCHEMA
+        assert record["equipped_abilities"] == ["Block", "Parry"]
+    if suffix == ".wsc":
+        assert path.read_bytes()[:4] == save_loader.STREAM_MAGIC
+
+
+@pytest.mark.parametrize("suffix", [".yaml", ".json"])
+def test_effects_from_the_registry_save(tmp_path, npcs, suffix):
+    hero = save_loader.record_to_character(save_loader.character_to_record(npcs[2]), Character)
+    poison = shared_registry(DATA_ROOT).get("status_effects")["poison"]  # a FrozenDict
+    hero.apply_status_effect("poison", poison, 0.0)
+    path = tmp_path / f"hero{suffix}"
+    hero.save(path)
+    assert Character.load(path) == hero
+
+
+def test_legacy_unversioned_saves_migrate(tmp_path, npcs):
+    hero = npcs[1]
+    legacy = hero.to_dict()
+    legacy["xp_to_next_level"] = 100  # older NPC saves carried this attribute
+    path = tmp_path / "old.yaml"
+    path.write_text(yaml.safe_dump(legacy), encoding="utf-8")  # sets as !!set, no schema
+    assert Character.load(path) == hero
+    json_path = tmp_path / "old.json"
+    legacy.pop("xp_to_next_level")
+    legacy["abilities"] = sorted(legacy["abilities"])
+    legacy["equipped_abilities"] = []
+    json_path.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+    assert Character.from_json(json_path) == hero
+
+
+def test_newer_schema_is_rejected(tmp_path, npcs):
+    record = save_loader.character_to_record(npcs[0])
+    record["schema"] = save_loader.SAVE_SCHEMA + 1
+    path = tmp_path / "future.json"
+    path.write_text(json.dumps(record), encoding="utf-8")
+    with pytest.raises(SaveFormatError):
+        Character.load(path)
+
+
+def test_stream_many_characters(tmp_path, npcs):
+    path = tmp_path / "town.wsc"
+    assert save_loader.write_characters(path, iter(npcs)) == len(npcs)
+    stream = save_loader.iter_characters(path, Character)
+    assert next(stream) == npcs[0]
+    assert list(stream) == npcs[1:]
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(SaveFormatError):
+        list(save_loader.iter_characters(path, Character))
+    (tmp_path / "bad.wsc").write_bytes(b"nope")
+    with pytest.raises(SaveFormatError):
+        Character.load(tmp_path / "bad.wsc")
@@ -0,0 +1,99 @@
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from character_creation import Character
+from character_creation.loaders import stats_loader, yaml_utils
+from character_creation.models.stat_block import PoolView, StatBlock
+
+DATA_ROOT = Path(__file__).parents[1] / "character_creation" / "data"
+
+
+@pytest.fixture(scope="module")
+def stat_tmpl():
+    return stats_loader.load_stat_template(DATA_ROOT / "stats" / "stats.yaml")
+
+
+def test_stat_block_behaves_like_the_old_stats_dict(stat_tmpl):
+    stats = StatBlock.from_template(stat_tmpl)
+    assert list(stats) == list(stat_tmpl) and stats["STR"] == stat_tmpl["STR"]["initial"]
+    assert stats.layout is StatBlock.from_template(stat_tmpl).layout
+    stats["HP"] = {"base": 30, "current": 12}
+    assert isinstance(stats["HP"], PoolView) and stats["HP"] == {"base": 30.0, "current": 12.0}
+    stats["HP"]["current"] = 20
+    assert stats.value("HP") == 20.0 and stats.base_value("HP") == 30.0
+    stats.add("STR", 0.5)
+    stats.add("LUCK", 1.0)  # unknown names extend the layout
+    assert stats["STR"] == 1.5 and stats.get("LUCK") == 1.0 and "LUCK" in stats
+    plain = stats.to_dict()
+    assert plain["HP"] == {"base": 30.0, "current": 20.0} and type(plain["STR"]) is float
+    assert stats == plain and StatBlock(plain) == stats
+    assert pickle.loads(pickle.dumps(stats)) == stats
+    del stats["LUCK"]
+    assert list(stats) == [k for k in plain if k != "LUCK"]
+
+
+def test_character_is_slotted_and_keeps_its_constructor():
+    hero = Character("Ann", {"STR": 1.0}, {}, level=3)
+    assert not hasattr(hero, "__dict__")
+    with pytest.raises(AttributeError):
+        hero.nickname = "A"
+    assert isinstance(hero.stats, StatBlock) and hero.classes == [] and hero.level == 3
+    hero.stats = {"STR": 2.0, "Mana": {"base": 10, "current": 5}}
+    assert isinstance(hero.stats, StatBlock) and hero.get_effective_stat("str") == 2.0
+    with pytest.raises(TypeError):
+        Character("Ann", {}, {}, bogus=1)
+    with pytest.raises(TypeError):
+        Character("Ann", {})
+    assert pickle.loads(pickle.dumps(hero)) == hero
+
+
+def test_refresh_derived_keeps_percent_on_pools(stat_tmpl):
+    formulas = yaml_utils.load_yaml(DATA_ROOT / "formulas.yaml")
+    hero = Character("Ann", StatBlock.from_template(stat_tmpl), {})
+    hero.refresh_derived(formulas, stat_tmpl, keep_percent=False)
+    base = hero.hp_max
+    hero.stats["HP"]["current"] = base / 2
+    hero.increase_stat("STA", 2.0)
+    hero.refresh_derived(formulas, stat_tmpl, keep_percent=True)
+    assert hero.hp_max == base + 10 and hero.hp == pytest.approx(hero.hp_max / 2)
+    assert hero.stats["HP"] == {"base": hero.hp_max, "current": hero.hp}
+
+
+def test_saves_store_plain_stats(tmp_path, stat_tmpl):
+    hero = Character("Ann", StatBlock.from_template(stat_tmpl), {"STR": 5.0})
+    hero.stats.set_pool("HP", 25, 20)
+    hero.save(tmp_path / "ann.yaml")
+    raw = yaml_utils.load_yaml(tmp_path / "ann.yaml")
+    assert raw["stats"]["HP"] == {"base": 25.0, "current": 20.0}
+    assert Character.load(tmp_path / "ann.yaml") == hero
+
+
+def test_character_containers_are_lazy(stat_tmpl):
+    hero = Character("Lazy", StatBlock.from_template(stat_tmpl), {"STR": 0.0})
+    assert hero.to_dict()["inventory"] == []
+    assert hero == Character("Lazy", hero.stats, {"STR": 0.0}, inventory=[])
+    clone = pickle.loads(pickle.dumps(hero))
+    assert clone == hero and clone.to_dict() == hero.to_dict()
+    hero.inventory.append("rope")
+    assert hero.inventory == ["rope"] and clone.inventory == []
+
+
+def test_fixed_key_maps_are_plain_dicts(stat_tmpl):
+    hero = Character("Ann", StatBlock.from_template(stat_tmpl), {"STR": 0.0})
+    hero.init_equipment_slots({"slots": {"head": {}, "hand_main": {}}})
+    hero.init_appearance({"hair": {"default": "brown"}, "eyes": {"default": "grey"}})
+    for field in (hero.stat_xp, hero.equipment, hero.appearance):
+        assert type(field) is dict
+    assert json.loads(json.dumps(hero.appearance)) == {"hair": "brown", "eyes": "grey"}
+    assert hero.equipment | {"ring": "gold_ring"} == {
+        "head": None,
+        "hand_main": None,
+        "ring": "gold_ring",
+    }
+    # delete then re-add moves the key to the end, as for any dict
+    del hero.appearance["hair"]
+    hero.appearance["hair"] = "red"
+    assert list(hero.appearance) == ["eyes", "hair"]
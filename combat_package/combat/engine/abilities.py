@@ -5,8 +5,7 @@ from .combatant import Combatant
 from .rng import RandomSource
 from .resolution import resolve_attack
 from .effects import apply_on_hit_effects, modify_incoming_damage
-from ..loaders.body_parts_loader import load_body_parts
-from pathlib import Path
+from .content import shared_content
 
 
 @dataclass
@@ -74,7 +73,7 @@ def can_use_ability(
 ) -> Tuple[bool, str]:
     # cooldown gate
     cd = int(ability_def.get("cooldown", 0) or 0)
-    if cd > 0 and actor.cooldowns.get(ability_def.get("id", ""), 0) > 0:
+    if cd > 0 and actor.on_cooldown(ability_def.get("id", "")):
         return False, "on_cooldown"
 
     # resource gate
@@ -94,11 +93,14 @@ def execute_ability(
     ability_def: Dict[str, Any],
     target_ids: List[str],
     rng: RandomSource,
+    body_parts: Dict[str, Any] | None = None,
+    status_cfg: Dict[str, Any] | None = None,
 ) -> AbilityUseResult:
     """
     Executes the ability (attack style only, for now).
     Validates targets against ability.targeting.
     Deducts resources and sets cooldown only if execution proceeds.
+    body_parts / status_cfg may be passed preloaded; otherwise they are read from disk.
     Returns events:
       - hit/miss entries: {"type":"hit","actor_id":...,"target_id":...,"ability_id":...,"amount":...,"dtype":...,"crit":bool,"body_part":...}
       - effect entries:   {"type":"effect","actor_id":...,"target_id":...,"effect_id":...}
@@ -135,10 +137,12 @@ def execute_ability(
     # set cooldown
     cd = int(ability_def.get("cooldown", 0) or 0)
     if cd > 0:
-        actor.cooldowns[ability_def.get("id", "")] = cd
+        actor.start_cooldown(ability_def.get("id", ""), cd)
 
     # body parts config
-    body_cfg = load_body_parts(Path(__file__).parents[2] / "data" / "body_parts.yaml")
+    body_cfg = body_parts
+    if body_cfg is None:
+        body_cfg = shared_content().body_parts
 
     # execute (attack-like)
     for tid in apply_to:
@@ -165,7 +169,9 @@ def execute_ability(
                 }
             )
             # on-hit effects
-            for inst in apply_on_hit_effects(actor, tgt, ability_def, _load_status_cfg(), rng):
+            if status_cfg is None:
+                status_cfg = _load_status_cfg()
+            for inst in apply_on_hit_effects(actor, tgt, ability_def, status_cfg, rng):
                 evs.append(
                     {
                         "type": "effect",
@@ -98,8 +98,12 @@ def choose_and_execute(
     ai_rules: Dict[str, Any],
     threat_table,
     rng: RandomSource,
+    body_parts: Dict[str, Any] | None = None,
+    status_cfg: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
     """
+    body_parts / status_cfg are passed through to execute_ability (preloaded configs avoid
+    per-action file reads in long simulations).
     Returns: {"ok": bool, "reason": str, "ability_id": str|None, "target_ids": list[str], "events": list[dict]}
     """
     rules = (ai_rules.get("ai") or {}).get("rules", [])
@@ -125,7 +129,15 @@ def choose_and_execute(
             continue
         # try execution (validates resources/cooldowns internally)
 
-        res = execute_ability(participants, actor, ability_def, t_ids, rng)
+        res = execute_ability(
+            participants,
+            actor,
+            ability_def,
+            t_ids,
+            rng,
+            body_parts=body_parts,
+            status_cfg=status_cfg,
+        )
         if res.ok:
             return {
                 "ok": True,
@@ -0,0 +1,265 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterator, List, Tuple
+import time
+
+from ..loaders.yaml_utils import safe_load_path
+from .ai import choose_and_execute
+from .combatant import Combatant
+from .content import ContentHandle, shared_content
+from .effects import tick_start_of_turn
+from .encounter import Encounter
+from .metrics import MetricsAggregator
+
+DEFAULT_MAX_ROUNDS = 50
+
+Row = Dict[str, Any]
+
+
+def load_scenario(path: str | Path) -> Dict[str, Any]:
+    """
+    Scenario YAML:
+      scenario:
+        id: duel
+        seed: 909            # repetition i runs with seed + i (or list `seeds:` explicitly)
+        max_rounds: 30
+        teams:
+          alpha:
+            - { id: A, name: Aria, location: lava, hp: 26, mana: 6, stats: {...}, count: 1 }
+    """
+    doc = safe_load_path(path) or {}
+    sc = doc.get("scenario") or {}
+    if not sc.get("teams"):
+        raise ValueError(f"{path}: scenario.teams is required.")
+    sc.setdefault("id", Path(path).stem)
+    return sc
+
+
+def build_units(scenario: Dict[str, Any]) -> List[Combatant]:
+    units: List[Combatant] = []
+    for team, specs in (scenario.get("teams") or {}).items():
+        for spec in specs or []:
+            count = int(spec.get("count", 1))
+            for i in range(count):
+                uid = str(spec["id"]) if count == 1 else f"{spec['id']}{i + 1}"
+                units.append(
+                    Combatant(
+                        uid,
+                        str(spec.get("name", uid)),
+                        dict(spec.get("stats") or {}),
+                        hp=float(spec.get("hp", 20)),
+                        mana=float(spec.get("mana", 0)),
+                        resist=dict(spec.get("resist") or {}),
+                        tags=list(spec.get("tags") or []),
+                        team=str(team),
+                        location=str(spec.get("location", "arena")),
+                    )
+                )
+    return units
+
+
+def scenario_seed(scenario: Dict[str, Any], rep: int) -> int:
+    seeds = scenario.get("seeds")
+    if seeds:
+        return int(seeds[rep % len(seeds)]) + (rep // len(seeds)) * 1_000_003
+    return int(scenario.get("seed", 1234)) + rep
+
+
+def play(
+    enc: Encounter,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+    log: Callable[[str], None] | None = None,
+    metrics: MetricsAggregator | None = None,
+    resume: Dict[str, Any] | None = None,
+    on_checkpoint: Callable[[Dict[str, Any]], None] | None = None,
+    checkpoint_turns: int = 0,
+) -> Dict[str, Any]:
+    """
+    AI-driven encounter loop (the run_battle_cli turn order): start_of_round hazards when a
+    round begins, then per actor start_of_turn hazards, DoT tick, choose_and_execute,
+    end_of_turn hazards. Content comes from enc.content, so no
+    YAML is read inside the loop. `log` receives narration lines; leave it None for quiet runs.
+
+    Every `checkpoint_turns` turns, on_checkpoint receives {"start", "turns", "encounter"}
+    (an Encounter.snapshot); passing that dict back as `resume` continues the fight exactly.
+    """
+    from .narration import render_dot_tick, render_hazard_event
+
+    content = enc.content
+    abilities, rules = content.abilities, content.ai_rules
+    effs, body_parts = content.status_effects, content.body_parts
+    narr, hazards_cfg = (content.narration, content.hazards) if log else (None, None)
+    if metrics is not None:
+        enc.subscribe(metrics)
+
+    start = enc._round
+    turns = 0
+    if resume is not None:
+        enc.restore(resume["encounter"])
+        start, turns = int(resume["start"]), int(resume["turns"])
+    n = len(enc.participants)
+    while enc._round - start < max_rounds and len({c.team for c in enc.living()}) > 1:
+        if on_checkpoint is not None and checkpoint_turns > 0 and turns:
+            if turns % checkpoint_turns == 0:
+                on_checkpoint({"start": start, "turns": turns, "encounter": enc.snapshot()})
+        if turns % n == 0:
+            if log:
+                log(f"\n== Round {enc._round - start + 1} ==")
+            # start_of_round hazards, once per round before its first actor (as ArmyBattle)
+            for ev in enc.process_hazards("start_of_round"):
+                if log:
+                    log("• " + render_hazard_event(ev, hazards_cfg, enc.rng))
+        actor = enc.next_turn()
+        turns += 1
+        for ev in enc.process_hazards("start_of_turn"):
+            if log:
+                log("• " + render_hazard_event(ev, hazards_cfg, enc.rng))
+        if not actor.is_alive():
+            continue
+        dots = tick_start_of_turn(actor, effs, enc.rng)
+        enc.emit(
+            [
+                {
+                    "type": "dot",
+                    "target_id": actor.id,
+                    "effect_id": ev["effect_id"],
+                    "dtype": ev.get("dtype"),
+                    "amount": ev["amount"],
+                }
+                for ev in dots
+            ]
+        )
+        if log:
+            for ev in dots:
+                log(
+                    "• "
+                    + render_dot_tick(
+                        actor.name, ev["effect_id"], ev["amount"], effs, narr, enc.rng
+                    )
+                )
+        if actor.is_alive():
+            outcome = choose_and_execute(
+                enc.participants,
+                actor,
+                abilities,
+                rules,
+                enc.threat,
+                enc.rng,
+                body_parts=body_parts,
+                status_cfg=effs,
+            )
+            if outcome["ok"]:
+                if metrics is not None:
+                    metrics.record_cast(outcome["ability_id"])
+                enc.emit(outcome["events"])
+                enc.ingest_events_update_threat(outcome["events"])
+        for ev in enc.process_hazards("end_of_turn"):
+            if log:
+                log("• " + render_hazard_event(ev, hazards_cfg, enc.rng))
+        if turns % n == 0 and metrics is not None:
+            metrics.observe_round(hz.get("id") for hz in enc.env.hazards)
+
+    teams = {c.team for c in enc.living()}
+    return {
+        "ended": len(teams) <= 1,
+        "winner_team": next(iter(teams)) if len(teams) == 1 else None,
+        "rounds": enc._round - start + (1 if turns % n else 0),
+        "turns": turns,
+    }
+
+
+def run_one(
+    scenario: Dict[str, Any],
+    rep: int,
+    content: ContentHandle | None = None,
+    log: Callable[[str], None] | None = None,
+    metrics: MetricsAggregator | None = None,
+    resume: Dict[str, Any] | None = None,
+    on_checkpoint: Callable[[Dict[str, Any]], None] | None = None,
+    checkpoint_turns: int = 0,
+) -> Row:
+    seed = scenario_seed(scenario, rep)
+    units = build_units(scenario)
+    t0 = time.perf_counter()
+    enc = Encounter(units, seed=seed, content=content or shared_content())
+    res = play(
+        enc,
+        int(scenario.get("max_rounds", DEFAULT_MAX_ROUNDS)),
+        log=log,
+        metrics=metrics,
+        resume=resume,
+        on_checkpoint=on_checkpoint,
+        checkpoint_turns=checkpoint_turns,
+    )
+    if metrics is not None:
+        metrics.encounters += 1
+    team_hp: Dict[str, float] = {}
+    for c in units:
+        team_hp[c.team] = round(team_hp.get(c.team, 0.0) + max(0.0, c.hp), 1)
+    return {
+        "scenario": scenario["id"],
+        "rep": rep,
+        "seed": seed,
+        "winner_team": res["winner_team"],
+        "ended": res["ended"],
+        "rounds": res["rounds"],
+        "turns": res["turns"],
+        "team_hp": team_hp,
+        "hp": {c.id: round(max(0.0, c.hp), 1) for c in units},
+        "elapsed_ms": round((time.perf_counter() - t0) * 1000, 3),
+    }
+
+
+def run_chunk(
+    scenario: Dict[str, Any],
+    reps: List[int],
+    data_root: str | None = None,
+    with_metrics: bool = False,
+) -> Tuple[List[Row], Dict[str, Any] | None]:
+    """Worker entry point: one shared content handle per process, one aggregator per chunk."""
+    content = shared_content(data_root)
+    metrics = MetricsAggregator(content.abilities) if with_metrics else None
+    rows = [run_one(scenario, r, content, metrics=metrics) for r in reps]
+    return rows, (metrics.to_dict() if metrics is not None else None)
+
+
+def run_batch(
+    scenario: Dict[str, Any],
+    reps: int,
+    workers: int = 1,
+    data_root: str | Path | None = None,
+    metrics: MetricsAggregator | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[Row]:
+    """
+    Yield result rows for repetitions 0..reps-1 in order. workers > 1 spreads chunks of
+    repetitions over a process pool; per-chunk metrics are merged into `metrics`.
+    """
+    root = str(data_root) if data_root is not None else None
+    if workers <= 1:
+        content = shared_content(root)
+        for r in range(reps):
+            yield run_one(scenario, r, content, metrics=metrics)
+        return
+    size = chunk_size or max(1, min(256, reps // (workers * 4) or 1))
+    chunks = [list(range(i, min(reps, i + size))) for i in range(0, reps, size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futs = [pool.submit(run_chunk, scenario, c, root, metrics is not None) for c in chunks]
+        for f in futs:
+            rows, mdict = f.result()
+            if metrics is not None and mdict is not None:
+                metrics.merge(MetricsAggregator.from_dict(mdict))
+            yield from rows
+
+
+def flatten_row(row: Row) -> Dict[str, Any]:
+    """Nested dicts become dotted columns (team_hp.alpha, hp.A) for CSV output."""
+    out: Dict[str, Any] = {}
+    for k, v in row.items():
+        if isinstance(v, dict):
+            for sk, sv in v.items():
+                out[f"{k}.{sk}"] = sv
+        else:
+            out[k] = v
+    return out
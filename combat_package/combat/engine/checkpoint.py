@@ -0,0 +1,199 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Set, Tuple
+import hashlib
+import json
+import os
+import pickle
+
+from .batch import Row, run_one
+from .content import shared_content
+from .metrics import MetricsAggregator
+
+CHECKPOINT_VERSION = 1
+MANIFEST = "manifest.json"
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write via a temp file + fsync + os.replace, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def scenario_digest(scenario: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(scenario, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class BatchCheckpoint:
+    """
+    On-disk progress of one batch: committed result parts (JSONL, plus metrics JSON when
+    enabled) listed in manifest.json, and per-rep in-flight Encounter snapshots under
+    inflight/. A part is written before the manifest that lists it, so a crash between the
+    two only loses work that is then re-run.
+    """
+
+    def __init__(self, root: str | Path, scenario: Dict[str, Any], reps: int):
+        self.root = Path(root)
+        self.digest = scenario_digest(scenario)
+        self.scenario_id = scenario.get("id")
+        self.reps = int(reps)
+        self.parts: List[Dict[str, Any]] = []
+        self.done: Set[int] = set()
+        man = self.root / MANIFEST
+        if man.exists():
+            doc = json.loads(man.read_text(encoding="utf-8"))
+            if (
+                doc.get("version") != CHECKPOINT_VERSION
+                or doc.get("scenario_digest") != self.digest
+            ):
+                raise ValueError(f"{self.root} holds a checkpoint of a different scenario/version.")
+            if int(doc.get("reps", -1)) != self.reps:
+                raise ValueError(f"{self.root} was started with reps={doc.get('reps')}.")
+            self.parts = list(doc.get("parts") or [])
+            for part in self.parts:
+                self.done.update(part["reps"])
+
+    def _inflight_path(self, rep: int) -> Path:
+        return self.root / "inflight" / f"rep-{rep:08d}.pickle"
+
+    def todo(self) -> List[int]:
+        return [r for r in range(self.reps) if r not in self.done]
+
+    def commit(self, rows: List[Row], metrics: MetricsAggregator | None = None) -> None:
+        if not rows:
+            return
+        name = f"part-{len(self.parts):05d}"
+        body = "".join(json.dumps(r, sort_keys=True) + "\n" for r in rows)
+        atomic_write_bytes(self.root / f"{name}.jsonl", body.encode("utf-8"))
+        part: Dict[str, Any] = {"rows": f"{name}.jsonl", "reps": sorted(r["rep"] for r in rows)}
+        if metrics is not None:
+            atomic_write_bytes(
+                self.root / f"{name}.metrics.json", metrics.to_json().encode("utf-8")
+            )
+            part["metrics"] = f"{name}.metrics.json"
+        self.parts.append(part)
+        self.done.update(part["reps"])
+        self._write_manifest()
+        for r in part["reps"]:
+            self._inflight_path(r).unlink(missing_ok=True)
+
+    def _write_manifest(self) -> None:
+        doc = {
+            "version": CHECKPOINT_VERSION,
+            "scenario_id": self.scenario_id,
+            "scenario_digest": self.digest,
+            "reps": self.reps,
+            "completed": len(self.done),
+            "parts": self.parts,
+        }
+        atomic_write_bytes(self.root / MANIFEST, json.dumps(doc, indent=1).encode("utf-8"))
+
+    def save_inflight(self, rep: int, state: Dict[str, Any]) -> None:
+        atomic_write_bytes(
+            self._inflight_path(rep), pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    def load_inflight(self, rep: int) -> Dict[str, Any] | None:
+        try:
+            with open(self._inflight_path(rep), "rb") as fh:
+                return pickle.load(fh)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def results(self) -> List[Row]:
+        rows: List[Row] = []
+        for part in self.parts:
+            with open(self.root / part["rows"], "r", encoding="utf-8") as fh:
+                rows.extend(json.loads(line) for line in fh if line.strip())
+        return sorted(rows, key=lambda r: r["rep"])
+
+    def metrics(self) -> MetricsAggregator:
+        out = MetricsAggregator()
+        for part in self.parts:
+            if part.get("metrics"):
+                out.merge(MetricsAggregator.load(self.root / part["metrics"]))
+        return out
+
+
+def _run_reps(
+    scenario: Dict[str, Any],
+    reps: List[int],
+    ckpt: BatchCheckpoint,
+    data_root: str | None,
+    with_metrics: bool,
+    checkpoint_turns: int,
+) -> Tuple[List[Row], MetricsAggregator | None]:
+    content = shared_content(data_root)
+    metrics = MetricsAggregator(content.abilities) if with_metrics else None
+    rows = []
+    for r in reps:
+        # metrics cover whole fights, so with metrics on an unfinished fight restarts from its
+        # seed (same result, since every rep is deterministic) instead of its snapshot
+        resume = None if with_metrics else ckpt.load_inflight(r)
+        rows.append(
+            run_one(
+                scenario,
+                r,
+                content,
+                metrics=metrics,
+                resume=resume,
+                on_checkpoint=lambda st, r=r: ckpt.save_inflight(r, st),
+                checkpoint_turns=checkpoint_turns,
+            )
+        )
+    return rows, metrics
+
+
+def _run_reps_worker(scenario, reps, ckpt, data_root, with_metrics, checkpoint_turns):
+    rows, metrics = _run_reps(scenario, reps, ckpt, data_root, with_metrics, checkpoint_turns)
+    return rows, (metrics.to_dict() if metrics is not None else None)
+
+
+def run_checkpointed(
+    scenario: Dict[str, Any],
+    reps: int,
+    checkpoint_dir: str | Path,
+    workers: int = 1,
+    data_root: str | Path | None = None,
+    metrics: MetricsAggregator | None = None,
+    commit_every: int = 100,
+    checkpoint_turns: int = 0,
+) -> List[Row]:
+    """
+    run_batch with persistence: completed reps are committed every `commit_every` results and
+    in-flight fights snapshot every `checkpoint_turns` turns (0 = off). Re-running with the same
+    scenario, reps and directory resumes; only unfinished reps run again. Returns all rows in
+    rep order — identical to an uninterrupted run apart from elapsed_ms.
+    """
+    if int(commit_every) < 1:
+        raise ValueError(f"commit_every must be at least 1, got {commit_every!r}")
+    step = int(commit_every)
+    ckpt = BatchCheckpoint(checkpoint_dir, scenario, reps)
+    root = str(data_root) if data_root is not None else None
+    with_metrics = metrics is not None
+    todo = ckpt.todo()
+    chunks = [todo[i : i + step] for i in range(0, len(todo), step)]
+    if workers <= 1:
+        for chunk in chunks:
+            rows, m = _run_reps(scenario, chunk, ckpt, root, with_metrics, checkpoint_turns)
+            ckpt.commit(rows, m)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futs = [
+                pool.submit(
+                    _run_reps_worker, scenario, c, ckpt, root, with_metrics, checkpoint_turns
+                )
+                for c in chunks
+            ]
+            for f in as_completed(futs):
+                rows, mdict = f.result()
+                ckpt.commit(rows, MetricsAggregator.from_dict(mdict) if mdict else None)
+    if metrics is not None:
+        metrics.merge(ckpt.metrics())
+    return ckpt.results()
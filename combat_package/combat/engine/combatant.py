@@ -1,6 +1,119 @@
 from __future__ import annotations
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List
+import itertools
+
+from .timers import ExpiryQueue
+
+_versions = itertools.count(1)
+
+# names a unit's own stats contribute to status/hazard formulas (missing ones read as 0)
+SELF_FORMULA_STATS = ("STR", "DEX", "INT", "STA")
+
+
+class TurnClock:
+    """Monotonic round counter; an Encounter shares one with all its participants."""
+
+    __slots__ = ("now",)
+
+    def __init__(self, now: int = 0):
+        self.now = int(now)
+
+
+class CooldownView(MutableMapping):
+    """
+    {ability_id: remaining turns} over a unit's cooldown_ready, in the pre-clock format.
+    Writes go through: view[aid] = 2 readies it two rounds from now, 0 or del clears it.
+    """
+
+    __slots__ = ("unit",)
+
+    def __init__(self, unit: "Combatant"):
+        self.unit = unit
+
+    def __getitem__(self, ability_id: str) -> int:
+        left = self.unit.cooldown_ready.get(ability_id, 0) - self.unit.clock.now
+        if left <= 0:
+            raise KeyError(ability_id)
+        return left
+
+    def __setitem__(self, ability_id: str, turns: int) -> None:
+        if int(turns) > 0:
+            self.unit.start_cooldown(ability_id, turns)
+        else:
+            self.unit.cooldown_ready.pop(ability_id, None)
+
+    def __delitem__(self, ability_id: str) -> None:
+        self[ability_id]  # KeyError unless still cooling down
+        del self.unit.cooldown_ready[ability_id]
+
+    def __iter__(self) -> Iterator[str]:
+        now = self.unit.clock.now
+        return iter([k for k, r in self.unit.cooldown_ready.items() if r > now])
+
+    def __len__(self) -> int:
+        now = self.unit.clock.now
+        return sum(1 for r in self.unit.cooldown_ready.values() if r > now)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class StatDict(dict):
+    """
+    Stats dict that takes a fresh, process-unique version number on every write, so derived
+    values (formula contexts, pair accuracy) can be cached until the stats actually change.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = next(_versions)
+
+    def _touch(self) -> None:
+        self.version = next(_versions)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self._touch()
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def setdefault(self, key, default=None):
+        out = super().setdefault(key, default)
+        self._touch()
+        return out
+
+    def pop(self, *args):
+        out = super().pop(*args)
+        self._touch()
+        return out
+
+    def popitem(self):
+        out = super().popitem()
+        self._touch()
+        return out
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def __reduce__(self):
+        # copies/unpickles get their own version
+        return (StatDict, (dict(self),))
 
 
 @dataclass
@@ -15,10 +128,88 @@ class Combatant:
     resist: Dict[str, float] = field(default_factory=dict)
     tags: List[str] = field(default_factory=list)  # e.g., ["humanoid"]
     statuses: List[dict] = field(default_factory=list)  # runtime status instances
-    cooldowns: Dict[str, int] = field(default_factory=dict)  # ability_id -> remaining turns
+    cooldown_ready: Dict[str, int] = field(default_factory=dict)  # ability_id -> ready at clock.now
     team: str = "neutral"  # NEW: team label for targeting logic
     inventory: Dict[str, int] = field(default_factory=dict)  # NEW: item_id -> count
     location: str = "arena"  # NEW: simple location label (for hazards/terrain)
+    clock: TurnClock = field(default_factory=TurnClock, repr=False, compare=False)
+    # statuses expire by this unit's own start-of-turn ticks (see effects.tick_start_of_turn)
+    status_ticks: int = field(default=0, repr=False, compare=False)
+    status_timers: ExpiryQueue = field(default_factory=ExpiryQueue, repr=False, compare=False)
+    # (stats version, context) and target id -> (own version, target version, payload)
+    _self_ctx: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _pair_cache: Dict[str, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if type(self.stats) is not StatDict:
+            self.stats = StatDict(self.stats or {})
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # stats versions are only unique within one process, so copies and unpickled units
+        # (e.g. in batch workers) start with empty caches instead of entries that could match
+        state = self.__dict__.copy()
+        state["_self_ctx"] = None
+        state["_pair_cache"] = {}
+        return state
 
     def is_alive(self) -> bool:
         return self.hp > 0
+
+    @property
+    def stats_version(self) -> int:
+        stats = self.stats
+        if type(stats) is not StatDict:  # stats was reassigned with a plain dict
+            stats = self.stats = StatDict(stats)
+        return stats.version
+
+    def formula_context(self) -> Dict[str, float]:
+        """
+        This unit's STR/DEX/INT/STA as floats (status ticks, hazards); cached per stats
+        version. Shared between calls — do not mutate.
+        """
+        version = self.stats_version
+        cached = self._self_ctx
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        stats = self.stats
+        ctx = {k: float(stats.get(k, 0.0)) for k in SELF_FORMULA_STATS}
+        self._self_ctx = (version, ctx)
+        return ctx
+
+    def pair_cached(self, other: "Combatant", build) -> Any:
+        """
+        Value derived from this unit's and other's stats (e.g. attack context + accuracy),
+        memoized per other.id until either side's stats version changes.
+        """
+        mine, theirs = self.stats_version, other.stats_version
+        hit = self._pair_cache.get(other.id)
+        if hit is not None and hit[0] == mine and hit[1] == theirs:
+            return hit[2]
+        value = build(self, other)
+        self._pair_cache[other.id] = (mine, theirs, value)
+        return value
+
+    # Cooldowns are stored as "ready at round N"; nothing is written as turns pass.
+    def on_cooldown(self, ability_id: str) -> bool:
+        return self.cooldown_ready.get(ability_id, 0) > self.clock.now
+
+    def start_cooldown(self, ability_id: str, turns: int) -> None:
+        self.cooldown_ready[ability_id] = self.clock.now + int(turns)
+
+    @property
+    def cooldowns(self) -> CooldownView:
+        """Remaining turns per ability still cooling down (the pre-clock view; writable)."""
+        return CooldownView(self)
+
+    @cooldowns.setter
+    def cooldowns(self, remaining: Dict[str, int]) -> None:
+        now = self.clock.now
+        self.cooldown_ready = {k: now + int(v) for k, v in (remaining or {}).items() if int(v) > 0}
+
+    def attach_clock(self, clock: TurnClock) -> None:
+        """Switch to another clock, keeping the remaining turns of running cooldowns."""
+        remaining = dict(self.cooldowns)
+        self.clock = clock
+        self.cooldowns = remaining
@@ -0,0 +1,118 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Any, Callable
+import threading
+
+from ..loaders.abilities_loader import load_abilities
+from ..loaders.ai_rules_loader import load_ai_rules
+from ..loaders.body_parts_loader import load_body_parts
+from ..loaders.hazards_loader import load_hazards
+from ..loaders.items_loader import load_items
+from ..loaders.narration_loader import load_narration
+from ..loaders.status_effects_loader import load_status_effects
+
+DATA_ROOT = Path(__file__).parents[1] / "data"
+
+# name -> (loader, file under data_root)
+_SOURCES: Dict[str, tuple[Callable[[Path], dict], str]] = {
+    "abilities": (load_abilities, "abilities.yaml"),
+    "ai_rules": (load_ai_rules, "ai_rules.yaml"),
+    "body_parts": (load_body_parts, "body_parts.yaml"),
+    "hazards": (load_hazards, "hazards.yaml"),
+    "items": (load_items, "items.yaml"),
+    "narration": (load_narration, "narration.yaml"),
+    "status_effects": (load_status_effects, "status_effects.yaml"),
+}
+
+
+class ContentHandle:
+    """
+    Lazily loaded, shared view of the combat YAML under one data root.
+    Each file is parsed at most once per version; reload() drops everything and bumps
+    `version` so holders can tell their derived caches are stale.
+    Returned dicts are shared — treat them as read-only.
+    """
+
+    def __init__(self, data_root: str | Path | None = None):
+        self.data_root = Path(data_root) if data_root is not None else DATA_ROOT
+        self.version = 0
+        self._docs: Dict[str, dict] = {}
+        self._ability_index: Dict[str, dict] | None = None
+        self._derived: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str) -> dict:
+        doc = self._docs.get(name)
+        if doc is None:
+            with self._lock:
+                doc = self._docs.get(name)
+                if doc is None:
+                    loader, fname = _SOURCES[name]
+                    doc = loader(self.data_root / fname)
+                    self._docs[name] = doc
+        return doc
+
+    @property
+    def abilities(self) -> Dict[str, Any]:
+        return self._get("abilities")
+
+    @property
+    def ai_rules(self) -> Dict[str, Any]:
+        return self._get("ai_rules")
+
+    @property
+    def body_parts(self) -> Dict[str, Any]:
+        return self._get("body_parts")
+
+    @property
+    def hazards(self) -> Dict[str, Any]:
+        return self._get("hazards")
+
+    @property
+    def items(self) -> Dict[str, Any]:
+        return self._get("items")
+
+    @property
+    def narration(self) -> Dict[str, Any]:
+        return self._get("narration")
+
+    @property
+    def status_effects(self) -> Dict[str, Any]:
+        return self._get("status_effects")
+
+    def ability(self, ability_id: str) -> Dict[str, Any] | None:
+        if self._ability_index is None:
+            self._ability_index = {
+                a.get("id"): a for a in (self.abilities.get("abilities") or []) if a.get("id")
+            }
+        return self._ability_index.get(ability_id)
+
+    def derived(self, key: str, build: Callable[["ContentHandle"], Any]) -> Any:
+        """Value computed once from this handle (e.g. a compiled index); dropped on reload()."""
+        val = self._derived.get(key)
+        if val is None:
+            val = build(self)
+            with self._lock:
+                val = self._derived.setdefault(key, val)
+        return val
+
+    def reload(self) -> None:
+        with self._lock:
+            self._docs = {}
+            self._ability_index = None
+            self._derived = {}
+            self.version += 1
+
+
+_shared: Dict[Path, ContentHandle] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_content(data_root: str | Path | None = None) -> ContentHandle:
+    """Process-wide handle per data root (defaults to the shipped combat/data)."""
+    root = (Path(data_root) if data_root is not None else DATA_ROOT).resolve()
+    with _shared_lock:
+        handle = _shared.get(root)
+        if handle is None:
+            handle = _shared[root] = ContentHandle(root)
+        return handle
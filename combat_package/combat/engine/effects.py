@@ -71,6 +71,46 @@ def _get_effect_def(effects_cfg: Dict[str, Any], eff_id: str) -> Dict[str, Any]:
     return (effects_cfg.get("effects") or {}).get(eff_id, {})
 
 
+# Status instances carry an absolute "expires_at" on the holder's status_ticks counter and
+# a matching entry in holder.status_timers; nothing is rewritten as turns pass. Dicts that
+# still carry the older relative "remaining" (hand-built or from snapshots) are adopted lazily.
+def _set_expiry(holder: Combatant, st: dict, expires_at: int) -> None:
+    st["expires_at"] = int(expires_at)
+    holder.status_timers.push(st["expires_at"], st)
+
+
+def _adopt(holder: Combatant, st: dict, base: int) -> None:
+    if "expires_at" not in st:
+        _set_expiry(holder, st, base + int(st.pop("remaining", 1)))
+
+
+def track_statuses(holder: Combatant) -> None:
+    """Rebuild expiry timers for holder.statuses (after restore or manual edits)."""
+    holder.status_timers.clear()
+    for st in holder.statuses or []:
+        if "expires_at" in st:
+            holder.status_timers.push(int(st["expires_at"]), st)
+        else:
+            _adopt(holder, st, holder.status_ticks)
+
+
+def status_remaining(holder: Combatant, st: dict) -> int:
+    """Ticks left before st expires (the old 'remaining' value)."""
+    if "expires_at" in st:
+        return max(0, int(st["expires_at"]) - holder.status_ticks)
+    return int(st.get("remaining", 1))
+
+
+def export_statuses(holder: Combatant) -> List[dict]:
+    """Copies of holder.statuses in the relative {'remaining': n} form used by snapshots."""
+    out = []
+    for st in holder.statuses or []:
+        d = {k: v for k, v in st.items() if k != "expires_at"}
+        d["remaining"] = status_remaining(holder, st)
+        out.append(d)
+    return out
+
+
 def apply_status(
     target: Combatant,
     eff_id: str,
@@ -89,20 +129,27 @@ def apply_status(
     max_stacks = int(ed.get("max_stacks", 1))
     mode = str(ed.get("stack_mode", "refresh"))
 
+    now = target.status_ticks
     # find existing
     cur = next((s for s in target.statuses if s.get("id") == eff_id), None)
     if cur is None:
-        inst = {"id": eff_id, "source_id": source_id, "remaining": dur, "stacks": 1}
+        inst = {"id": eff_id, "source_id": source_id, "stacks": 1}
+        _set_expiry(target, inst, now + dur)
         target.statuses.append(inst)
-        return EffectInstance(**inst)
+        return EffectInstance(eff_id, source_id, dur, 1)
+    _adopt(target, cur, now)
     # update
     if mode == "add":
         cur["stacks"] = min(max_stacks, int(cur.get("stacks", 1)) + 1)
-        cur["remaining"] = max(int(cur.get("remaining", 1)), dur)
+        if now + dur > cur["expires_at"]:
+            _set_expiry(target, cur, now + dur)
     else:  # refresh
         cur["stacks"] = min(max_stacks, int(cur.get("stacks", 1)))
-        cur["remaining"] = dur
-    return EffectInstance(**cur)
+        if now + dur != cur["expires_at"]:
+            _set_expiry(target, cur, now + dur)
+    return EffectInstance(
+        cur["id"], cur.get("source_id"), status_remaining(target, cur), int(cur["stacks"])
+    )
 
 
 def apply_on_hit_effects(
@@ -145,25 +192,26 @@ def tick_start_of_turn(
     events: List[Dict[str, Any]] = []
     if not actor.statuses:
         return events
+    actor.status_ticks += 1
+    now = actor.status_ticks
 
-    # Evaluate once per status (multiply by stacks)
-    new_list: List[dict] = []
+    # Evaluate once per status (multiply by stacks); no per-status bookkeeping here
+    undefined = False
     for st in actor.statuses:
+        _adopt(actor, st, now - 1)
         ed = _get_effect_def(effects_cfg, st["id"])
         if not ed:
+            undefined = True  # statuses without a definition are dropped, as before
+            continue
+        per_tick = ed.get("per_tick")
+        if per_tick is None:
             continue
         stacks = int(st.get("stacks", 1))
-        per_tick = str(ed.get("per_tick", "0"))
         dtype = str(ed.get("damage_type", ""))
         # context: use actor's own stats (harm scales with victim stats or with attacker's? we use victim INT here minimal; swap later easily)
-        ctx = {
-            "STR": float(actor.stats.get("STR", 0.0)),
-            "DEX": float(actor.stats.get("DEX", 0.0)),
-            "INT": float(actor.stats.get("INT", 0.0)),
-            "STA": float(actor.stats.get("STA", 0.0)),
-        }
+        ctx = actor.formula_context()
         try:
-            base = max(0.0, _safe_eval(per_tick, ctx))
+            base = max(0.0, _safe_eval(str(per_tick), ctx))
         except Exception:
             base = 0.0
         # resistance (by effect dtype)
@@ -174,13 +222,14 @@ def tick_start_of_turn(
             actor.hp = max(0.0, actor.hp - amt)
             events.append({"effect_id": st["id"], "dtype": dtype or "damage", "amount": amt})
 
-        # decrement duration
-        rem = int(st.get("remaining", 1)) - 1
-        if rem > 0:
-            st["remaining"] = rem
-            new_list.append(st)
-        # else: expired → drop
-    actor.statuses = new_list
+    # expiry: only timers that are due are touched; stale ones (refreshed/removed) are skipped
+    gone = {id(st) for st in actor.status_timers.pop_due(now) if st.get("expires_at", 0) <= now}
+    if gone or undefined:
+        actor.statuses = [
+            s
+            for s in actor.statuses
+            if id(s) not in gone and (not undefined or _get_effect_def(effects_cfg, s["id"]))
+        ]
     return events
 
 
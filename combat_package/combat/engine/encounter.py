@@ -1,11 +1,20 @@
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
-from .combatant import Combatant
+from typing import List, Dict, Any, Callable, Optional
+import warnings
+from .combatant import Combatant, TurnClock
 from .rng import RandomSource
 from .threat import blank_table, add_threat, normalize
 from .environment import Environment
-from ..loaders.hazards_loader import load_hazards
-from pathlib import Path
+from .effects import export_statuses, track_statuses
+from .content import ContentHandle, shared_content
+
+BASIC_ATTACK_FALLBACK: Dict[str, Any] = {
+    "id": "basic_attack",
+    "formula": "ATT + WPN - ARM*0.6",
+    "damage_type": "slashing",
+    "targeting": "single_enemy",
+    "crit": {"chance": "0.05", "multiplier": 1.5},
+}
 
 
 def _dex_of(c: Combatant) -> float:
@@ -16,7 +25,12 @@ def _dex_of(c: Combatant) -> float:
 
 
 class Encounter:
-    def __init__(self, participants: List[Combatant], seed: int | None = 1234):
+    def __init__(
+        self,
+        participants: List[Combatant],
+        seed: int | None = 1234,
+        content: ContentHandle | None = None,
+    ):
         if not participants:
             raise ValueError("Encounter requires at least one participant.")
         self.participants = list(participants)
@@ -31,13 +45,26 @@ class Encounter:
             ),
         )
         self._ptr = 0
-        self._round = 1
+        # monotonic round clock shared with participants (cooldowns are "ready at round N")
+        self.clock = TurnClock(1)
+        for c in self.participants:
+            c.attach_clock(self.clock)
         self.log: List[str] = []
         self.events: List[Dict[str, Any]] = []  # typed event log
-        # NEW: environment
-        data_root = Path(__file__).parents[1] / "data"
-        self._hazards_cfg = load_hazards(data_root / "hazards.yaml")
-        self.env = Environment(self._hazards_cfg)
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self.shared = None  # SharedParticipants mirror, see attach_shared()
+        # content is resolved once per encounter from a shared, versioned handle
+        self.content = content if content is not None else shared_content()
+        self._hazards_cfg = self.content.hazards
+        self.env = Environment(self._hazards_cfg, start_round=self._round)
+
+    @property
+    def _round(self) -> int:
+        return self.clock.now
+
+    @_round.setter
+    def _round(self, value: int) -> None:
+        self.clock.now = int(value)
 
     @property
     def order_ids(self) -> List[str]:
@@ -48,18 +75,52 @@ class Encounter:
         self._ptr = (self._ptr + 1) % len(self._order)
         if self._ptr == 0:
             self._round += 1
+            self.env.tick_round_boundary(self._round)
         return self.participants[idx]
 
+    def subscribe(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Call listener(event) for every event this encounter records (e.g. a MetricsAggregator)."""
+        self._listeners.append(listener)
+
+    def emit(self, events: List[Dict[str, Any]]) -> None:
+        self.events.extend(events)
+        for fn in self._listeners:
+            for ev in events:
+                fn(ev)
+
+    def attach_shared(self, block) -> None:
+        """
+        Mirror participant core state into a SharedParticipants block (shared memory) so other
+        processes can read it live: a full write now and after restore(), then the hp/mana/alive
+        of every actor/target named by an emitted event.
+        """
+        self.shared = block
+        block.write_all(self.participants)
+        by_id = {c.id: c for c in self.participants}
+
+        def publish(ev: Dict[str, Any]) -> None:
+            touched = [by_id[k] for k in (ev.get("actor_id"), ev.get("target_id")) if k in by_id]
+            if touched:
+                block.write(touched)
+
+        self.subscribe(publish)
+
     def living(self, team: Optional[str] = None) -> List[Combatant]:
         units = [c for c in self.participants if c.is_alive()]
         return [u for u in units if (team is None or u.team == team)]
 
-    # Existing helper:
     def tick_cooldowns(self, actor: Combatant) -> None:
-        if not actor.cooldowns:
-            return
-        for k in list(actor.cooldowns.keys()):
-            actor.cooldowns[k] = max(0, int(actor.cooldowns.get(k, 0)) - 1)
+        """
+        Deprecated no-op. Cooldowns are "ready at round N" on the encounter's TurnClock and
+        expire as next_turn() advances it; stepping them here as well would expire them twice
+        as fast.
+        """
+        warnings.warn(
+            "Encounter.tick_cooldowns() is a no-op: cooldowns expire as next_turn() advances "
+            "the round clock",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
     # NEW: snapshot/restore (deterministic)
     def snapshot(self) -> Dict[str, Any]:
@@ -78,11 +139,13 @@ class Encounter:
                     "mana": float(c.mana),
                     "resist": dict(c.resist),
                     "tags": list(c.tags),
-                    "statuses": [dict(s) for s in (c.statuses or [])],
+                    "statuses": export_statuses(c),
                     "cooldowns": dict(c.cooldowns),
                 }
                 for c in self.participants
             ],
+            "env": self.env.get_state(),
+            "threat": {v: dict(row) for v, row in self.threat.items()},
         }
 
     def restore(self, snap: Dict[str, Any]) -> None:
@@ -90,6 +153,10 @@ class Encounter:
         self._order = list(snap["order"])
         self._ptr = int(snap["ptr"])
         self._round = int(snap["round"])
+        if "env" in snap:
+            self.env.set_state(snap["env"], self._hazards_cfg)
+        if "threat" in snap:
+            self.threat = {v: dict(row) for v, row in snap["threat"].items()}
         by_id = {c.id: c for c in self.participants}
         for sd in snap["participants"]:
             c = by_id.get(sd["id"])
@@ -103,71 +170,74 @@ class Encounter:
             c.resist = dict(sd["resist"])
             c.tags = list(sd["tags"])
             c.statuses = [dict(s) for s in (sd.get("statuses") or [])]
+            track_statuses(c)
             c.cooldowns = dict(sd.get("cooldowns") or {})
+        if self.shared is not None:
+            self.shared.write_all(self.participants)
+
+    def _basic_attack(
+        self, abilities: Dict[str, Any] | None = None, content: ContentHandle | None = None
+    ) -> Dict[str, Any]:
+        if abilities is not None:
+            found = next(
+                (x for x in abilities.get("abilities", []) if x.get("id") == "basic_attack"), None
+            )
+        else:
+            found = (content or self.content).ability("basic_attack")
+        return found or BASIC_ATTACK_FALLBACK
 
     # OPTIONAL convenience for automation: run until end or N rounds
-    def run_until(self, max_rounds: int = 50) -> Dict[str, Any]:
+    def run_until(
+        self,
+        max_rounds: int = 50,
+        abilities: Dict[str, Any] | None = None,
+        status_cfg: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any]:
         """
         Minimal auto-sim: each unit attacks the first living enemy with 'basic_attack'.
+        abilities / status_cfg default to the encounter's content handle (no per-call I/O).
         Returns {ended: bool, winner_team: str|None}
         """
         from .abilities import execute_ability
-        from ..loaders.narration_loader import load_narration
-        from ..loaders.body_parts_loader import load_body_parts
-        from pathlib import Path
-
-        # Load required configs for the auto-sim
-        load_body_parts(Path(__file__).parents[1] / "data" / "body_parts.yaml")
-        load_narration(Path(__file__).parents[1] / "data" / "narration.yaml")
-        import yaml
-
-        abilities = (
-            yaml.safe_load(
-                open(
-                    Path(__file__).parents[1] / "data" / "abilities.yaml",
-                    "r",
-                    encoding="utf-8",
-                )
-            )
-            or {}
-        )
-        basic = next(
-            (x for x in abilities.get("abilities", []) if x.get("id") == "basic_attack"),
-            {
-                "id": "basic_attack",
-                "formula": "ATT + WPN - ARM*0.6",
-                "damage_type": "slashing",
-                "targeting": "single_enemy",
-            },
-        )
+        from .effects import tick_start_of_turn
+
+        basic = self._basic_attack(abilities)
+        effects_cfg = status_cfg if status_cfg is not None else self.content.status_effects
+        body_parts = self.content.body_parts
 
         while self._round <= max_rounds and len({c.team for c in self.living()}) > 1:
             actor = self.next_turn()
             if not actor.is_alive():
                 continue
-            # tick phase
-            from .effects import tick_start_of_turn
-
-            self.tick_cooldowns(actor)
-            dot_events = tick_start_of_turn(
-                actor, {"effects": {}}, self.rng
-            )  # cfg injected by CLI/tests; here use empty to avoid IO
-            for ev in dot_events:
-                self.events.append(
+            # tick phase (cooldowns need no per-turn work; see TurnClock)
+            dot_events = tick_start_of_turn(actor, effects_cfg, self.rng)
+            self.emit(
+                [
                     {
                         "type": "dot",
                         "target_id": actor.id,
                         "effect_id": ev["effect_id"],
+                        "dtype": ev.get("dtype"),
                         "amount": ev["amount"],
                     }
-                )
+                    for ev in dot_events
+                ]
+            )
             # choose first enemy
             enemies = [c for c in self.living() if c.team != actor.team]
             if not enemies:
                 break
             tgt = enemies[0]
-            res = execute_ability(self.participants, actor, basic, [tgt.id], self.rng)
-            self.events.extend(res.events or [])
+            res = execute_ability(
+                self.participants,
+                actor,
+                basic,
+                [tgt.id],
+                self.rng,
+                body_parts=body_parts,
+                status_cfg=effects_cfg,
+            )
+            self.emit(res.events or [])
             if len({c.team for c in self.living()}) <= 1:
                 break
         teams_alive = {c.team for c in self.living()}
@@ -186,32 +256,15 @@ class Encounter:
         """
         from .resolution import resolve_attack
         from .narration import render_event
-        from ..loaders.abilities_loader import load_abilities
-        from ..loaders.body_parts_loader import load_body_parts
-        from ..loaders.narration_loader import load_narration
-        from pathlib import Path
 
         alive = [c for c in self.participants if c.is_alive()]
         if len(alive) <= 1:
             return {"ended": True, "winner": alive[0].id if alive else None}
 
-        data_root = Path(__file__).parents[2] / "data"
-        abilities = load_abilities(data_root / "abilities.yaml")
-        ability = {}
-        for a in abilities.get("abilities", []):
-            if a.get("id") == "basic_attack":
-                ability = a
-                break
-        if not ability:
-            ability = {
-                "id": "basic_attack",
-                "formula": "ATT + WPN - ARM*0.6",
-                "damage_type": "slashing",
-                "crit": {"chance": "0.05", "multiplier": 1.5},
-            }
-
-        body_parts = load_body_parts(data_root / "body_parts.yaml")
-        narration_cfg = load_narration(data_root / "narration.yaml")
+        content = self.content
+        ability = self._basic_attack(content=content)
+        body_parts = content.body_parts
+        narration_cfg = content.narration
 
         # two actors in order
         a1 = self.next_turn()
@@ -291,7 +344,7 @@ class Encounter:
     # NEW: process hazards at a given phase for given actor (actor can be None for round events)
     def process_hazards(self, phase: str) -> List[Dict[str, Any]]:
         evs = self.env.process_phase(phase, self.participants, self.rng)
-        self.events.extend(evs)
+        self.emit(evs)
         return evs
 
     # We call hazards at start_of_turn before DoT ticks; and at end_of_turn after actions.
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Dict, Any, List
 from .combatant import Combatant
 from .rng import RandomSource
+from .timers import ExpiryQueue
 import ast
 
 
@@ -53,6 +54,37 @@ def _safe_eval(expr: str, ctx: Dict[str, float]) -> float:
     return float(ev(tree))
 
 
+def hazard_targets(hz: Dict[str, Any], participants: List[Combatant]) -> List[Combatant]:
+    """Living participants matched by a hazard's targeting block (locations/team/tags)."""
+    t = hz.get("targeting") or {}
+    locs = set(t.get("locations") or [])
+    team = str(t.get("team", "any"))
+    absent = set(t.get("require_tag_absent") or [])
+    cands = [c for c in participants if c.is_alive()]
+    if locs:
+        cands = [c for c in cands if c.location in locs]
+    if team != "any":
+        cands = [c for c in cands if c.team == team]
+    if absent:
+        cands = [c for c in cands if not any(tag in absent for tag in (c.tags or []))]
+    return cands
+
+
+def hazard_damage(spec: Dict[str, Any], victim: Combatant) -> tuple[float, str | None]:
+    """(amount after resist, dtype) of a hazard's damage effect on one victim."""
+    # context: victim stats for scaling (safe)
+    ctx = victim.formula_context()
+    amt = spec.get("amount", 0)
+    try:
+        val = max(0.0, _safe_eval(amt, ctx))
+    except Exception:
+        val = 0.0
+    dtype = spec.get("damage_type")
+    # apply resist
+    res = float(victim.resist.get(dtype, 0.0)) if dtype else 0.0
+    return round(val * (1.0 - max(0.0, min(1.0, res))), 1), dtype
+
+
 def _choice_weighted(rng: RandomSource, lines: List[dict]) -> str:
     if not lines:
         return ""
@@ -66,21 +98,62 @@ def _choice_weighted(rng: RandomSource, lines: List[dict]) -> str:
 class Environment:
     """
     Applies hazard effects at configured phases.
-    Keeps per-hazard remaining duration (rounds) if > 0.
+    Finite hazards (duration_rounds > 0) are active for that many rounds starting at
+    `start_round`, then dropped when Encounter crosses into the round they expire at.
     """
 
-    def __init__(self, hazards_cfg: Dict[str, Any]):
+    def __init__(self, hazards_cfg: Dict[str, Any], start_round: int = 1):
         self.hazards = []
+        self.round = int(start_round)
+        self._expiry = ExpiryQueue()
         for h in hazards_cfg.get("hazards") or []:
             h = dict(h)
             dur = int(h.get("duration_rounds", 0) or 0)
-            h["_remaining_rounds"] = dur
+            if dur > 0:
+                h["_expires_at"] = self.round + dur
+                self._expiry.push(h["_expires_at"], h)
             self.hazards.append(h)
 
-    def tick_round_boundary(self) -> None:
-        """Call at start_of_round to decrement round-based durations AFTER the first round."""
-        # We'll decrement at the *end* of a full round in Encounter; for simplicity, leave here no-op.
-        pass
+    def remaining_rounds(self, hz: Dict[str, Any]) -> int:
+        """Rounds left for a finite hazard (0 for persistent ones)."""
+        if "_expires_at" not in hz:
+            return 0
+        return max(0, hz["_expires_at"] - self.round)
+
+    def tick_round_boundary(self, new_round: int | None = None) -> List[str]:
+        """Call when a new round starts; returns ids of finite hazards that just ran out."""
+        self.round = self.round + 1 if new_round is None else int(new_round)
+        due = self._expiry.pop_due(self.round)
+        if not due:
+            return []
+        active = {id(h) for h in self.hazards}
+        expired = [h for h in due if id(h) in active]
+        gone = {id(h) for h in expired}
+        self.hazards = [h for h in self.hazards if id(h) not in gone]
+        return [h.get("id") for h in expired]
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "round": self.round,
+            "active": [
+                {"id": h.get("id"), "expires_at": h.get("_expires_at")} for h in self.hazards
+            ],
+        }
+
+    def set_state(self, state: Dict[str, Any], hazards_cfg: Dict[str, Any]) -> None:
+        self.round = int(state["round"])
+        self._expiry.clear()
+        by_id = {h.get("id"): h for h in hazards_cfg.get("hazards") or []}
+        self.hazards = []
+        for rec in state.get("active") or []:
+            src = by_id.get(rec.get("id"))
+            if src is None:
+                continue
+            h = dict(src)
+            if rec.get("expires_at") is not None:
+                h["_expires_at"] = int(rec["expires_at"])
+                self._expiry.push(h["_expires_at"], h)
+            self.hazards.append(h)
 
     def process_phase(
         self,
@@ -96,43 +169,14 @@ class Environment:
         for hz in list(self.hazards):
             if hz.get("phase") != phase:
                 continue
-            # duration check: 0 = persistent; if >0 and exhausted, skip
-            if int(hz.get("_remaining_rounds", 0)) == 0 and int(hz.get("duration_rounds", 0)) > 0:
-                continue
-            t = hz.get("targeting") or {}
-            locs = set(t.get("locations") or [])
-            team = str(t.get("team", "any"))
-            absent = set(t.get("require_tag_absent") or [])
-            # candidates
-            cands = [c for c in participants if c.is_alive()]
-            if locs:
-                cands = [c for c in cands if c.location in locs]
-            if team != "any":
-                cands = [c for c in cands if c.team == team]
-            if absent:
-                cands = [c for c in cands if not any(tag in absent for tag in (c.tags or []))]
+            # finite hazards are removed from self.hazards by tick_round_boundary when they expire
+            cands = hazard_targets(hz, participants)
 
             eff = hz.get("effects") or {}
             for c in cands:
-                # context: victim stats for scaling (safe)
-                ctx = {
-                    "STR": float(c.stats.get("STR", 0.0)),
-                    "DEX": float(c.stats.get("DEX", 0.0)),
-                    "INT": float(c.stats.get("INT", 0.0)),
-                    "STA": float(c.stats.get("STA", 0.0)),
-                }
                 # damage
                 if "damage" in eff:
-                    spec = eff["damage"] or {}
-                    amt = spec.get("amount", 0)
-                    try:
-                        val = max(0.0, _safe_eval(amt, ctx))
-                    except Exception:
-                        val = 0.0
-                    dtype = spec.get("damage_type")
-                    # apply resist
-                    res = float(c.resist.get(dtype, 0.0)) if dtype else 0.0
-                    val = round(val * (1.0 - max(0.0, min(1.0, res))), 1)
+                    val, dtype = hazard_damage(eff["damage"] or {}, c)
                     if val > 0:
                         c.hp = max(0.0, c.hp - val)
                         events.append(
@@ -197,5 +241,4 @@ class Environment:
                                     "dtype": None,
                                 }
                             )
-            # duration bookkeeping for finite hazards: decrement per round at end_of_turn of last unit if needed (handled by Encounter)
         return events
@@ -0,0 +1,218 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
+import copy
+import math
+
+from .combatant import Combatant
+from .content import ContentHandle, shared_content
+from .resolution import attack_context, base_damage, crit_profile, hit_chance, resist_factor
+
+
+@dataclass
+class DamageEstimate:
+    """Per-attack damage of one ability from attacker on target (what resolve_attack rolls)."""
+
+    ability_id: str
+    hit_chance: float
+    crit_chance: float
+    hit_amount: float
+    crit_amount: float
+    mean: float
+    variance: float
+
+    def outcomes(self) -> List[Tuple[float, float]]:
+        """[(amount, probability)] for miss / plain hit / crit."""
+        p, c = self.hit_chance, self.crit_chance
+        return [(0.0, 1.0 - p), (self.hit_amount, p * (1.0 - c)), (self.crit_amount, p * c)]
+
+
+@dataclass
+class DuelEstimate:
+    a_id: str
+    b_id: str
+    p_a_wins: float
+    p_b_wins: float
+    p_unfinished: float  # still both alive after max_rounds
+    expected_rounds: float  # over finished fights
+    rounds_pmf: Dict[int, float]
+
+
+def estimate_damage(
+    attacker: Combatant, target: Combatant, ability_def: Dict[str, Any]
+) -> DamageEstimate:
+    """
+    Closed-form mean/variance of one attack, from the same helpers resolve_attack uses
+    (hit chance, crit profile, formula, resist clamp, rounding to 0.1).
+    """
+    ctx = attack_context(attacker, target)
+    p = hit_chance(ctx)
+    c, mult = crit_profile(ability_def, ctx)
+    base = base_damage(ability_def, ctx)
+    rf = resist_factor(target, str(ability_def.get("damage_type", "slashing")))
+    hit_amt = round(base * rf, 1)
+    crit_amt = round(base * mult * rf, 1)
+    mean = p * ((1.0 - c) * hit_amt + c * crit_amt)
+    second = p * ((1.0 - c) * hit_amt**2 + c * crit_amt**2)
+    return DamageEstimate(
+        str(ability_def.get("id", "")),
+        p,
+        c,
+        hit_amt,
+        crit_amt,
+        mean,
+        max(0.0, second - mean * mean),
+    )
+
+
+def pair_table(
+    units: List[Combatant], abilities: List[Dict[str, Any]]
+) -> Dict[Tuple[str, str, str], DamageEstimate]:
+    """Damage estimates for every (attacker, enemy target, ability) triple."""
+    out: Dict[Tuple[str, str, str], DamageEstimate] = {}
+    for a in units:
+        for t in units:
+            if a.team == t.team:
+                continue
+            for ab in abilities:
+                out[(a.id, t.id, str(ab.get("id", "")))] = estimate_damage(a, t, ab)
+    return out
+
+
+def _turn_order(a: Combatant, b: Combatant) -> Tuple[Combatant, Combatant]:
+    # same key as Encounter._order
+    def key(c: Combatant):
+        return (-float(c.stats.get("DEX", 0.0) or 0.0), c.name.lower(), c.id)
+
+    return (a, b) if key(a) <= key(b) else (b, a)
+
+
+def _tenths(outcomes: List[Tuple[float, float]]) -> List[Tuple[int, float]]:
+    merged: Dict[int, float] = {}
+    for amt, p in outcomes:
+        if p > 0:
+            k = int(round(amt * 10))
+            merged[k] = merged.get(k, 0.0) + p
+    return list(merged.items())
+
+
+def estimate_duel(
+    a: Combatant,
+    b: Combatant,
+    ability_a: Dict[str, Any] | None = None,
+    ability_b: Dict[str, Any] | None = None,
+    max_rounds: int = 50,
+    content: ContentHandle | None = None,
+) -> DuelEstimate:
+    """
+    Win probabilities of a 1v1 fight as Encounter.run_until plays it (alternating attacks in
+    DEX order, basic_attack by default), by dynamic programming over the joint HP distribution.
+    HP is tracked in tenths — attack amounts are rounded to 0.1 — so the result is exact for
+    those rules, up to float error; statuses, hazards and AI choices are not modelled.
+    """
+    if ability_a is None or ability_b is None:
+        basic = (content or shared_content()).ability("basic_attack") or {}
+        ability_a = ability_a or basic
+        ability_b = ability_b or basic
+    first, second = _turn_order(a, b)
+    moves = {
+        first.id: _tenths(
+            estimate_damage(first, second, ability_a if first is a else ability_b).outcomes()
+        ),
+        second.id: _tenths(
+            estimate_damage(second, first, ability_a if second is a else ability_b).outcomes()
+        ),
+    }
+    # state: (hp of first, hp of second) in tenths -> probability, both alive
+    states: Dict[Tuple[int, int], float] = {
+        (int(round(first.hp * 10)), int(round(second.hp * 10))): 1.0
+    }
+    wins = {first.id: 0.0, second.id: 0.0}
+    rounds_pmf: Dict[int, float] = {}
+    for turn in range(2 * max_rounds):
+        if not states:
+            break
+        actor_first = turn % 2 == 0
+        actor = first if actor_first else second
+        nxt: Dict[Tuple[int, int], float] = {}
+        for (h1, h2), p in states.items():
+            for dmg, q in moves[actor.id]:
+                pq = p * q
+                if actor_first:
+                    s = (h1, h2 - dmg)
+                    dead = s[1] <= 0
+                else:
+                    s = (h1 - dmg, h2)
+                    dead = s[0] <= 0
+                if dead:
+                    wins[actor.id] += pq
+                    r = turn // 2 + 1
+                    rounds_pmf[r] = rounds_pmf.get(r, 0.0) + pq
+                else:
+                    nxt[s] = nxt.get(s, 0.0) + pq
+        states = nxt
+    finished = sum(rounds_pmf.values())
+    return DuelEstimate(
+        a.id,
+        b.id,
+        wins[a.id],
+        wins[b.id],
+        sum(states.values()),
+        sum(r * p for r, p in rounds_pmf.items()) / finished if finished else math.inf,
+        rounds_pmf,
+    )
+
+
+def simulate_duel(
+    a: Combatant,
+    b: Combatant,
+    n: int = 500,
+    seed: int = 1,
+    max_rounds: int = 50,
+    content: ContentHandle | None = None,
+) -> Dict[str, Any]:
+    """Monte Carlo reference: n Encounter.run_until fights on copies of a and b."""
+    from .encounter import Encounter
+
+    content = content or shared_content()
+    wins = {a.id: 0, b.id: 0}
+    rounds: List[int] = []
+    for i in range(n):
+        ca, cb = copy.deepcopy(a), copy.deepcopy(b)
+        enc = Encounter([ca, cb], seed=seed + i, content=content)
+        res = enc.run_until(max_rounds=max_rounds)
+        if res["ended"] and res["winner_team"] is not None:
+            winner = ca if ca.is_alive() else cb
+            wins[winner.id] += 1
+            # the clock advances after the last actor of a round; count the round in progress
+            rounds.append(enc._round - 1 if enc._ptr == 0 else enc._round)
+    return {
+        "n": n,
+        "p_a_wins": wins[a.id] / n,
+        "p_b_wins": wins[b.id] / n,
+        "mean_rounds": sum(rounds) / len(rounds) if rounds else math.inf,
+    }
+
+
+def validate_duel(
+    a: Combatant,
+    b: Combatant,
+    n: int = 500,
+    seed: int = 1,
+    max_rounds: int = 50,
+    content: ContentHandle | None = None,
+) -> Dict[str, Any]:
+    """
+    Validation harness: analytic estimate vs simulation, with the absolute errors and the
+    binomial standard error of the simulated win rate (errors within ~3 SE are expected).
+    """
+    est = estimate_duel(a, b, max_rounds=max_rounds, content=content)
+    sim = simulate_duel(a, b, n=n, seed=seed, max_rounds=max_rounds, content=content)
+    p = sim["p_a_wins"]
+    return {
+        "estimate": est,
+        "simulated": sim,
+        "win_error": abs(est.p_a_wins - p),
+        "rounds_error": abs(est.expected_rounds - sim["mean_rounds"]),
+        "win_stderr": math.sqrt(max(p * (1.0 - p), 1e-12) / n),
+    }
@@ -0,0 +1,215 @@
+from __future__ import annotations
+from array import array
+from pathlib import Path
+from typing import Dict, Any, Iterator, List
+import json
+import os
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# column -> array typecode (numpy dtype on export: i=int32, h=int16, b=int8, f=float32)
+COLUMNS: Dict[str, str] = {
+    "round": "i",
+    "kind": "b",
+    "actor": "i",
+    "target": "i",
+    "ability": "h",
+    "hazard": "h",
+    "effect": "h",
+    "amount": "f",
+    "crit": "b",
+    "dtype": "h",
+    "body_part": "h",
+}
+# code columns and the string dictionary they index into; actor/target share "unit"
+DICTIONARIES: Dict[str, str] = {
+    "kind": "kind",
+    "actor": "unit",
+    "target": "unit",
+    "ability": "ability",
+    "hazard": "hazard",
+    "effect": "effect",
+    "dtype": "dtype",
+    "body_part": "body_part",
+}
+MANIFEST = "dictionaries.json"
+
+
+class EventColumns:
+    """
+    Typed column buffers for engine events (stdlib `array`, no numpy needed to collect).
+    Strings (event type, unit ids, ability/hazard/effect ids, damage types, body parts) are
+    stored as integer codes; -1 means "not set", so `hazard >= 0` selects hazard events.
+    The code -> string tables live in `dictionaries`. `round` is the encounter's round clock.
+    """
+
+    def __init__(self):
+        self.cols: Dict[str, array] = {k: array(t) for k, t in COLUMNS.items()}
+        self.dictionaries: Dict[str, List[str]] = {d: [] for d in set(DICTIONARIES.values())}
+        self._codes: Dict[str, Dict[str, int]] = {d: {} for d in self.dictionaries}
+
+    def __len__(self) -> int:
+        return len(self.cols["round"])
+
+    def code(self, dictionary: str, value: Any) -> int:
+        if value is None:
+            return -1
+        value = str(value)
+        codes = self._codes[dictionary]
+        c = codes.get(value)
+        if c is None:
+            c = codes[value] = len(self.dictionaries[dictionary])
+            self.dictionaries[dictionary].append(value)
+        return c
+
+    def append(self, ev: Dict[str, Any], round: int = 0) -> None:
+        c = self.cols
+        get = ev.get
+        unit = self._codes["unit"]
+        actor, target = get("actor_id"), get("target_id")
+        ability, hazard, effect = get("ability_id"), get("hazard_id"), get("effect_id")
+        dtype, part = get("dtype"), get("body_part")
+        # dictionary hits are the hot path; code() only runs for new (or missing) strings
+        kind = get("type")
+        c["round"].append(round)
+        codes = self._codes["kind"]
+        c["kind"].append(codes[kind] if kind in codes else self.code("kind", kind))
+        c["actor"].append(unit[actor] if actor in unit else self.code("unit", actor))
+        c["target"].append(unit[target] if target in unit else self.code("unit", target))
+        codes = self._codes["ability"]
+        c["ability"].append(codes[ability] if ability in codes else self.code("ability", ability))
+        codes = self._codes["hazard"]
+        c["hazard"].append(codes[hazard] if hazard in codes else self.code("hazard", hazard))
+        codes = self._codes["effect"]
+        c["effect"].append(codes[effect] if effect in codes else self.code("effect", effect))
+        codes = self._codes["dtype"]
+        c["dtype"].append(codes[dtype] if dtype in codes else self.code("dtype", dtype))
+        codes = self._codes["body_part"]
+        c["body_part"].append(codes[part] if part in codes else self.code("body_part", part))
+        c["amount"].append(get("amount", get("reduced", 0.0)) or 0.0)
+        c["crit"].append(1 if get("crit") else 0)
+
+    def clear(self) -> None:
+        """Drop buffered rows; dictionaries keep growing so codes stay stable across chunks."""
+        for k, t in COLUMNS.items():
+            self.cols[k] = array(t)
+
+
+class ColumnarEventSink:
+    """
+    Event listener that buffers into EventColumns and flushes every `chunk_rows` events to
+    `out_dir`: `events-00000.npz` (compressed) or, with compress=False, a directory of raw
+    `.npy` columns that iter_chunks() can memory-map without copying. dictionaries.json holds
+    the string tables and the chunk list. Use as `enc.subscribe(sink)` after sink.bind(enc).
+    """
+
+    def __init__(self, out_dir: str | Path, chunk_rows: int = 1_000_000, compress: bool = True):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError(
+                "numpy is required for columnar export (pip install worldseed-combat[analytics])."
+            )
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_rows = int(chunk_rows)
+        self.compress = compress
+        self.buf = EventColumns()
+        self.chunks: List[str] = []
+        self.rows = 0
+        self._clock = None
+        self.round = 0
+
+    def bind(self, encounter) -> "ColumnarEventSink":
+        """Take round numbers from the encounter's clock and subscribe to its events."""
+        self._clock = encounter.clock
+        encounter.subscribe(self)
+        return self
+
+    def __call__(self, ev: Dict[str, Any]) -> None:
+        self.buf.append(ev, self._clock.now if self._clock is not None else self.round)
+        if len(self.buf) >= self.chunk_rows:
+            self.flush()
+
+    def extend(self, events, round: int | None = None) -> None:
+        if round is not None:
+            self.round = round
+        for ev in events:
+            self(ev)
+
+    def flush(self) -> None:
+        if not len(self.buf):
+            return
+        arrays = {k: np.frombuffer(v, dtype=v.typecode) for k, v in self.buf.cols.items()}
+        name = f"events-{len(self.chunks):05d}"
+        if self.compress:
+            name += ".npz"
+            np.savez_compressed(self.out_dir / name, **arrays)
+        else:
+            d = self.out_dir / name
+            d.mkdir(exist_ok=True)
+            for k, a in arrays.items():
+                np.save(d / f"{k}.npy", a)
+        self.chunks.append(name)
+        self.rows += len(self.buf)
+        self.buf.clear()
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        doc = {
+            "version": 2,
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "columns": COLUMNS,
+            "code_columns": DICTIONARIES,
+            "dictionaries": self.buf.dictionaries,
+        }
+        tmp = self.out_dir / (MANIFEST + ".tmp")
+        tmp.write_text(json.dumps(doc, indent=1), encoding="utf-8")
+        os.replace(tmp, self.out_dir / MANIFEST)
+
+    def close(self) -> None:
+        self.flush()
+        self._write_manifest()
+
+    def __enter__(self) -> "ColumnarEventSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_manifest(out_dir: str | Path) -> Dict[str, Any]:
+    return json.loads((Path(out_dir) / MANIFEST).read_text(encoding="utf-8"))
+
+
+def iter_chunks(out_dir: str | Path, mmap: bool = True) -> Iterator[Dict[str, Any]]:
+    """Yield {column: ndarray} per chunk; raw .npy chunks are memory-mapped read-only."""
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("numpy is required to load columnar events.")
+    root = Path(out_dir)
+    for name in read_manifest(root)["chunks"]:
+        if name.endswith(".npz"):
+            with np.load(root / name) as z:
+                yield {k: z[k] for k in z.files}
+        else:
+            mode = "r" if mmap else None
+            yield {k: np.load(root / name / f"{k}.npy", mmap_mode=mode) for k in COLUMNS}
+
+
+def load_events(out_dir: str | Path, mmap: bool = True) -> Dict[str, Any]:
+    """All chunks as one {column: ndarray}; a single uncompressed chunk stays memory-mapped."""
+    chunks = list(iter_chunks(out_dir, mmap=mmap))
+    if not chunks:
+        return {k: np.empty(0, dtype=t) for k, t in COLUMNS.items()}
+    if len(chunks) == 1:
+        return chunks[0]
+    return {k: np.concatenate([c[k] for c in chunks]) for k in COLUMNS}
+
+
+def decode(codes, dictionary: List[str]) -> List[str | None]:
+    """Map a code column back to strings (None for -1)."""
+    return [dictionary[int(c)] if c >= 0 else None for c in codes]
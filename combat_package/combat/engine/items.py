@@ -1,15 +1,141 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Tuple
 from .combatant import Combatant
 from .rng import RandomSource
-from .effects import apply_status
+from .effects import apply_status, modify_incoming_damage
 from .resolution import resolve_attack
-from ..loaders.body_parts_loader import load_body_parts
-from pathlib import Path
+from .content import ContentHandle, shared_content
+from ..loaders.items_loader import load_items
+from ..loaders.pack_loader import load_content_packs_config
 
 
-def can_use_item(user: Combatant, item_def: Dict[str, Any]) -> tuple[bool, str]:
-    count = int(user.inventory.get(item_def.get("id", ""), 0))
+@dataclass(frozen=True)
+class CompiledItem:
+    """
+    An item definition resolved once: consumable effects as typed fields, throwables with their
+    ability-like attack definition already built (what resolve_attack takes).
+    """
+
+    id: str
+    kind: str
+    name: str = ""
+    heal_hp: float | None = None
+    restore_mana: float | None = None
+    apply_status: Tuple[str, ...] = ()
+    cleanse_status: Tuple[str, ...] = ()
+    targeting: str = "single_enemy"
+    ability: Dict[str, Any] = field(default_factory=dict, compare=False)
+    raw: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+
+def compile_item(item_def: Dict[str, Any], item_id: str | None = None) -> CompiledItem:
+    iid = str(item_id if item_id is not None else item_def.get("id", ""))
+    kind = str(item_def.get("kind", "consumable"))
+    effects = item_def.get("effects") or {}
+    return CompiledItem(
+        id=iid,
+        kind=kind,
+        name=str(item_def.get("name", iid)),
+        heal_hp=float(effects["heal_hp"]) if "heal_hp" in effects else None,
+        restore_mana=float(effects["restore_mana"]) if "restore_mana" in effects else None,
+        apply_status=tuple(effects.get("apply_status", []) or []),
+        cleanse_status=tuple(effects.get("cleanse_status", []) or []),
+        targeting=str(item_def.get("targeting", "single_enemy")),
+        ability=(
+            {
+                "id": f"item:{iid}",
+                "formula": item_def.get("formula", "INT*0.4 + 6"),
+                "damage_type": item_def.get("damage_type", "slashing"),
+                "crit": {"chance": "0.0", "multiplier": 1.5},
+            }
+            if kind == "throwable"
+            else {}
+        ),
+        raw=dict(item_def),
+    )
+
+
+class ItemCatalog:
+    """
+    Indexed, compiled items from items.yaml plus enabled content packs (packs/<name>/items.yaml,
+    merged with the content_packs.yaml policy), together with the status-effect and body-part
+    configs item use needs. Build once per content handle: ItemCatalog.for_content(content).
+    """
+
+    def __init__(
+        self,
+        items: Dict[str, CompiledItem],
+        status_cfg: Dict[str, Any],
+        body_parts: Dict[str, Any],
+        errors: List[str] | None = None,
+    ):
+        self.items = items
+        self.status_cfg = status_cfg
+        self.body_parts = body_parts
+        self.errors = errors or []
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, item_id: str) -> CompiledItem | None:
+        return self.items.get(item_id)
+
+    @classmethod
+    def from_content(cls, content: ContentHandle) -> "ItemCatalog":
+        errors: List[str] = []
+        merged = dict(content.items.get("items") or {})
+        cfg = load_content_packs_config(content.data_root / "content_packs.yaml")
+        policy = str(cfg.get("policy", "skip")).lower()
+        for pack in cfg.get("enabled", []) or []:
+            pack_items = load_items(content.data_root / "packs" / pack / "items.yaml")["items"]
+            for iid, idef in (pack_items or {}).items():
+                if iid not in merged or policy == "override":
+                    merged[iid] = idef
+                elif policy == "error":
+                    errors.append(f"Conflict in items: id '{iid}' already exists")
+        compiled = {iid: compile_item(idef or {}, iid) for iid, idef in merged.items()}
+        status_cfg = content.status_effects
+        known = (status_cfg.get("effects") or {}).keys()
+        for it in compiled.values():
+            for sid in it.apply_status:
+                if sid not in known:
+                    errors.append(f"Item '{it.id}' applies unknown status '{sid}'")
+        return cls(compiled, status_cfg, content.body_parts, errors)
+
+    @classmethod
+    def for_content(cls, content: ContentHandle | None = None) -> "ItemCatalog":
+        """Shared catalog of a content handle; rebuilt after content.reload()."""
+        return (content or shared_content()).derived("item_catalog", cls.from_content)
+
+    def use(
+        self,
+        participants: List[Combatant],
+        user: Combatant,
+        item_id: str,
+        target_ids: List[str],
+        rng: RandomSource,
+    ) -> Dict[str, Any]:
+        item = self.items.get(item_id)
+        if item is None:
+            return {"ok": False, "reason": "unknown_item", "events": []}
+        return use_item(
+            participants,
+            user,
+            item,
+            target_ids,
+            rng,
+            status_cfg=self.status_cfg,
+            body_parts=self.body_parts,
+        )
+
+
+def can_use_item(user: Combatant, item_def: Dict[str, Any] | CompiledItem) -> tuple[bool, str]:
+    iid = item_def.id if isinstance(item_def, CompiledItem) else item_def.get("id", "")
+    count = int(user.inventory.get(iid, 0))
     if count <= 0:
         return False, "no_item"
     return True, ""
@@ -18,78 +144,70 @@ def can_use_item(user: Combatant, item_def: Dict[str, Any]) -> tuple[bool, str]:
 def use_item(
     participants: List[Combatant],
     user: Combatant,
-    item_def: Dict[str, Any],
+    item_def: Dict[str, Any] | CompiledItem,
     target_ids: List[str],
     rng: RandomSource,
+    status_cfg: Dict[str, Any] | None = None,
+    body_parts: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
     """
-    Executes an item:
+    Executes an item (raw dict or CompiledItem from an ItemCatalog):
       kind: "consumable" → effects {heal_hp:int, restore_mana:int, apply_status:[ids], cleanse_status:[ids]}
       kind: "throwable"  → fields {targeting, formula, damage_type}
+    status_cfg / body_parts default to the shared combat content (no per-use file reads).
     Decrements user.inventory for the item id on success.
     Returns dict { ok:bool, reason:str, events:list }
     """
-    iid = item_def.get("id")
+    item = item_def if isinstance(item_def, CompiledItem) else compile_item(item_def)
+    iid = item.id
     evs: List[Dict[str, Any]] = []
 
-    ok, reason = can_use_item(user, item_def)
+    ok, reason = can_use_item(user, item)
     if not ok:
         return {"ok": False, "reason": reason, "events": []}
 
-    kind = str(item_def.get("kind", "consumable"))
-    if kind == "consumable":
-        effects = item_def.get("effects") or {}
+    if item.kind == "consumable":
         # targets default to self for consumables
         if not target_ids:
             target_ids = [user.id]
+        if item.apply_status and status_cfg is None:
+            status_cfg = shared_content().status_effects
         for tid in target_ids:
             tgt = next((c for c in participants if c.id == tid and c.is_alive()), None)
             if not tgt:
                 continue
-            if "heal_hp" in effects:
-                amt = float(effects["heal_hp"])
-                before = tgt.hp
-                tgt.hp = before + amt
-                evs.append({"type": "heal", "target_id": tid, "amount": amt})
-            if "restore_mana" in effects:
-                amt = float(effects["restore_mana"])
-                tgt.mana = tgt.mana + amt
-                evs.append({"type": "mana", "target_id": tid, "amount": amt})
-            for sid in effects.get("apply_status", []) or []:
-                inst = apply_status(tgt, sid, _load_status_cfg(), source_id=user.id)
+            if item.heal_hp is not None:
+                tgt.hp = tgt.hp + item.heal_hp
+                evs.append({"type": "heal", "target_id": tid, "amount": item.heal_hp})
+            if item.restore_mana is not None:
+                tgt.mana = tgt.mana + item.restore_mana
+                evs.append({"type": "mana", "target_id": tid, "amount": item.restore_mana})
+            for sid in item.apply_status:
+                inst = apply_status(tgt, sid, status_cfg, source_id=user.id)
                 if inst:
                     evs.append({"type": "effect", "target_id": tid, "effect_id": sid})
-            for sid in effects.get("cleanse_status", []) or []:
+            for sid in item.cleanse_status:
                 _cleanse_status(tgt, sid)
                 evs.append({"type": "cleanse", "target_id": tid, "effect_id": sid})
         # consume
         user.inventory[iid] = max(0, int(user.inventory.get(iid, 0)) - 1)
         return {"ok": True, "reason": "", "events": evs}
 
-    if kind == "throwable":
-        body_cfg = load_body_parts(Path(__file__).parents[2] / "data" / "body_parts.yaml")
+    if item.kind == "throwable":
+        body_cfg = body_parts if body_parts is not None else shared_content().body_parts
         # default auto-pick one enemy if none supplied
         if not target_ids:
             enemies = [c for c in participants if c.is_alive() and c.team != user.team]
             if not enemies:
                 return {"ok": False, "reason": "no_valid_target", "events": []}
             target_ids = [enemies[0].id]
-        # synthesize an ability-like dict to reuse resolve_attack
-        ability_like = {
-            "id": f"item:{iid}",
-            "formula": item_def.get("formula", "INT*0.4 + 6"),
-            "damage_type": item_def.get("damage_type", "slashing"),
-            "crit": {"chance": "0.0", "multiplier": 1.5},
-        }
         for tid in target_ids:
             tgt = next((c for c in participants if c.id == tid and c.is_alive()), None)
             if not tgt:
                 continue
-            res = resolve_attack(user, tgt, ability_like, body_cfg, rng)
+            res = resolve_attack(user, tgt, item.ability, body_cfg, rng)
             if res.hit:
-                # items ignore guard? keep consistent with abilities → call modify_incoming_damage
-                from .effects import modify_incoming_damage
-
+                # items go through guard like abilities do
                 new_amt, pre = modify_incoming_damage(tgt, res.amount, res.dtype)
                 evs.extend(pre)
                 tgt.hp = max(0.0, tgt.hp - new_amt)
@@ -118,13 +236,6 @@ def use_item(
     return {"ok": False, "reason": "unsupported_item_kind", "events": []}
 
 
-def _load_status_cfg():
-    from ..loaders.status_effects_loader import load_status_effects
-    from pathlib import Path
-
-    return load_status_effects(Path(__file__).parents[2] / "data" / "status_effects.yaml")
-
-
 def _cleanse_status(tgt: Combatant, eff_id: str) -> None:
     if not tgt.statuses:
         return
@@ -0,0 +1,362 @@
+from __future__ import annotations
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Any, Iterable, Tuple
+import json
+import math
+
+# Upper-open bucket edges for per-event amounts; the last bucket collects everything >= 128.
+DAMAGE_BUCKETS: Tuple[float, ...] = (0, 1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class RunningStat:
+    """
+    Streaming count/mean/variance/min/max (weighted Welford). O(1) memory; merge() combines
+    partial results from other workers exactly (Chan et al.).
+    """
+
+    __slots__ = ("n", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.n = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, x: float, weight: float = 1.0) -> None:
+        if weight <= 0:
+            return
+        x = float(x)
+        self.n += weight
+        delta = x - self.mean
+        self.mean += delta * weight / self.n
+        self.m2 += weight * delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def merge(self, other: "RunningStat") -> None:
+        if other.n <= 0:
+            return
+        if self.n <= 0:
+            self.n, self.mean, self.m2 = other.n, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.n
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        empty = self.n <= 0
+        return {
+            "n": self.n,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": None if empty else self.min,
+            "max": None if empty else self.max,
+            "total": self.total,
+            "stdev": self.stdev,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "RunningStat":
+        rs = cls()
+        rs.n = float(d.get("n", 0))
+        rs.mean = float(d.get("mean", 0.0))
+        rs.m2 = float(d.get("m2", 0.0))
+        if rs.n > 0:
+            rs.min = float(d["min"])
+            rs.max = float(d["max"])
+        return rs
+
+
+class Histogram:
+    """Fixed-bucket histogram: counts[i] holds edges[i-1] <= x < edges[i] (open at both ends)."""
+
+    __slots__ = ("edges", "counts")
+
+    def __init__(self, edges: Iterable[float] = DAMAGE_BUCKETS):
+        self.edges = tuple(float(e) for e in edges)
+        self.counts = [0] * (len(self.edges) + 1)
+
+    def add(self, x: float, count: int = 1) -> None:
+        self.counts[bisect_right(self.edges, float(x))] += int(count)
+
+    def merge(self, other: "Histogram") -> None:
+        if other.edges != self.edges:
+            raise ValueError("Cannot merge histograms with different bucket edges.")
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"edges": list(self.edges), "counts": list(self.counts)}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Histogram":
+        h = cls(d["edges"])
+        h.counts = [int(c) for c in d["counts"]]
+        return h
+
+
+class _Group:
+    """Counters + named RunningStats + named Histograms for one key (e.g. one ability_id)."""
+
+    __slots__ = ("counts", "stats", "hists")
+
+    def __init__(self):
+        self.counts: Dict[str, float] = {}
+        self.stats: Dict[str, RunningStat] = {}
+        self.hists: Dict[str, Histogram] = {}
+
+    def inc(self, name: str, by: float = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + by
+
+    def stat(self, name: str) -> RunningStat:
+        rs = self.stats.get(name)
+        if rs is None:
+            rs = self.stats[name] = RunningStat()
+        return rs
+
+    def hist(self, name: str) -> Histogram:
+        h = self.hists.get(name)
+        if h is None:
+            h = self.hists[name] = Histogram()
+        return h
+
+    def observe(self, name: str, x: float, weight: int = 1) -> None:
+        self.stat(name).push(x, weight)
+        self.hist(name).add(x, weight)
+
+    def merge(self, other: "_Group") -> None:
+        for k, v in other.counts.items():
+            self.inc(k, v)
+        for k, rs in other.stats.items():
+            self.stat(k).merge(rs)
+        for k, h in other.hists.items():
+            if k in self.hists:
+                self.hists[k].merge(h)
+            else:
+                self.hists[k] = Histogram.from_dict(h.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counts": dict(self.counts),
+            "stats": {k: v.to_dict() for k, v in self.stats.items()},
+            "hists": {k: v.to_dict() for k, v in self.hists.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "_Group":
+        g = cls()
+        g.counts = dict(d.get("counts") or {})
+        g.stats = {k: RunningStat.from_dict(v) for k, v in (d.get("stats") or {}).items()}
+        g.hists = {k: Histogram.from_dict(v) for k, v in (d.get("hists") or {}).items()}
+        return g
+
+
+SECTIONS = ("abilities", "dtypes", "hazards", "effects", "guard")
+
+
+class MetricsAggregator:
+    """
+    Online aggregation of engine events (Encounter.events, ability results, ArmyBattle volleys)
+    into per-ability_id / dtype / hazard_id / effect_id counters, Welford stats and histograms.
+    Memory depends on the number of keys, not on the number of events, so one aggregator can
+    follow any number of encounters. Results from several processes combine with merge().
+
+    Pass the abilities config to attribute mana spent per cast (record_cast / observe_outcome).
+    """
+
+    def __init__(self, abilities_cfg: Dict[str, Any] | None = None):
+        self._mana_cost: Dict[str, float] = {}
+        for a in (abilities_cfg or {}).get("abilities") or []:
+            if a.get("id"):
+                cost = (a.get("resource_cost") or {}).get("mana", 0)
+                self._mana_cost[a["id"]] = float(cost or 0)
+        self.sections: Dict[str, Dict[str, _Group]] = {s: {} for s in SECTIONS}
+        self.encounters = 0
+        self.rounds = 0
+
+    def _group(self, section: str, key: Any) -> _Group:
+        key = str(key) if key is not None else "unknown"
+        groups = self.sections[section]
+        g = groups.get(key)
+        if g is None:
+            g = groups[key] = _Group()
+        return g
+
+    # -------- ingestion --------
+
+    def record_cast(self, ability_id: str, mana: float | None = None) -> None:
+        g = self._group("abilities", ability_id)
+        g.inc("casts")
+        g.inc("mana_spent", self._mana_cost.get(ability_id, 0.0) if mana is None else mana)
+
+    def observe_outcome(self, outcome: Dict[str, Any]) -> None:
+        """A choose_and_execute() result: one cast plus its events."""
+        if outcome.get("ok") and outcome.get("ability_id"):
+            self.record_cast(outcome["ability_id"])
+        self.observe_all(outcome.get("events") or [])
+
+    def observe_all(self, events: Iterable[Dict[str, Any]]) -> None:
+        for ev in events:
+            self.observe(ev)
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        # usable directly as an Encounter listener
+        self.observe(event)
+
+    def observe(self, ev: Dict[str, Any]) -> None:
+        et = ev.get("type")
+        if et == "hit":
+            amt = float(ev.get("amount", 0.0))
+            g = self._group("abilities", ev.get("ability_id"))
+            g.inc("attacks")
+            g.inc("hits")
+            if ev.get("crit"):
+                g.inc("crits")
+            g.observe("damage", amt)
+            self._group("dtypes", ev.get("dtype")).observe("damage", amt)
+        elif et == "miss":
+            g = self._group("abilities", ev.get("ability_id"))
+            g.inc("attacks")
+            g.inc("misses")
+        elif et == "volley":
+            hits = int(ev.get("hits", 0))
+            amt = float(ev.get("amount", 0.0))
+            g = self._group("abilities", ev.get("ability_id"))
+            g.inc("attacks", int(ev.get("attacks", 0)))
+            g.inc("hits", hits)
+            g.inc("misses", int(ev.get("attacks", 0)) - hits)
+            g.inc("crits", int(ev.get("crits", 0)))
+            g.inc("casualties", int(ev.get("casualties", 0)))
+            if hits:
+                # per-hit mean of the bulk roll, weighted by the number of hits
+                g.observe("damage", amt / hits, hits)
+                self._group("dtypes", ev.get("dtype")).observe("damage", amt / hits, hits)
+        elif et == "effect":
+            g = self._group("effects", ev.get("effect_id"))
+            g.inc("applied", int(ev.get("count", 1)))
+            if ev.get("ability_id"):
+                self._group("abilities", ev["ability_id"]).inc("effects_applied")
+        elif et == "dot":
+            amt = float(ev.get("amount", 0.0))
+            self._group("effects", ev.get("effect_id")).observe("tick_damage", amt)
+            self._group("dtypes", ev.get("dtype") or "dot").observe("damage", amt)
+        elif et == "hazard":
+            kind = ev.get("kind") or "unknown"
+            amt = float(ev.get("amount", 0.0) or 0.0)
+            g = self._group("hazards", ev.get("hazard_id"))
+            g.inc("ticks")
+            g.observe(kind, amt)
+            if kind == "damage":
+                self._group("dtypes", ev.get("dtype")).observe("damage", amt)
+        elif et == "guard_block":
+            self._group("guard", "guard").observe("blocked", float(ev.get("reduced", 0.0)))
+
+    def observe_round(self, active_hazard_ids: Iterable[str]) -> None:
+        """Count one round and which hazards were active in it (for uptime)."""
+        self.rounds += 1
+        for hid in active_hazard_ids:
+            self._group("hazards", hid).inc("active_rounds")
+
+    def observe_encounter(self, encounter) -> None:
+        """Fold a finished Encounter's event log in (post-hoc alternative to subscribe)."""
+        self.encounters += 1
+        self.observe_all(encounter.events)
+
+    # -------- combining / export --------
+
+    def merge(self, other: "MetricsAggregator") -> "MetricsAggregator":
+        for section, groups in other.sections.items():
+            for key, g in groups.items():
+                self._group(section, key).merge(g)
+        for k, v in other._mana_cost.items():
+            self._mana_cost.setdefault(k, v)
+        self.encounters += other.encounters
+        self.rounds += other.rounds
+        return self
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Derived balance numbers (rates, damage per mana, hazard uptime)."""
+        out: Dict[str, Dict[str, Any]] = {"abilities": {}, "hazards": {}}
+        for aid, g in self.sections["abilities"].items():
+            c = g.counts
+            dmg = g.stats["damage"].total if "damage" in g.stats else 0.0
+            attacks = c.get("attacks", 0)
+            hits = c.get("hits", 0)
+            mana = c.get("mana_spent", 0)
+            out["abilities"][aid] = {
+                "hit_rate": hits / attacks if attacks else 0.0,
+                "crit_rate": c.get("crits", 0) / hits if hits else 0.0,
+                "total_damage": dmg,
+                "damage_per_mana": dmg / mana if mana else None,
+            }
+        for hid, g in self.sections["hazards"].items():
+            out["hazards"][hid] = {
+                "uptime": g.counts.get("active_rounds", 0) / self.rounds if self.rounds else None,
+                "ticks": g.counts.get("ticks", 0),
+            }
+        guard = self.sections["guard"].get("guard")
+        out["guard_blocked_total"] = guard.stats["blocked"].total if guard else 0.0
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": 1,
+            "encounters": self.encounters,
+            "rounds": self.rounds,
+            "mana_cost": dict(self._mana_cost),
+            "sections": {
+                s: {k: g.to_dict() for k, g in sorted(groups.items())}
+                for s, groups in self.sections.items()
+            },
+            "summary": self.summary(),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "MetricsAggregator":
+        agg = cls()
+        agg._mana_cost = dict(d.get("mana_cost") or {})
+        agg.encounters = int(d.get("encounters", 0))
+        agg.rounds = int(d.get("rounds", 0))
+        for s, groups in (d.get("sections") or {}).items():
+            agg.sections[s] = {k: _Group.from_dict(g) for k, g in groups.items()}
+        return agg
+
+    def to_json(self, path: str | Path | None = None, indent: int | None = 2) -> str:
+        text = json.dumps(self.to_dict(), indent=indent, sort_keys=True)
+        if path is not None:
+            Path(path).write_text(text, encoding="utf-8")
+        return text
+
+    @classmethod
+    def from_json(cls, text: str) -> "MetricsAggregator":
+        return cls.from_dict(json.loads(text))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "MetricsAggregator":
+        return cls.from_json(Path(path).read_text(encoding="utf-8"))
+
+
+def merge_all(aggs: Iterable[MetricsAggregator]) -> MetricsAggregator:
+    out = MetricsAggregator()
+    for a in aggs:
+        out.merge(a)
+    return out
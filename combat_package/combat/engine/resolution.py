@@ -119,19 +119,7 @@ def _pick_body_part(
     return _weighted_choice(pruned, rng)
 
 
-def resolve_attack(
-    attacker: Combatant,
-    target: Combatant,
-    ability_def: Dict[str, Any],
-    body_parts: Dict[str, Any],
-    rng: RandomSource,
-) -> AttackResult:
-    """
-    Compute hit/crit/damage using safe data-driven formulas.
-    - attacker/target stats are floats (missing default to 0)
-    - resistances are 0..1 (clamped)
-    """
-    # context
+def _build_attack_context(attacker: Combatant, target: Combatant) -> tuple[Dict[str, float], float]:
     A = attacker.stats or {}
     T = target.stats or {}
     ctx = {
@@ -144,13 +132,28 @@ def resolve_attack(
         # allow target dex in formulas with T_DEX if desired
         "T_DEX": float(T.get("DEX", 0.0)),
     }
+    return ctx, hit_chance(ctx)
+
 
+def attack_context(attacker: Combatant, target: Combatant) -> Dict[str, float]:
+    """
+    Formula names visible to ability expressions (attacker stats + target ARM/DEX).
+    Memoized per attacker/target pair until either side's stats change — treat as read-only.
+    """
+    return attacker.pair_cached(target, _build_attack_context)[0]
+
+
+def pair_hit_chance(attacker: Combatant, target: Combatant) -> float:
+    return attacker.pair_cached(target, _build_attack_context)[1]
+
+
+def hit_chance(ctx: Dict[str, float]) -> float:
     # hit chance (simple) - ensure reasonable hit chance for testing
-    acc = _clamp(0.75 + (ctx["DEX"] - ctx["T_DEX"]) * 0.01, 0.15, 0.95)
-    if rng.randf() > acc:
-        return AttackResult(hit=False)
+    return _clamp(0.75 + (ctx["DEX"] - ctx["T_DEX"]) * 0.01, 0.15, 0.95)
 
-    # crit chance & mult
+
+def crit_profile(ability_def: Dict[str, Any], ctx: Dict[str, float]) -> tuple[float, float]:
+    """(crit chance, crit multiplier)"""
     crit_def = ability_def.get("crit") or {}
     crit_chance_expr = crit_def.get("chance", "0.05")
     crit_mult = float(crit_def.get("multiplier", 1.5))
@@ -158,21 +161,51 @@ def resolve_attack(
         crit_chance = _clamp(_safe_eval(crit_chance_expr, ctx), 0.0, 1.0)
     except Exception:
         crit_chance = 0.05
-    is_crit = rng.randf() < crit_chance
+    return crit_chance, crit_mult
 
-    # base damage
+
+def base_damage(ability_def: Dict[str, Any], ctx: Dict[str, float]) -> float:
+    """Pre-crit, pre-resist damage of one hit."""
     formula = ability_def.get("formula", "ATT + WPN - ARM*0.6")
     try:
-        base = max(0.0, _safe_eval(formula, ctx))
+        return max(0.0, _safe_eval(formula, ctx))
     except Exception:
-        base = max(0.0, ctx["ATT"] + ctx["WPN"] - ctx["ARM"] * 0.6)
+        return max(0.0, ctx["ATT"] + ctx["WPN"] - ctx["ARM"] * 0.6)
+
+
+def resist_factor(target: Combatant, dtype: str) -> float:
+    """Damage multiplier after the target's resistance (clamped to 0..0.95)."""
+    res = float(target.resist.get(dtype, 0.0))
+    return 1.0 - _clamp(res, 0.0, 0.95)
+
+
+def resolve_attack(
+    attacker: Combatant,
+    target: Combatant,
+    ability_def: Dict[str, Any],
+    body_parts: Dict[str, Any],
+    rng: RandomSource,
+) -> AttackResult:
+    """
+    Compute hit/crit/damage using safe data-driven formulas.
+    - attacker/target stats are floats (missing default to 0)
+    - resistances are 0..1 (clamped)
+    """
+    ctx, acc = attacker.pair_cached(target, _build_attack_context)
+    if rng.randf() > acc:
+        return AttackResult(hit=False)
+
+    # crit chance & mult
+    crit_chance, crit_mult = crit_profile(ability_def, ctx)
+    is_crit = rng.randf() < crit_chance
+
+    # base damage
+    base = base_damage(ability_def, ctx)
     if is_crit:
         base *= crit_mult
 
     dtype = str(ability_def.get("damage_type", "slashing"))
-    res = float(target.resist.get(dtype, 0.0))
-    res = _clamp(res, 0.0, 0.95)
-    amt = round(base * (1.0 - res), 1)
+    amt = round(base * resist_factor(target, dtype), 1)
 
     groups = body_parts.get("groups", {})
     weights = body_parts.get("weights", {})
@@ -21,6 +21,40 @@ class RandomSource:
         # Coerce to list so generators/sets are safe
         return self._rng.choice(list(seq))
 
+    def binomial(self, n: int, p: float) -> int:
+        """Number of successes in n trials of chance p (bulk rolls for squads)."""
+        n = int(n)
+        if n <= 0 or p <= 0.0:
+            return 0
+        if p >= 1.0:
+            return n
+        if n <= 64:
+            r = self._rng.random
+            return sum(1 for _ in range(n) if r() < p)
+        q = min(p, 1.0 - p)
+        if n * q < 30.0:
+            # few successes (or failures) expected: exact inversion, the normal approximation
+            # is badly skewed there (rare crits or procs in a big squad)
+            k = self._invert(n, q)
+            return k if q == p else n - k
+        # normal approximation, clamped to the valid range
+        mean = n * p
+        sd = (mean * (1.0 - p)) ** 0.5
+        return max(0, min(n, int(round(self._rng.gauss(mean, sd)))))
+
+    def _invert(self, n: int, q: float) -> int:
+        # walk the binomial pmf up from 0 until it covers one uniform draw (~n*q + 1 steps)
+        s = q / (1.0 - q)
+        a = (n + 1) * s
+        pmf = (1.0 - q) ** n
+        u = self._rng.random()
+        k = 0
+        while u > pmf and k < n:
+            u -= pmf
+            k += 1
+            pmf *= a / k - s
+        return k
+
     # NEW: state get/set for snapshot/restore
     def get_state(self):
         return self._rng.getstate()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Tuple
+import os
+import sys
+
+from .combatant import Combatant
+
+_HEADER = 8  # one int64: publish counter (odd while a write is in progress)
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _tracker_id() -> Tuple[int, int] | None:
+    """
+    Identity of this process's multiprocessing resource tracker: the (device, inode) of its
+    pipe. Processes sharing one tracker (the owner and its fork or spawn children, which
+    inherit the pipe) get the same value; None if no tracker is running here yet.
+    """
+    from multiprocessing import resource_tracker
+
+    fd = getattr(resource_tracker._resource_tracker, "_fd", None)
+    if fd is None:
+        return None
+    try:
+        st = os.fstat(fd)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+class SharedParticipants:
+    """
+    Struct-of-arrays copy of participant core state in one multiprocessing.shared_memory block:
+    hp, mana, alive, team code, one column per stat name and one per resist damage type.
+    Columns are contiguous typed memoryviews (zero copy) — other processes attach by `spec`.
+
+    The owning process writes (see Encounter.attach_shared); attached readers should treat the
+    block as read-only. `seq` is bumped around every publish: equal, even values before and
+    after a read mean the read saw one consistent state.
+    """
+
+    def __init__(self, spec: Dict[str, Any], shm: shared_memory.SharedMemory, owner: bool):
+        self.spec = spec
+        self.shm = shm
+        self.owner = owner
+        self.ids: List[str] = list(spec["ids"])
+        self.index: Dict[str, int] = {cid: i for i, cid in enumerate(self.ids)}
+        self.stat_names: List[str] = list(spec["stats"])
+        self.resist_names: List[str] = list(spec["resists"])
+        self.teams: List[str] = list(spec["teams"])
+        n = len(self.ids)
+        buf = shm.buf
+        self._seq = buf[0:_HEADER].cast("q")
+        off = _HEADER
+        views: Dict[str, memoryview] = {}
+        for name, fmt, size in self._columns(spec):
+            nbytes = size * n
+            views[name] = buf[off : off + nbytes].cast(fmt)
+            off = _align(off + nbytes)
+        self.hp = views["hp"]
+        self.mana = views["mana"]
+        self.alive = views["alive"]
+        self.team = views["team"]
+        self.stats = {k: views[f"stat:{k}"] for k in self.stat_names}
+        self.resist = {k: views[f"resist:{k}"] for k in self.resist_names}
+
+    @staticmethod
+    def _columns(spec: Dict[str, Any]):
+        yield "hp", "d", 8
+        yield "mana", "d", 8
+        for k in spec["stats"]:
+            yield f"stat:{k}", "d", 8
+        for k in spec["resists"]:
+            yield f"resist:{k}", "d", 8
+        yield "team", "i", 4
+        yield "alive", "B", 1
+
+    @classmethod
+    def _size(cls, spec: Dict[str, Any]) -> int:
+        n = len(spec["ids"])
+        return _HEADER + sum(_align(size * n) for _, _, size in cls._columns(spec))
+
+    @classmethod
+    def create(cls, participants: List[Combatant], name: str | None = None) -> "SharedParticipants":
+        stats = sorted({k for c in participants for k in (c.stats or {})})
+        resists = sorted({k for c in participants for k in (c.resist or {})})
+        teams = sorted({c.team for c in participants})
+        spec = {
+            "name": None,
+            "ids": [c.id for c in participants],
+            "stats": stats,
+            "resists": resists,
+            "teams": teams,
+        }
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(1, cls._size(spec)))
+        spec["name"] = shm.name
+        spec["tracker"] = _tracker_id()
+        block = cls(spec, shm, owner=True)
+        block.write_all(participants)
+        return block
+
+    @classmethod
+    def attach(cls, spec: Dict[str, Any]) -> "SharedParticipants":
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=spec["name"], track=False)
+        else:  # 3.12 and older always register with the resource tracker
+            # an attached reader must not stay tracked: an unrelated process's tracker would
+            # unlink the owner's block when the reader exits. A reader sharing the owner's
+            # tracker (same process, fork/spawn children) only re-added the owner's own entry,
+            # and unregistering it would drop the owner's. Checked before attaching, since
+            # attaching starts a tracker of its own in a process that has none.
+            from multiprocessing import resource_tracker
+
+            tracker = spec.get("tracker")
+            shared = tracker is not None and _tracker_id() == tuple(tracker)
+            shm = shared_memory.SharedMemory(name=spec["name"])
+            if not shared:
+                resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(spec, shm, owner=False)
+
+    # -------- writes (owner) --------
+
+    def _write_row(self, i: int, c: Combatant, full: bool) -> None:
+        self.hp[i] = float(c.hp)
+        self.mana[i] = float(c.mana)
+        self.alive[i] = 1 if c.hp > 0 else 0
+        if full:
+            self.team[i] = self.teams.index(c.team) if c.team in self.teams else -1
+            for k, col in self.stats.items():
+                col[i] = float(c.stats.get(k, 0.0))
+            for k, col in self.resist.items():
+                col[i] = float(c.resist.get(k, 0.0))
+
+    def write(self, participants: List[Combatant], full: bool = False) -> None:
+        """Publish hp/mana/alive (plus team/stats/resists when full) for these participants."""
+        self._seq[0] += 1
+        try:
+            for c in participants:
+                i = self.index.get(c.id)
+                if i is not None:
+                    self._write_row(i, c, full)
+        finally:
+            self._seq[0] += 1
+
+    def write_all(self, participants: List[Combatant]) -> None:
+        self.write(participants, full=True)
+
+    # -------- reads --------
+
+    @property
+    def seq(self) -> int:
+        return int(self._seq[0])
+
+    def row(self, cid: str) -> Dict[str, Any]:
+        i = self.index[cid]
+        team = self.team[i]
+        return {
+            "id": cid,
+            "hp": self.hp[i],
+            "mana": self.mana[i],
+            "alive": bool(self.alive[i]),
+            "team": self.teams[team] if team >= 0 else None,
+            "stats": {k: col[i] for k, col in self.stats.items()},
+            "resist": {k: col[i] for k, col in self.resist.items()},
+        }
+
+    def living(self, team: str | None = None) -> List[str]:
+        code = self.teams.index(team) if team in self.teams else None
+        return [
+            cid
+            for i, cid in enumerate(self.ids)
+            if self.alive[i] and (team is None or self.team[i] == code)
+        ]
+
+    def close(self) -> None:
+        # views must be released before the mapping can close
+        for v in (self.hp, self.mana, self.alive, self.team, self._seq):
+            v.release()
+        for v in list(self.stats.values()) + list(self.resist.values()):
+            v.release()
+        self.shm.close()
+
+    def unlink(self) -> None:
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self) -> "SharedParticipants":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+        self.unlink()
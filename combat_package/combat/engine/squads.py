@@ -0,0 +1,351 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
+import copy
+import math
+
+from .abilities import can_use_ability, _spend_resource
+from .combatant import Combatant, TurnClock
+from .content import ContentHandle, shared_content
+from .effects import apply_status, export_statuses, tick_start_of_turn
+from .environment import Environment, hazard_damage, hazard_targets
+from .resolution import attack_context, base_damage, crit_profile, hit_chance, resist_factor
+from .rng import RandomSource
+
+
+@dataclass
+class Squad:
+    """
+    `count` identical units sharing one stat block (`unit`), one HP pool and one status list.
+    Damage comes off the pool; a member dies each time the pool drops below another
+    multiple of unit_hp. `unit.hp` is not used while the unit is part of a squad; every
+    other resource on `unit` (mana, cooldowns) is per member, i.e. the value each member has.
+    """
+
+    id: str
+    unit: Combatant
+    count: int
+    unit_hp: float
+    hp_pool: float = -1.0
+    ability_id: str = "basic_attack"
+
+    def __post_init__(self):
+        if self.hp_pool < 0:
+            self.hp_pool = self.unit_hp * self.count
+
+    @property
+    def name(self) -> str:
+        return self.unit.name
+
+    @property
+    def team(self) -> str:
+        return self.unit.team
+
+    def is_alive(self) -> bool:
+        return self.count > 0
+
+    def take_damage(self, amount: float) -> int:
+        """Remove amount from the pool; returns casualties."""
+        before = self.count
+        self.hp_pool = max(0.0, self.hp_pool - float(amount))
+        left = math.ceil(self.hp_pool / self.unit_hp - 1e-9) if self.unit_hp > 0 else 0
+        self.count = max(0, min(self.count, left))
+        return before - self.count
+
+    def heal(self, per_member: float) -> float:
+        """Heal every living member; the dead stay dead. Returns the total healed."""
+        cap = self.count * self.unit_hp
+        healed = max(0.0, min(cap, self.hp_pool + per_member * self.count) - self.hp_pool)
+        self.hp_pool += healed
+        return healed
+
+    def split(self, n: int, new_id: str) -> "Squad":
+        """Move n members (with their share of the pool) into a new squad."""
+        n = max(0, min(int(n), self.count))
+        share = self.hp_pool * n / self.count if self.count else 0.0
+        unit = copy.deepcopy(self.unit)
+        unit.id = new_id
+        unit.clock = self.unit.clock  # cooldowns stay on the shared battle clock
+        self.count -= n
+        self.hp_pool -= share
+        return Squad(new_id, unit, n, self.unit_hp, share, self.ability_id)
+
+
+def make_squad(template: Combatant, count: int, squad_id: str | None = None) -> Squad:
+    unit = copy.deepcopy(template)
+    if squad_id:
+        unit.id = squad_id
+    return Squad(unit.id, unit, int(count), float(template.hp))
+
+
+def _signature(unit: Combatant, unit_hp: float) -> Tuple:
+    return (
+        unit.team,
+        unit.name,
+        unit.location,
+        unit_hp,
+        tuple(sorted(unit.stats.items())),
+        tuple(sorted(unit.resist.items())),
+        tuple(unit.tags),
+        tuple(sorted(unit.cooldowns.items())),
+        tuple(tuple(sorted(s.items())) for s in export_statuses(unit)),
+    )
+
+
+def group_units(units: List[Combatant]) -> List[Squad]:
+    """Aggregate homogeneous units (same team, stats, resists, tags, HP, statuses) into squads."""
+    groups: Dict[Tuple, List[Combatant]] = {}
+    for u in units:
+        if u.is_alive():
+            groups.setdefault(_signature(u, float(u.hp)), []).append(u)
+    return [make_squad(members[0], len(members)) for members in groups.values()]
+
+
+def merge_squads(squads: List[Squad]) -> List[Squad]:
+    """Fold squads that became homogeneous again (e.g. after a split-off status expired)."""
+    out: List[Squad] = []
+    by_sig: Dict[Tuple, Squad] = {}
+    for s in squads:
+        if not s.is_alive():
+            continue
+        sig = (s.ability_id, _signature(s.unit, s.unit_hp))
+        keep = by_sig.get(sig)
+        if keep is None:
+            by_sig[sig] = s
+            out.append(s)
+        else:
+            keep.count += s.count
+            keep.hp_pool += s.hp_pool
+    return out
+
+
+def volley(
+    attacker: Squad,
+    target: Squad,
+    ability_def: Dict[str, Any],
+    rng: RandomSource,
+    trials: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Resolve `trials` attacks (default: one per living attacker) of attacker on target in bulk,
+    using the same hit/crit/damage/resist formulas as resolve_attack.
+    """
+    n = attacker.count if trials is None else int(trials)
+    ctx = attack_context(attacker.unit, target.unit)
+    hits = rng.binomial(n, hit_chance(ctx))
+    crit_chance, crit_mult = crit_profile(ability_def, ctx)
+    crits = rng.binomial(hits, crit_chance)
+    dtype = str(ability_def.get("damage_type", "slashing"))
+    base = base_damage(ability_def, ctx)
+    rf = resist_factor(target.unit, dtype)
+    total = (hits - crits) * round(base * rf, 1) + crits * round(base * crit_mult * rf, 1)
+    casualties = target.take_damage(total)
+    return {
+        "type": "volley",
+        "actor_id": attacker.id,
+        "target_id": target.id,
+        "ability_id": ability_def.get("id"),
+        "attacks": n,
+        "hits": hits,
+        "crits": crits,
+        "amount": round(total, 1),
+        "dtype": dtype,
+        "casualties": casualties,
+    }
+
+
+class ArmyBattle:
+    """
+    Army-scale battle over squads instead of individual Combatants.
+    Each round, squads act in DEX order (like Encounter): start_of_turn hazards and DoTs hit the
+    acting squad, then it fires its ability as one bulk volley (all_enemies abilities hit every
+    member of every enemy squad), then end_of_turn hazards. start_of_round hazards hit everyone.
+    On-hit and hazard statuses that land on only part of a squad split it; squads that become
+    identical again are merged at the end of each round.
+    """
+
+    def __init__(
+        self,
+        squads: List[Squad],
+        seed: int | None = 1234,
+        content: ContentHandle | None = None,
+        status_cfg: Dict[str, Any] | None = None,
+    ):
+        if not squads:
+            raise ValueError("ArmyBattle requires at least one squad.")
+        self.squads = list(squads)
+        self.rng = RandomSource(seed)
+        self.content = content if content is not None else shared_content()
+        self.status_cfg = status_cfg if status_cfg is not None else self.content.status_effects
+        self.clock = TurnClock(1)
+        for s in self.squads:
+            s.unit.attach_clock(self.clock)
+        self.env = Environment(self.content.hazards, start_round=self.clock.now)
+        self.events: List[Dict[str, Any]] = []
+        self._splits = 0
+
+    @property
+    def round(self) -> int:
+        return self.clock.now
+
+    def living(self, team: str | None = None) -> List[Squad]:
+        return [s for s in self.squads if s.is_alive() and (team is None or s.team == team)]
+
+    def unit_counts(self) -> Dict[str, int]:
+        out: Dict[str, int] = {}
+        for s in self.living():
+            out[s.team] = out.get(s.team, 0) + s.count
+        return out
+
+    def _new_id(self, base: str) -> str:
+        self._splits += 1
+        return f"{base}#{self._splits}"
+
+    def _apply_status(self, squad: Squad, eff_id: str, affected: int, source_id: str) -> None:
+        if affected <= 0 or not squad.is_alive():
+            return
+        if affected < squad.count:
+            squad = squad.split(affected, self._new_id(squad.id))
+            self.squads.append(squad)
+        inst = apply_status(squad.unit, eff_id, self.status_cfg, source_id=source_id)
+        if inst:
+            self.events.append(
+                {"type": "effect", "target_id": squad.id, "effect_id": eff_id, "count": affected}
+            )
+
+    def _hazards(self, phase: str, squads: List[Squad]) -> None:
+        by_unit = {id(s.unit): s for s in squads if s.is_alive()}
+        for hz in list(self.env.hazards):
+            if hz.get("phase") != phase:
+                continue
+            eff = hz.get("effects") or {}
+            for unit in hazard_targets(hz, [s.unit for s in by_unit.values()]):
+                sq = by_unit[id(unit)]
+                if "damage" in eff:
+                    val, dtype = hazard_damage(eff["damage"] or {}, unit)
+                    if val > 0:
+                        total = min(val, sq.unit_hp) * sq.count
+                        cas = sq.take_damage(total)
+                        self.events.append(
+                            {
+                                "type": "hazard",
+                                "hazard_id": hz.get("id"),
+                                "target_id": sq.id,
+                                "kind": "damage",
+                                "amount": round(total, 1),
+                                "dtype": dtype,
+                                "casualties": cas,
+                            }
+                        )
+                if "heal" in eff and sq.is_alive():
+                    healed = sq.heal(float(eff["heal"].get("amount", 0)))
+                    if healed > 0:
+                        self.events.append(
+                            {
+                                "type": "hazard",
+                                "hazard_id": hz.get("id"),
+                                "target_id": sq.id,
+                                "kind": "heal",
+                                "amount": round(healed, 1),
+                                "dtype": None,
+                            }
+                        )
+                if "resource" in eff:
+                    sq.unit.mana += float((eff["resource"] or {}).get("mana", 0))
+                for spec in eff.get("apply_status") or []:
+                    eid = spec.get("id")
+                    if eid and sq.is_alive():
+                        hit = self.rng.binomial(sq.count, float(spec.get("chance", 1.0)))
+                        self._apply_status(sq, eid, hit, f"hazard:{hz.get('id')}")
+
+    def _tick_statuses(self, squad: Squad) -> None:
+        if not squad.unit.statuses:
+            return
+        # the shared status list ticks once for the whole squad; amounts are per member
+        squad.unit.hp = squad.unit_hp
+        for ev in tick_start_of_turn(squad.unit, self.status_cfg, self.rng):
+            total = min(ev["amount"], squad.unit_hp) * squad.count
+            cas = squad.take_damage(total)
+            self.events.append(
+                {
+                    "type": "dot",
+                    "target_id": squad.id,
+                    "effect_id": ev["effect_id"],
+                    "amount": round(total, 1),
+                    "casualties": cas,
+                }
+            )
+        squad.unit.hp = squad.unit_hp
+
+    def _choose_ability(self, squad: Squad) -> Dict[str, Any]:
+        ab = self.content.ability(squad.ability_id)
+        # self-targeted abilities (guard) have no bulk form; squads fall back to attacking
+        if (
+            ab is not None
+            and str(ab.get("targeting", "single_enemy")) in ("single_enemy", "all_enemies")
+            and can_use_ability(squad.unit, ab)[0]
+        ):
+            return ab
+        return self.content.ability("basic_attack") or {
+            "id": "basic_attack",
+            "formula": "ATT + WPN - ARM*0.6",
+            "damage_type": "slashing",
+            "targeting": "single_enemy",
+        }
+
+    def take_turn(self, squad: Squad) -> None:
+        self._hazards("start_of_turn", [squad])
+        self._tick_statuses(squad)
+        if not squad.is_alive():
+            return
+        enemies = [s for s in self.living() if s.team != squad.team]
+        if enemies:
+            ab = self._choose_ability(squad)
+            # every member casts and pays from its own pool; `unit` holds that per-member
+            # pool, so one spend charges each member once
+            for k, v in (ab.get("resource_cost") or {}).items():
+                _spend_resource(squad.unit, k, float(v))
+            cd = int(ab.get("cooldown", 0) or 0)
+            if cd > 0:
+                squad.unit.start_cooldown(ab.get("id", ""), cd)
+            if str(ab.get("targeting", "single_enemy")) == "all_enemies":
+                pairs = [(t, squad.count * t.count) for t in enemies]
+            else:
+                pairs = [(enemies[0], squad.count)]
+            for tgt, trials in pairs:
+                ev = volley(squad, tgt, ab, self.rng, trials=trials)
+                self.events.append(ev)
+                for spec in (ab.get("on_hit") or {}).get("apply_status") or []:
+                    eid = spec.get("id")
+                    if eid and ev["hits"]:
+                        landed = self.rng.binomial(ev["hits"], float(spec.get("chance", 1.0)))
+                        self._apply_status(tgt, eid, min(tgt.count, landed), squad.id)
+        self._hazards("end_of_turn", [squad])
+
+    def run_round(self) -> None:
+        self._hazards("start_of_round", self.living())
+        order = sorted(
+            self.living(),
+            key=lambda s: (-float(s.unit.stats.get("DEX", 0.0) or 0.0), s.name.lower(), s.id),
+        )
+        for squad in order:
+            if len({s.team for s in self.living()}) <= 1:
+                break
+            if squad.is_alive():
+                self.take_turn(squad)
+        self.squads = merge_squads(self.squads)
+        self.clock.now += 1
+        self.env.tick_round_boundary(self.clock.now)
+
+    def run(self, max_rounds: int = 50) -> Dict[str, Any]:
+        """Returns {ended, winner_team, rounds, survivors: {team: units}}."""
+        start = self.round
+        while self.round - start < max_rounds and len({s.team for s in self.living()}) > 1:
+            self.run_round()
+        teams = {s.team for s in self.living()}
+        return {
+            "ended": len(teams) <= 1,
+            "winner_team": next(iter(teams)) if len(teams) == 1 else None,
+            "rounds": self.round - start,
+            "survivors": self.unit_counts(),
+        }
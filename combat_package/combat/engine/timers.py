@@ -0,0 +1,38 @@
+from __future__ import annotations
+from typing import Any, List, Tuple
+import heapq
+
+
+class ExpiryQueue:
+    """
+    Min-heap of (due, seq, item) timers.
+    pop_due(now) only touches entries that are actually due, so expiry costs O(k log n) for k
+    expirations instead of a pass over everything that is alive. Entries are never removed
+    early: callers re-check an item's current deadline when it pops (lazy cancellation).
+    """
+
+    __slots__ = ("_heap", "_seq")
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, Any]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, due: int, item: Any) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (int(due), self._seq, item))
+
+    def next_due(self) -> int | None:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: int) -> List[Any]:
+        out: List[Any] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            out.append(heapq.heappop(heap)[2])
+        return out
+
+    def clear(self) -> None:
+        self._heap.clear()
@@ -1,14 +1,13 @@
 from __future__ import annotations
 from pathlib import Path
-import yaml
+from .yaml_utils import safe_load_path
 
 
 def load_body_parts(path: str | Path) -> dict:
     p = Path(path)
     if not p.exists():
         return {"groups": {}, "weights": {}}
-    with open(p, "r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+    data = safe_load_path(p) or {}
     data.setdefault("groups", {})
     data.setdefault("weights", {})
     return data
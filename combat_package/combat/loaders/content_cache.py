@@ -0,0 +1,168 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+import hashlib
+import os
+import pickle
+
+from .pack_loader import merge_content_with_packs, load_content_packs_config
+from ..validators.validate import IncrementalValidator
+
+# Bump whenever the merged bundle layout or the cache record changes.
+CACHE_VERSION = 2
+BASE_FILES = (
+    "abilities.yaml",
+    "damage_types.yaml",
+    "narration.yaml",
+    "body_parts.yaml",
+    "status_effects.yaml",
+)
+PACK_FILES = BASE_FILES
+
+
+def default_cache_path(data_root: Path) -> Path:
+    return Path(data_root) / ".cache" / "content_bundle.pickle"
+
+
+def source_paths(data_root: Path) -> List[Path]:
+    """
+    Every file the merged bundle depends on, including pack files that do not exist yet
+    (so that adding one later invalidates the cache).
+    """
+    data_root = Path(data_root)
+    paths = [data_root / name for name in BASE_FILES]
+    cfg_path = data_root / "content_packs.yaml"
+    paths.append(cfg_path)
+    cfg = load_content_packs_config(cfg_path)
+    for pack in cfg.get("enabled", []) or []:
+        pd = data_root / "packs" / str(pack)
+        paths.extend(pd / name for name in PACK_FILES)
+    return paths
+
+
+def _stat_key(p: Path) -> Tuple[int, int] | None:
+    try:
+        st = p.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _content_hash(p: Path) -> str | None:
+    try:
+        return hashlib.sha256(p.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _fingerprint(paths: List[Path]) -> Dict[str, Dict[str, Any]]:
+    return {str(p): {"stat": _stat_key(p), "sha256": _content_hash(p)} for p in paths}
+
+
+def _is_fresh(sources: Dict[str, Dict[str, Any]]) -> Tuple[bool, bool]:
+    """
+    Returns (fresh, stats_changed).
+    Stats are checked first; only files whose mtime/size moved are re-hashed, so a touched
+    but unchanged file still counts as fresh.
+    """
+    stats_changed = False
+    for path, rec in sources.items():
+        p = Path(path)
+        stat = _stat_key(p)
+        want = tuple(rec["stat"]) if rec.get("stat") is not None else None
+        if stat == want:
+            continue
+        stats_changed = True
+        if stat is None or want is None:
+            return False, True
+        if _content_hash(p) != rec.get("sha256"):
+            return False, True
+    return True, stats_changed
+
+
+def _read_cache(cache_path: Path) -> Dict[str, Any] | None:
+    try:
+        with open(cache_path, "rb") as fh:
+            rec = pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(rec, dict) or rec.get("version") != CACHE_VERSION:
+        return None
+    return rec
+
+
+def _write_cache(cache_path: Path, rec: Dict[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump(rec, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except OSError:
+        # read-only installs still work, they just never get a warm start
+        pass
+
+
+def section_keys(sources: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Validation key per bundle section: the sha256 of every source file merged into it (base
+    and pack files alike) plus content_packs.yaml, whose enabled list and policy shape the
+    merge. A section whose key is unchanged validates to the same errors.
+    """
+    config = [rec["sha256"] for p, rec in sources.items() if Path(p).name == "content_packs.yaml"]
+    return {
+        name[: -len(".yaml")]: (
+            tuple(config),
+            tuple(rec["sha256"] for p, rec in sources.items() if Path(p).name == name),
+        )
+        for name in BASE_FILES
+    }
+
+
+def build_content(data_root: Path, previous: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """
+    Parse, merge and validate from YAML; returns a cache record. Validation results of a
+    `previous` record are reused for every section whose source files did not change.
+    """
+    data_root = Path(data_root)
+    # fingerprint before parsing so an edit during the build leaves the record stale
+    sources = _fingerprint(source_paths(data_root))
+    bundle, merge_errors = merge_content_with_packs(data_root)
+    validator = IncrementalValidator((previous or {}).get("validation"))
+    errors = validator.validate(bundle, section_keys(sources))
+    return {
+        "version": CACHE_VERSION,
+        "sources": sources,
+        "bundle": bundle,
+        "errors": list(merge_errors) + errors,
+        "validation": validator.state,
+    }
+
+
+def load_merged_content(
+    data_root: Path,
+    cache_path: Path | None = None,
+    refresh: bool = False,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Same bundle as merge_content_with_packs, already validated, served from an on-disk cache.
+    Returns (bundle, errors) where errors = merge errors + validate_bundle errors.
+    The cache is keyed by source paths, mtimes, sizes and sha256 of each file; any change
+    (including enabling a pack or adding a file to one) triggers a rebuild, in which only
+    the sections fed by changed files are re-validated.
+    """
+    data_root = Path(data_root)
+    cache_path = Path(cache_path) if cache_path is not None else default_cache_path(data_root)
+    rec = None if refresh else _read_cache(cache_path)
+    if rec is not None:
+        fresh, stats_changed = _is_fresh(rec["sources"])
+        if fresh:
+            if stats_changed:
+                # content identical; refresh stats so the next start skips hashing
+                rec["sources"] = _fingerprint([Path(p) for p in rec["sources"]])
+                _write_cache(cache_path, rec)
+            return rec["bundle"], list(rec["errors"])
+    # stale: re-merge, but only re-validate the sections whose files changed
+    rec = build_content(data_root, previous=rec)
+    _write_cache(cache_path, rec)
+    return rec["bundle"], list(rec["errors"])
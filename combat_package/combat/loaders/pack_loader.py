@@ -1,13 +1,14 @@
 from __future__ import annotations
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Callable
 
 from .abilities_loader import load_abilities
 from .damage_types_loader import load_damage_types
 from .narration_loader import load_narration
 from .body_parts_loader import load_body_parts
 from .status_effects_loader import load_status_effects
-import yaml
+from .yaml_utils import safe_load_path, load_parallel
 
 MERGE_KEYS = ("abilities", "damage_types", "narration", "body_parts", "status_effects")
 
@@ -15,8 +16,7 @@ MERGE_KEYS = ("abilities", "damage_types", "narration", "body_parts", "status_ef
 def _read_yaml(p: Path) -> dict:
     if not p.exists():
         return {}
-    with open(p, "r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
+    return safe_load_path(p) or {}
 
 
 def _dict_by_id(seq: List[dict], key: str = "id") -> Dict[str, dict]:
@@ -46,20 +46,36 @@ def _merge_lists(
     return list(a.values())
 
 
-def load_base_bundle(data_root: Path) -> Dict[str, Any]:
+def _base_jobs(data_root: Path) -> Dict[str, Callable[[], dict]]:
     return {
-        "abilities": (load_abilities(data_root / "abilities.yaml") or {}).get("abilities", []),
-        "damage_types": (load_damage_types(data_root / "damage_types.yaml") or {}).get(
-            "damage_types", []
-        ),
-        "narration": (load_narration(data_root / "narration.yaml") or {}),
-        "body_parts": (load_body_parts(data_root / "body_parts.yaml") or {}),
-        "status_effects": (load_status_effects(data_root / "status_effects.yaml") or {}),
+        "abilities": partial(load_abilities, data_root / "abilities.yaml"),
+        "damage_types": partial(load_damage_types, data_root / "damage_types.yaml"),
+        "narration": partial(load_narration, data_root / "narration.yaml"),
+        "body_parts": partial(load_body_parts, data_root / "body_parts.yaml"),
+        "status_effects": partial(load_status_effects, data_root / "status_effects.yaml"),
     }
 
 
-def load_pack_bundle(pack_dir: Path) -> Dict[str, Any]:
-    # read yaml files if present
+def _base_from_docs(docs: Dict[str, dict]) -> Dict[str, Any]:
+    return {
+        "abilities": (docs["abilities"] or {}).get("abilities", []),
+        "damage_types": (docs["damage_types"] or {}).get("damage_types", []),
+        "narration": (docs["narration"] or {}),
+        "body_parts": (docs["body_parts"] or {}),
+        "status_effects": (docs["status_effects"] or {}),
+    }
+
+
+def _pack_jobs(pack_dir: Path) -> Dict[str, Callable[[], dict]]:
+    # only files that are present; missing ones keep the empty defaults
+    return {
+        k: partial(_read_yaml, pack_dir / f"{k}.yaml")
+        for k in MERGE_KEYS
+        if (pack_dir / f"{k}.yaml").exists()
+    }
+
+
+def _pack_from_docs(docs: Dict[str, dict]) -> Dict[str, Any]:
     out = {
         "abilities": [],
         "damage_types": [],
@@ -67,25 +83,28 @@ def load_pack_bundle(pack_dir: Path) -> Dict[str, Any]:
         "body_parts": {},
         "status_effects": {},
     }
-    p = pack_dir
-    if (p / "abilities.yaml").exists():
-        out["abilities"] = (_read_yaml(p / "abilities.yaml") or {}).get("abilities", [])
-    if (p / "damage_types.yaml").exists():
-        out["damage_types"] = (_read_yaml(p / "damage_types.yaml") or {}).get("damage_types", [])
-    if (p / "narration.yaml").exists():
-        out["narration"] = _read_yaml(p / "narration.yaml") or {}
-    if (p / "body_parts.yaml").exists():
-        out["body_parts"] = _read_yaml(p / "body_parts.yaml") or {}
-    if (p / "status_effects.yaml").exists():
-        out["status_effects"] = _read_yaml(p / "status_effects.yaml") or {}
+    if "abilities" in docs:
+        out["abilities"] = (docs["abilities"] or {}).get("abilities", [])
+    if "damage_types" in docs:
+        out["damage_types"] = (docs["damage_types"] or {}).get("damage_types", [])
+    for k in ("narration", "body_parts", "status_effects"):
+        if k in docs:
+            out[k] = docs[k] or {}
     return out
 
 
+def load_base_bundle(data_root: Path) -> Dict[str, Any]:
+    return _base_from_docs(load_parallel(_base_jobs(data_root)))
+
+
+def load_pack_bundle(pack_dir: Path) -> Dict[str, Any]:
+    return _pack_from_docs(load_parallel(_pack_jobs(pack_dir)))
+
+
 def load_content_packs_config(cfg_path: Path) -> Dict[str, Any]:
     if not cfg_path.exists():
         return {"enabled": [], "policy": "skip"}
-    with open(cfg_path, "r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+    data = safe_load_path(cfg_path) or {}
     data.setdefault("enabled", [])
     data.setdefault("policy", "skip")
     return data
@@ -97,11 +116,21 @@ def merge_content_with_packs(data_root: Path) -> Tuple[Dict[str, Any], List[str]
       abilities (list), damage_types (list), narration (dict), body_parts (dict), status_effects (dict)
     """
     errors: List[str] = []
-    base = load_base_bundle(data_root)
     cfg = load_content_packs_config(data_root / "content_packs.yaml")
     policy = str(cfg.get("policy", "skip")).lower()
     enabled = cfg.get("enabled", []) or []
 
+    # parse base + every enabled pack file in one pool, then merge in declared order
+    jobs: Dict[Tuple[str, str], Callable[[], dict]] = {
+        ("", k): fn for k, fn in _base_jobs(data_root).items()
+    }
+    for pack in enabled:
+        pd = data_root / "packs" / pack
+        if pd.exists():
+            jobs.update({(pack, k): fn for k, fn in _pack_jobs(pd).items()})
+    docs = load_parallel(jobs)
+    base = _base_from_docs({k: docs[("", k)] for k in MERGE_KEYS})
+
     merged = {
         "abilities": list(base["abilities"]),
         "damage_types": list(base["damage_types"]),
@@ -115,7 +144,7 @@ def merge_content_with_packs(data_root: Path) -> Tuple[Dict[str, Any], List[str]
         if not pd.exists():
             errors.append(f"Enabled pack '{pack}' not found at {pd}")
             continue
-        bundle = load_pack_bundle(pd)
+        bundle = _pack_from_docs({k: d for (pk, k), d in docs.items() if pk == pack})
         merged["abilities"] = _merge_lists(
             merged["abilities"], bundle["abilities"], policy, "abilities", errors
         )
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Tuple, TypeVar
+import threading
+import time
+
+import yaml
+
+try:  # libyaml bindings are optional; the pure-Python parser gives identical results
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+HAS_LIBYAML = SafeLoader is not yaml.SafeLoader
+MAX_WORKERS = 8
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_timings: Dict[str, float] = {}
+_timings_lock = threading.Lock()
+
+
+def safe_load_path(path: str | Path) -> Any:
+    """
+    yaml.safe_load for a file, using libyaml when available.
+    Records the parse time (seconds) of the last load of each path; see parse_timings().
+    """
+    p = Path(path)
+    t0 = time.perf_counter()
+    with open(p, "r", encoding="utf-8") as fh:
+        data = yaml.load(fh, Loader=SafeLoader)
+    dt = time.perf_counter() - t0
+    with _timings_lock:
+        _timings[str(p)] = dt
+    return data
+
+
+def load_parallel(jobs: Mapping[K, Callable[[], V]], max_workers: int | None = None) -> Dict[K, V]:
+    """
+    Run independent load callables on a thread pool; returns {key: result} in job order.
+    File reads overlap; parsing itself is still bound by the GIL. Exceptions propagate.
+    """
+    if len(jobs) <= 1:
+        return {k: fn() for k, fn in jobs.items()}
+    workers = min(max_workers or MAX_WORKERS, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yaml-load") as pool:
+        futs = {k: pool.submit(fn) for k, fn in jobs.items()}
+        return {k: f.result() for k, f in futs.items()}
+
+
+def parse_timings() -> Dict[str, float]:
+    with _timings_lock:
+        return dict(_timings)
+
+
+def slowest_files(limit: int = 10) -> List[Tuple[str, float]]:
+    """Largest parse times first — handy for spotting oversized content files."""
+    return sorted(parse_timings().items(), key=lambda kv: kv[1], reverse=True)[:limit]
+
+
+def reset_parse_timings() -> None:
+    with _timings_lock:
+        _timings.clear()
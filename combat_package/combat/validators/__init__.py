@@ -6,7 +6,7 @@ from .schema import (
     validate_narration,
     ValidationError,
 )
-from .validate import validate_bundle
+from .validate import validate_bundle, IncrementalValidator
 
 __all__ = [
     "validate_damage_types",
@@ -16,4 +16,5 @@ __all__ = [
     "validate_narration",
     "ValidationError",
     "validate_bundle",
+    "IncrementalValidator",
 ]
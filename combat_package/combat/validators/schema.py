@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set
 
 
 class ValidationError(Exception):
@@ -102,15 +102,12 @@ def validate_narration(data: Dict[str, Any]) -> List[str]:
     return errs
 
 
-def cross_validate(bundle: Dict[str, Any]) -> List[str]:
+def cross_validate_abilities(
+    abilities: List[dict], dmg_ids: Set[str], effect_ids: Set[str]
+) -> List[str]:
     errs: List[str] = []
-    dmg_ids = {
-        d.get("id") for d in (bundle.get("damage_types") or []) if isinstance(d.get("id"), str)
-    }
-    effects = (bundle.get("status_effects") or {}).get("effects", {})
-    effect_ids = set(effects.keys())
     # abilities → damage_type + on_hit effect ids
-    for ab in bundle.get("abilities") or []:
+    for ab in abilities or []:
         dt = ab.get("damage_type")
         if isinstance(dt, str) and dt not in dmg_ids:
             errs.append(f"ability '{ab.get('id')}' references unknown damage_type '{dt}'")
@@ -119,9 +116,26 @@ def cross_validate(bundle: Dict[str, Any]) -> List[str]:
             eid = spec.get("id")
             if eid and eid not in effect_ids:
                 errs.append(f"ability '{ab.get('id')}' on_hit references unknown status '{eid}'")
+    return errs
+
+
+def cross_validate_effects(effects: Dict[str, Any], dmg_ids: Set[str]) -> List[str]:
+    errs: List[str] = []
     # effects → damage types
     for eid, ed in effects.items():
         dt = ed.get("damage_type")
         if isinstance(dt, str) and dt not in dmg_ids:
             errs.append(f"status_effect '{eid}' references unknown damage_type '{dt}'")
     return errs
+
+
+def damage_type_ids(bundle: Dict[str, Any]) -> Set[str]:
+    return {d.get("id") for d in (bundle.get("damage_types") or []) if isinstance(d.get("id"), str)}
+
+
+def cross_validate(bundle: Dict[str, Any]) -> List[str]:
+    dmg_ids = damage_type_ids(bundle)
+    effects = (bundle.get("status_effects") or {}).get("effects", {})
+    errs = cross_validate_abilities(bundle.get("abilities") or [], dmg_ids, set(effects.keys()))
+    errs += cross_validate_effects(effects, dmg_ids)
+    return errs
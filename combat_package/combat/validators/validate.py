@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Tuple
+import hashlib
+import pickle
 from .schema import (
     validate_damage_types,
     validate_abilities,
@@ -7,6 +9,9 @@ from .schema import (
     validate_body_parts,
     validate_narration,
     cross_validate,
+    cross_validate_abilities,
+    cross_validate_effects,
+    damage_type_ids,
 )
 
 
@@ -19,3 +24,91 @@ def validate_bundle(bundle: Dict[str, Any]) -> List[str]:
     errs += validate_narration(bundle.get("narration", {}))
     errs += cross_validate(bundle)
     return errs
+
+
+def _digest(obj: Any) -> str:
+    return hashlib.blake2b(
+        pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16
+    ).hexdigest()
+
+
+SCHEMA_CHECKS: Tuple[Tuple[str, Callable[[Dict[str, Any]], List[str]]], ...] = (
+    ("damage_types", validate_damage_types),
+    ("abilities", validate_abilities),
+    ("status_effects", validate_status_effects),
+    ("body_parts", validate_body_parts),
+    ("narration", validate_narration),
+)
+
+
+class IncrementalValidator:
+    """
+    validate_bundle with per-section memoization, for live editing.
+    Each schema check is keyed by its section's content; cross-reference checks are keyed by
+    the key of the section they walk plus the id sets they resolve against, so editing e.g.
+    a status effect's per_tick does not re-run the ability cross-check.
+
+    Callers that know where each section came from pass `section_keys` (e.g. the stat/sha
+    fingerprints of the files merged into it, as content_cache does); unchanged sections are
+    then skipped without hashing their contents. Sections without a key are content-hashed.
+    `cache` seeds the memo from a previous run (see `state`), so results survive restarts.
+    Returns exactly what validate_bundle would, in the same order.
+    """
+
+    def __init__(self, cache: Dict[str, Tuple[Any, List[str]]] | None = None):
+        self._cache: Dict[str, Tuple[Any, List[str]]] = dict(cache or {})
+        self.revalidated: List[str] = []  # checks re-run by the last validate() call
+
+    @property
+    def state(self) -> Dict[str, Tuple[Any, List[str]]]:
+        """Picklable memo to hand to a later IncrementalValidator(cache=...)."""
+        return dict(self._cache)
+
+    def reset(self) -> None:
+        self._cache.clear()
+        self.revalidated = []
+
+    def _run(self, name: str, key: Any, check: Callable[[], List[str]]) -> List[str]:
+        hit = self._cache.get(name)
+        if hit is not None and hit[0] == key:
+            return list(hit[1])
+        errs = check()
+        self._cache[name] = (key, list(errs))
+        self.revalidated.append(name)
+        return errs
+
+    def validate(
+        self, bundle: Dict[str, Any], section_keys: Dict[str, Any] | None = None
+    ) -> List[str]:
+        self.revalidated = []
+        section_keys = section_keys or {}
+        sections = {
+            "damage_types": lambda: {"damage_types": bundle.get("damage_types", [])},
+            "abilities": lambda: {"abilities": bundle.get("abilities", [])},
+            "status_effects": lambda: bundle.get("status_effects", {}),
+            "body_parts": lambda: bundle.get("body_parts", {}),
+            "narration": lambda: bundle.get("narration", {}),
+        }
+        keys = {
+            k: ("key", section_keys[k]) if k in section_keys else ("digest", _digest(get()))
+            for k, get in sections.items()
+        }
+        errs: List[str] = []
+        for name, check in SCHEMA_CHECKS:
+            errs += self._run(name, keys[name], lambda c=check, n=name: c(sections[n]()))
+
+        dmg_ids = damage_type_ids(bundle)
+        effects = (bundle.get("status_effects") or {}).get("effects", {})
+        effect_ids = set(effects.keys())
+        dmg_key = _digest(sorted(dmg_ids))
+        errs += self._run(
+            "cross:abilities",
+            (keys["abilities"], dmg_key, _digest(sorted(effect_ids, key=str))),
+            lambda: cross_validate_abilities(bundle.get("abilities") or [], dmg_ids, effect_ids),
+        )
+        errs += self._run(
+            "cross:status_effects",
+            (keys["status_effects"], dmg_key),
+            lambda: cross_validate_effects(effects, dmg_ids),
+        )
+        return errs
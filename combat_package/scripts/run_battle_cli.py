@@ -1,89 +1,133 @@
 from __future__ import annotations
 from pathlib import Path
-from ..combat.engine.combatant import Combatant
-from ..combat.engine.encounter import Encounter
-from ..combat.engine.ai import choose_and_execute
-from ..combat.engine.narration import (
-    render_dot_tick,
-    render_hazard_event,
-)
-from ..combat.loaders.abilities_loader import load_abilities
-from ..combat.loaders.ai_rules_loader import load_ai_rules
-from ..combat.loaders.narration_loader import load_narration
-from ..combat.loaders.status_effects_loader import load_status_effects
-from ..combat.loaders.hazards_loader import load_hazards
-
-
-def main():
-    data_root = Path(__file__).parents[1] / "combat" / "data"
-    abilities = load_abilities(data_root / "abilities.yaml")
-    rules = load_ai_rules(data_root / "data" / "ai_rules.yaml")
-    narr = load_narration(data_root / "narration.yaml")
-    effs = load_status_effects(data_root / "status_effects.yaml")
-    hazards_cfg = load_hazards(data_root / "hazards.yaml")
-
-    a = Combatant(
-        "A",
-        "Aria",
-        {"ATT": 9, "DEX": 7, "ARM": 3, "WPN": 3},
-        hp=26.0,
-        mana=6.0,
-        resist={},
-        tags=["humanoid"],
-        team="alpha",
-        location="lava",
-    )
-    b = Combatant(
-        "B",
-        "Belor",
-        {"ATT": 6, "DEX": 8, "INT": 12, "ARM": 2, "WPN": 1},
-        hp=28.0,
-        mana=12.0,
-        resist={"fire": 0.10},
-        tags=["humanoid", "flying"],
-        team="beta",
-        location="fountain",
+import argparse
+import csv
+import json
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from combat.engine.batch import flatten_row, load_scenario, run_batch, run_one
+from combat.engine.checkpoint import run_checkpointed
+from combat.engine.content import shared_content
+from combat.engine.metrics import MetricsAggregator
+
+DATA_ROOT = Path(__file__).parents[1] / "combat" / "data"
+DEFAULT_SCENARIO = DATA_ROOT / "scenarios" / "duel.yaml"
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Run AI battles from a scenario file.")
+    ap.add_argument("--scenario", type=Path, default=DEFAULT_SCENARIO, help="scenario YAML")
+    ap.add_argument("-n", "--reps", type=int, default=1, help="number of repetitions")
+    ap.add_argument("-w", "--workers", type=int, default=1, help="worker processes")
+    ap.add_argument("-q", "--quiet", action="store_true", help="no narration")
+    ap.add_argument("-o", "--out", type=Path, help="results file (.jsonl or .csv)")
+    ap.add_argument("--metrics", type=Path, help="write aggregated metrics JSON here")
+    ap.add_argument("--max-rounds", type=int, help="override scenario max_rounds")
+    ap.add_argument("--seed", type=int, help="override scenario base seed")
+    ap.add_argument("--data-root", type=Path, default=DATA_ROOT, help="combat data directory")
+    ap.add_argument("--profile", action="store_true", help="cProfile the run (in-process)")
+    ap.add_argument("--checkpoint", type=Path, help="persist progress here; rerun to resume")
+    ap.add_argument("--commit-every", type=int, default=100, help="results per checkpoint part")
+    ap.add_argument(
+        "--snapshot-turns", type=int, default=0, help="snapshot in-flight fights every N turns"
     )
-    enc = Encounter([a, b], seed=909)
+    return ap.parse_args(argv)
 
-    for round_idx in range(1, 5):
-        print(f"\n== Round {round_idx} ==")
 
-        # start_of_turn hazards + DoT tick + AI action for each actor
-        for _ in range(len(enc.participants)):
-            actor = enc.next_turn()
+class _Writer:
+    """Streams rows as JSON lines or CSV (columns fixed by the first row)."""
 
-            # Hazards at start_of_turn
-            for ev in enc.process_hazards("start_of_turn"):
-                # Show only hazard lines
-                print("•", render_hazard_event(ev, hazards_cfg, enc.rng))
+    def __init__(self, path: Path | None):
+        self.path = path
+        self.fh = open(path, "w", encoding="utf-8", newline="") if path else None
+        self.csv = path is not None and path.suffix.lower() == ".csv"
+        self._dw = None
 
-            # Status DoTs
-            from ..combat.engine.effects import tick_start_of_turn
+    def write(self, row) -> None:
+        if self.fh is None:
+            return
+        if not self.csv:
+            self.fh.write(json.dumps(row, sort_keys=True) + "\n")
+            return
+        flat = flatten_row(row)
+        if self._dw is None:
+            self._dw = csv.DictWriter(self.fh, fieldnames=list(flat), extrasaction="ignore")
+            self._dw.writeheader()
+        self._dw.writerow(flat)
 
-            for ev in tick_start_of_turn(actor, effs, enc.rng):
-                print(
-                    "•",
-                    render_dot_tick(actor.name, ev["effect_id"], ev["amount"], effs, narr, enc.rng),
-                )
+    def close(self) -> None:
+        if self.fh:
+            self.fh.close()
 
-            # AI action (using your rules)
-            outcome = choose_and_execute(
-                enc.participants, actor, abilities, rules, enc.threat, enc.rng
+
+def _run(args: argparse.Namespace) -> int:
+    scenario = load_scenario(args.scenario)
+    if args.max_rounds is not None:
+        scenario["max_rounds"] = args.max_rounds
+    if args.seed is not None:
+        scenario["seed"] = args.seed
+        scenario.pop("seeds", None)
+    content = shared_content(args.data_root)
+    metrics = MetricsAggregator(content.abilities) if args.metrics else None
+    writer = _Writer(args.out)
+    wins = {}
+    t0 = time.perf_counter()
+    try:
+        if args.checkpoint:
+            rows = run_checkpointed(
+                scenario,
+                args.reps,
+                args.checkpoint,
+                workers=1 if args.profile else args.workers,
+                data_root=args.data_root,
+                metrics=metrics,
+                commit_every=args.commit_every,
+                checkpoint_turns=args.snapshot_turns,
             )
-            if outcome["ok"]:
-                enc.ingest_events_update_threat(outcome["events"])
+        elif args.quiet or args.reps > 1 or args.workers > 1:
+            workers = 1 if args.profile else args.workers
+            rows = run_batch(scenario, args.reps, workers, args.data_root, metrics=metrics)
+        else:
+            # single narrated battle (the original demo)
+            rows = [run_one(scenario, 0, content, log=print, metrics=metrics)]
+        count = 0
+        for row in rows:
+            count += 1
+            writer.write(row)
+            wins[row["winner_team"]] = wins.get(row["winner_team"], 0) + 1
+            if not args.quiet and args.reps == 1:
+                hp = ", ".join(f"{k}: HP {v:.1f}" for k, v in row["hp"].items())
+                print(f"\nFinal → {hp} | winner: {row['winner_team']} in {row['rounds']} rounds")
+    finally:
+        writer.close()
+    dt = time.perf_counter() - t0
+    if metrics is not None:
+        metrics.to_json(args.metrics)
+    if args.reps > 1 or args.quiet:
+        rate = count / dt if dt > 0 else float("inf")
+        summary = ", ".join(f"{k}: {v}" for k, v in sorted(wins.items(), key=lambda kv: str(kv[0])))
+        print(
+            f"{count} battles in {dt:.2f}s ({rate:.1f}/s) | wins {summary}",
+            file=sys.stderr,
+        )
+    return 0
 
-            # Hazards at end_of_turn
-            for ev in enc.process_hazards("end_of_turn"):
-                print("•", render_hazard_event(ev, hazards_cfg, enc.rng))
 
-        # (Optional) you could decrement finite hazard durations here if you add such hazards later.
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    if not args.profile:
+        return _run(args)
+    import cProfile
+    import pstats
 
-    print(
-        f"\nFinal → {a.name}: HP {a.hp:.1f}, Mana {a.mana:.1f} | {b.name}: HP {b.hp:.1f}, Mana {b.mana:.1f}"
-    )
+    prof = cProfile.Profile()
+    rc = prof.runcall(_run, args)
+    pstats.Stats(prof, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+    return rc
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
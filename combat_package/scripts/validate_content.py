@@ -4,14 +4,19 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from combat.loaders.pack_loader import merge_content_with_packs
-from combat.validators.validate import validate_bundle
+from combat.loaders.content_cache import load_merged_content
+from combat.loaders.yaml_utils import HAS_LIBYAML, slowest_files
 
 
 def main():
     data_root = Path(__file__).parents[1] / "combat" / "data"
-    bundle, merge_errors = merge_content_with_packs(data_root)
-    errs = list(merge_errors) + validate_bundle(bundle)
+    timings = "--timings" in sys.argv
+    # merge + validate, served from the compiled cache when sources are unchanged
+    _bundle, errs = load_merged_content(data_root, refresh=timings or "--refresh" in sys.argv)
+    if timings:
+        print(f"YAML parser: {'libyaml (C)' if HAS_LIBYAML else 'pure Python'}")
+        for path, secs in slowest_files():
+            print(f"  {secs * 1000:8.2f} ms  {Path(path).relative_to(data_root)}")
     if errs:
         print("VALIDATION: FAIL")
         for e in errs:
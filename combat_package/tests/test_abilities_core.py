@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
+import pytest
 from combat.engine.combatant import Combatant
 from combat.engine.abilities import can_use_ability, execute_ability
 from combat.engine.rng import RandomSource
@@ -119,11 +120,15 @@ def test_cooldown_ticks_down():
     # immediate second cast blocked due to cooldown
     ok2, reason2 = can_use_ability(a, fireball)
     assert not ok2 and reason2 == "on_cooldown"
-    # tick cooldown twice → ready
+    # the cooldown runs on the encounter's round clock: two rounds → ready
     from combat.engine.encounter import Encounter
 
     enc = Encounter([a, b], seed=3)
-    enc.tick_cooldowns(a)
-    enc.tick_cooldowns(a)
+    with pytest.deprecated_call():
+        enc.tick_cooldowns(a)  # no-op now; next_turn() does the ticking
+    for _ in range(2):
+        assert not can_use_ability(a, fireball)[0]
+        enc.next_turn()
+        enc.next_turn()
     ok3, _ = can_use_ability(a, fireball)
     assert ok3
@@ -0,0 +1,87 @@
+from pathlib import Path
+import csv
+import json
+import shutil
+import sys
+
+from combat.engine.batch import build_units, load_scenario, play, run_batch
+from combat.engine.content import ContentHandle, shared_content
+from combat.engine.encounter import Encounter
+from combat.engine.metrics import MetricsAggregator
+
+ROOT = Path(__file__).parents[1]
+SCENARIO = ROOT / "combat" / "data" / "scenarios" / "duel.yaml"
+
+
+def _strip(rows):
+    return [{k: v for k, v in r.items() if k != "elapsed_ms"} for r in rows]
+
+
+def test_scenario_units_and_counts(tmp_path):
+    sc = load_scenario(SCENARIO)
+    assert {u.team for u in build_units(sc)} == {"alpha", "beta"}
+    p = tmp_path / "mob.yaml"
+    p.write_text(
+        "scenario:\n  teams:\n    alpha: [{id: g, hp: 5, count: 3}]\n    beta: [{id: o, hp: 9}]\n",
+        encoding="utf-8",
+    )
+    sc2 = load_scenario(p)
+    assert sc2["id"] == "mob"
+    assert [u.id for u in build_units(sc2)] == ["g1", "g2", "g3", "o"]
+
+
+def test_batch_is_deterministic_across_worker_counts():
+    sc = load_scenario(SCENARIO)
+    abilities = shared_content().abilities
+    m1, m2 = MetricsAggregator(abilities), MetricsAggregator(abilities)
+    serial = list(run_batch(sc, 12, workers=1, metrics=m1))
+    pooled = list(run_batch(sc, 12, workers=2, metrics=m2, chunk_size=5))
+    assert [r["rep"] for r in pooled] == list(range(12))
+    assert _strip(serial) == _strip(pooled)
+    for aid, g in m1.sections["abilities"].items():
+        other = m2.sections["abilities"][aid]
+        assert g.counts == other.counts
+        assert abs(g.stats["damage"].mean - other.stats["damage"].mean) < 1e-9
+    assert all(r["ended"] for r in serial)
+
+
+def test_play_runs_start_of_round_hazards(tmp_path):
+    data = tmp_path / "data"
+    shutil.copytree(ROOT / "combat" / "data", data)
+    with (data / "hazards.yaml").open("a", encoding="utf-8") as fh:
+        fh.write(
+            "\n  - id: storm\n    phase: start_of_round\n    targeting: {team: any}\n"
+            "    effects: {damage: {amount: 1, damage_type: lightning}}\n"
+        )
+    sc = load_scenario(SCENARIO)
+    for specs in sc["teams"].values():
+        for spec in specs:
+            spec.update(hp=500, location="arena")
+    enc = Encounter(build_units(sc), seed=5, content=ContentHandle(data))
+    res = play(enc, max_rounds=3)
+    assert res["rounds"] == 3
+    storms = [e for e in enc.events if e.get("hazard_id") == "storm"]
+    # once per round for both units, before anyone acts in it
+    assert len(storms) == 6
+    assert [e.get("hazard_id") for e in enc.events[:2]] == ["storm", "storm"]
+
+
+def test_cli_writes_csv_and_jsonl(tmp_path):
+    sys.path.insert(0, str(ROOT / "scripts"))
+    try:
+        import run_battle_cli
+    finally:
+        sys.path.pop(0)
+    out_csv, out_jsonl = tmp_path / "r.csv", tmp_path / "r.jsonl"
+    assert run_battle_cli.main(["-n", "3", "-q", "-o", str(out_csv)]) == 0
+    rows = list(csv.DictReader(out_csv.open(encoding="utf-8")))
+    assert [r["rep"] for r in rows] == ["0", "1", "2"] and "team_hp.alpha" in rows[0]
+    assert (
+        run_battle_cli.main(
+            ["-n", "2", "-q", "-o", str(out_jsonl), "--metrics", str(tmp_path / "m.json")]
+        )
+        == 0
+    )
+    lines = [json.loads(x) for x in out_jsonl.read_text(encoding="utf-8").splitlines()]
+    assert [x["seed"] for x in lines] == [909, 910]
+    assert json.loads((tmp_path / "m.json").read_text(encoding="utf-8"))["encounters"] == 2
@@ -0,0 +1,83 @@
+from pathlib import Path
+import json
+
+import pytest
+
+from combat.engine import checkpoint
+from combat.engine.batch import load_scenario, run_batch
+from combat.engine.checkpoint import BatchCheckpoint, run_checkpointed
+
+SCENARIO = Path(__file__).parents[1] / "combat" / "data" / "scenarios" / "duel.yaml"
+
+
+def _strip(rows):
+    return [{k: v for k, v in r.items() if k != "elapsed_ms"} for r in rows]
+
+
+def test_resume_after_crash_matches_uninterrupted_run(tmp_path, monkeypatch):
+    sc = load_scenario(SCENARIO)
+    expected = _strip(run_batch(sc, 10))
+
+    real_commit = BatchCheckpoint.commit
+    calls = {"n": 0}
+
+    def crashing_commit(self, rows, metrics=None):
+        calls["n"] += 1
+        if calls["n"] == 3:
+            raise KeyboardInterrupt("worker died")
+        real_commit(self, rows, metrics)
+
+    monkeypatch.setattr(BatchCheckpoint, "commit", crashing_commit)
+    with pytest.raises(KeyboardInterrupt):
+        run_checkpointed(sc, 10, tmp_path, commit_every=3)
+    monkeypatch.setattr(BatchCheckpoint, "commit", real_commit)
+
+    man = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert man["completed"] == 6 and len(man["parts"]) == 2
+
+    ran = []
+    real_run_one = checkpoint.run_one
+    monkeypatch.setattr(
+        checkpoint,
+        "run_one",
+        lambda sc_, r, *a, **k: ran.append(r) or real_run_one(sc_, r, *a, **k),
+    )
+    rows = run_checkpointed(sc, 10, tmp_path, commit_every=3)
+    assert ran == [6, 7, 8, 9]
+    assert _strip(rows) == expected
+
+
+def test_inflight_snapshot_resume_is_exact(tmp_path):
+    sc = load_scenario(SCENARIO)
+    sc["teams"]["alpha"][0]["hp"] = 400  # long fight
+    sc["teams"]["beta"][0]["hp"] = 400
+    sc["max_rounds"] = 200
+    expected = _strip(run_batch(sc, 1))
+
+    ck = BatchCheckpoint(tmp_path, sc, 1)
+    states = []
+    from combat.engine.batch import run_one
+
+    run_one(sc, 0, on_checkpoint=states.append, checkpoint_turns=10)
+    assert len(states) > 2
+    ck.save_inflight(0, states[len(states) // 2])  # pretend the worker died mid-fight
+    rows = run_checkpointed(sc, 1, tmp_path)
+    assert _strip(rows) == expected
+    assert not list((tmp_path / "inflight").iterdir())
+
+
+def test_checkpoint_rejects_other_scenario(tmp_path):
+    sc = load_scenario(SCENARIO)
+    run_checkpointed(sc, 2, tmp_path)
+    sc2 = dict(sc, seed=1)
+    with pytest.raises(ValueError):
+        BatchCheckpoint(tmp_path, sc2, 2)
+    with pytest.raises(ValueError):
+        BatchCheckpoint(tmp_path, sc, 3)
+
+
+def test_commit_every_below_one_is_rejected(tmp_path):
+    sc = load_scenario(SCENARIO)
+    with pytest.raises(ValueError):
+        run_checkpointed(sc, 4, tmp_path, commit_every=0)
+    assert not (tmp_path / "manifest.json").exists()
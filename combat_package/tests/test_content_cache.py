@@ -0,0 +1,105 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import shutil
+import time
+
+import yaml
+
+from combat.loaders import content_cache
+from combat.loaders.content_cache import load_merged_content
+from combat.loaders.pack_loader import merge_content_with_packs
+from combat.validators import validate_bundle
+
+
+def _copy_data(tmp_path: Path) -> Path:
+    src = Path(__file__).parents[1] / "combat" / "data"
+    dst = tmp_path / "data"
+    shutil.copytree(src, dst)
+    return dst
+
+
+def _boom(*_a, **_k):
+    raise AssertionError("cache miss")
+
+
+def test_warm_cache_matches_fresh_merge(tmp_path, monkeypatch):
+    data_root = _copy_data(tmp_path)
+    cache = tmp_path / "cache.pickle"
+    bundle, errs = load_merged_content(data_root, cache_path=cache)
+    assert cache.exists()
+    fresh, _ = merge_content_with_packs(data_root)
+    assert {a["id"] for a in bundle["abilities"]} == {a["id"] for a in fresh["abilities"]}
+
+    # warm start must not touch the YAML pipeline at all
+    monkeypatch.setattr(content_cache, "merge_content_with_packs", _boom)
+    warm, warm_errs = load_merged_content(data_root, cache_path=cache)
+    assert warm == bundle and warm_errs == errs
+
+
+def test_touch_without_change_stays_warm(tmp_path, monkeypatch):
+    data_root = _copy_data(tmp_path)
+    cache = tmp_path / "cache.pickle"
+    load_merged_content(data_root, cache_path=cache)
+    p = data_root / "abilities.yaml"
+    later = time.time() + 5
+    os.utime(p, (later, later))
+    monkeypatch.setattr(content_cache, "merge_content_with_packs", _boom)
+    load_merged_content(data_root, cache_path=cache)
+
+
+def test_pack_edit_invalidates_cache(tmp_path):
+    data_root = _copy_data(tmp_path)
+    cache = tmp_path / "cache.pickle"
+    load_merged_content(data_root, cache_path=cache)
+
+    # a file that did not exist when the cache was built
+    (data_root / "packs" / "starter_plus" / "damage_types.yaml").write_text(
+        yaml.safe_dump({"damage_types": [{"id": "shadow", "label": "Shadow"}]}),
+        encoding="utf-8",
+    )
+    bundle, _ = load_merged_content(data_root, cache_path=cache)
+    assert "shadow" in {d["id"] for d in bundle["damage_types"]}
+
+    ab_path = data_root / "packs" / "starter_plus" / "abilities.yaml"
+    data = yaml.safe_load(ab_path.read_text(encoding="utf-8"))
+    data["abilities"].append(
+        {"id": "cached_probe", "name": "Probe", "formula": "ATT", "damage_type": "shadow"}
+    )
+    ab_path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    bundle, errs = load_merged_content(data_root, cache_path=cache)
+    assert "cached_probe" in {a["id"] for a in bundle["abilities"]}
+    assert not errs
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    data_root = _copy_data(tmp_path)
+    cache = tmp_path / "cache.pickle"
+    cache.write_bytes(b"not a pickle")
+    bundle, _ = load_merged_content(data_root, cache_path=cache)
+    assert bundle["abilities"]
+    assert content_cache._read_cache(cache) is not None
+
+
+def test_rebuild_revalidates_only_changed_sections(tmp_path, monkeypatch):
+    data_root = _copy_data(tmp_path)
+    cache = tmp_path / "cache.pickle"
+    load_merged_content(data_root, cache_path=cache)
+
+    runs = []
+
+    class Recording(content_cache.IncrementalValidator):
+        def validate(self, bundle, section_keys=None):
+            errs = super().validate(bundle, section_keys)
+            runs.append(self.revalidated)
+            return errs
+
+    monkeypatch.setattr(content_cache, "IncrementalValidator", Recording)
+    se_path = data_root / "packs" / "starter_plus" / "status_effects.yaml"
+    data = yaml.safe_load(se_path.read_text(encoding="utf-8")) or {}
+    data.setdefault("effects", {})["chilled"] = {"duration": 2, "stacking": "refresh"}
+    se_path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    bundle, errs = load_merged_content(data_root, cache_path=cache)
+    assert runs == [["status_effects", "cross:status_effects"]]
+    merged, merge_errors = merge_content_with_packs(data_root)
+    assert errs == merge_errors + validate_bundle(merged)
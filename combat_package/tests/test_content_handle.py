@@ -0,0 +1,56 @@
+from __future__ import annotations
+import builtins
+from pathlib import Path
+
+from combat.engine.combatant import Combatant
+from combat.engine.content import ContentHandle, shared_content
+from combat.engine.encounter import Encounter
+from combat.loaders.status_effects_loader import load_status_effects
+
+
+def _pair(hp: float = 40.0):
+    a = Combatant("A", "A", {"DEX": 8, "ATT": 8, "WPN": 3, "ARM": 2}, hp=hp, mana=0.0, team="t1")
+    b = Combatant("B", "B", {"DEX": 6, "ATT": 6, "WPN": 2, "ARM": 1}, hp=hp, mana=0.0, team="t2")
+    return a, b
+
+
+def test_shared_handle_is_reused_and_versioned():
+    h = shared_content()
+    assert shared_content() is h
+    assert h.ability("basic_attack")["id"] == "basic_attack"
+    local = ContentHandle(h.data_root)
+    body = local.body_parts
+    local.reload()
+    assert local.version == 1
+    assert local.body_parts == body and local.body_parts is not body
+
+
+def test_run_until_and_run_round_do_no_io_once_warm(monkeypatch):
+    Encounter(list(_pair()), seed=1).run_until(max_rounds=1)  # warm the shared handles
+    Encounter(list(_pair()), seed=1).run_round()
+
+    def no_open(*_a, **_k):
+        raise AssertionError("unexpected file I/O")
+
+    monkeypatch.setattr(builtins, "open", no_open)
+    enc = Encounter(list(_pair()), seed=7)
+    enc.run_until(max_rounds=5)
+    enc.run_round()
+    assert any(e["type"] in ("hit", "miss") for e in enc.events)
+
+
+def test_run_until_ticks_dots_with_injected_status_cfg():
+    cfg = load_status_effects(Path(__file__).parents[1] / "combat" / "data" / "status_effects.yaml")
+    a, b = _pair(hp=200.0)
+    b.statuses.append({"id": "poison", "source_id": "A", "remaining": 4, "stacks": 2})
+    enc = Encounter([a, b], seed=3)
+    enc.run_until(max_rounds=2, status_cfg=cfg)
+    dots = [e for e in enc.events if e["type"] == "dot"]
+    assert dots and dots[0]["effect_id"] == "poison" and dots[0]["target_id"] == "B"
+
+    # preloaded ability bundles replace the handle's basic_attack
+    a, b = _pair()
+    weak = {"abilities": [{"id": "basic_attack", "formula": "1", "damage_type": "slashing"}]}
+    enc = Encounter([a, b], seed=3)
+    enc.run_until(max_rounds=2, abilities=weak)
+    assert all(e["amount"] <= 1.5 for e in enc.events if e["type"] == "hit")
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from pathlib import Path
+from combat.engine.abilities import can_use_ability, execute_ability
+from combat.engine.combatant import Combatant
+from combat.engine.encounter import Encounter
+from combat.loaders.abilities_loader import load_abilities
+
+
+def _fireball():
+    data = load_abilities(Path(__file__).parents[1] / "combat" / "data" / "abilities.yaml")
+    return next(x for x in data["abilities"] if x["id"] == "fireball")
+
+
+def _units():
+    a = Combatant("A", "Caster", {"INT": 12, "DEX": 8}, hp=50.0, mana=50.0, team="t1")
+    b = Combatant("B", "Target", {"DEX": 1}, hp=50.0, mana=0.0, team="t2")
+    return a, b
+
+
+def test_cooldown_expires_with_rounds_without_ticking():
+    fireball = _fireball()  # cooldown: 2
+    a, b = _units()
+    enc = Encounter([a, b], seed=1)
+    assert enc.next_turn() is a
+    assert execute_ability(enc.participants, a, fireball, [b.id], enc.rng).ok
+    ready_at = dict(a.cooldown_ready)
+    enc.next_turn()  # B
+    assert enc.next_turn() is a
+    assert can_use_ability(a, fireball) == (False, "on_cooldown")
+    assert a.cooldowns == {"fireball": 1}
+    enc.next_turn()
+    assert enc.next_turn() is a
+    assert can_use_ability(a, fireball)[0]
+    # nothing was written per turn
+    assert a.cooldown_ready == ready_at
+
+
+def test_snapshot_keeps_remaining_turns_format():
+    fireball = _fireball()
+    a, b = _units()
+    enc = Encounter([a, b], seed=1)
+    enc.next_turn()
+    execute_ability(enc.participants, a, fireball, [b.id], enc.rng)
+    snap = enc.snapshot()
+    assert snap["participants"][0]["cooldowns"] == {"fireball": 2}
+
+    a2, b2 = _units()
+    enc2 = Encounter([a2, b2], seed=5)
+    for _ in range(7):
+        enc2.next_turn()
+    enc2.restore(snap)
+    assert a2.cooldowns == {"fireball": 2}
+    for _ in range(4):
+        enc2.next_turn()
+    assert not a2.cooldowns and can_use_ability(a2, fireball)[0]
+
+
+def test_joining_an_encounter_keeps_pending_cooldowns():
+    a, b = _units()
+    a.start_cooldown("fireball", 3)
+    Encounter([a, b], seed=1)
+    assert a.cooldowns == {"fireball": 3}
+
+
+def test_cooldowns_view_writes_through():
+    fireball = _fireball()
+    a, b = _units()
+    enc = Encounter([a, b], seed=1)
+    a.cooldowns["fireball"] = 2
+    assert a.cooldown_ready == {"fireball": enc.clock.now + 2}
+    assert can_use_ability(a, fireball) == (False, "on_cooldown")
+    del a.cooldowns["fireball"]
+    assert not a.cooldowns and can_use_ability(a, fireball)[0]
+    a.cooldowns["fireball"] = 0
+    assert "fireball" not in a.cooldown_ready
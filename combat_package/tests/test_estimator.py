@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from combat.engine.combatant import Combatant
+from combat.engine.content import ContentHandle
+from combat.engine.estimator import estimate_damage, estimate_duel, pair_table, validate_duel
+
+DATA = Path(__file__).parents[1] / "combat" / "data"
+
+
+def _pair():
+    a = Combatant("A", "Aria", {"ATT": 8, "DEX": 9, "ARM": 2, "WPN": 3}, 24, 0, team="alpha")
+    b = Combatant(
+        "B",
+        "Brute",
+        {"ATT": 9, "DEX": 5, "ARM": 3, "WPN": 2},
+        28,
+        0,
+        resist={"slashing": 0.1},
+        team="beta",
+    )
+    return a, b
+
+
+def test_estimate_damage_closed_form():
+    a, b = _pair()
+    ab = {
+        "id": "basic_attack",
+        "formula": "ATT + WPN - ARM*0.6",
+        "crit": {"chance": "0.1", "multiplier": 2.0},
+    }
+    est = estimate_damage(a, b, ab)
+    assert abs(est.hit_chance - 0.79) < 1e-9  # 0.75 + (9 - 5) * 0.01
+    assert est.hit_amount == round((8 + 3 - 1.8) * 0.9, 1)
+    assert est.crit_amount == round((8 + 3 - 1.8) * 2.0 * 0.9, 1)
+    mean = 0.79 * (0.9 * est.hit_amount + 0.1 * est.crit_amount)
+    assert abs(est.mean - mean) < 1e-9 and est.variance > 0
+    assert sum(p for _, p in est.outcomes()) == pytest.approx(1.0)
+    assert set(pair_table([a, b], [ab])) == {("A", "B", "basic_attack"), ("B", "A", "basic_attack")}
+
+
+def test_duel_estimate_is_a_distribution():
+    a, b = _pair()
+    est = estimate_duel(a, b, content=ContentHandle(DATA))
+    assert abs(est.p_a_wins + est.p_b_wins + est.p_unfinished - 1.0) < 1e-9
+    assert abs(sum(est.rounds_pmf.values()) - (1.0 - est.p_unfinished)) < 1e-9
+    assert 1.0 < est.expected_rounds < 10.0
+
+
+def test_duel_estimate_matches_simulation():
+    a, b = _pair()
+    report = validate_duel(a, b, n=400, seed=7, content=ContentHandle(DATA))
+    assert report["win_error"] <= 4 * report["win_stderr"] + 0.01
+    assert report["rounds_error"] < 0.5
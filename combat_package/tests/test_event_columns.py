@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from combat.engine.combatant import Combatant
+from combat.engine.content import ContentHandle
+from combat.engine.encounter import Encounter
+from combat.engine.event_columns import EventColumns
+
+DATA = Path(__file__).parents[1] / "combat" / "data"
+
+
+def _hit(actor, target, amount, crit=False):
+    return {
+        "type": "hit",
+        "actor_id": actor,
+        "target_id": target,
+        "ability_id": "basic_attack",
+        "amount": amount,
+        "dtype": "slashing",
+        "crit": crit,
+        "body_part": "torso",
+    }
+
+
+def test_event_columns_encode_strings_as_codes():
+    cols = EventColumns()
+    cols.append(_hit("A", "B", 4.5, crit=True), round=1)
+    cols.append(
+        {"type": "miss", "actor_id": "B", "target_id": "A", "ability_id": "fireball"}, round=2
+    )
+    cols.append({"type": "guard_block", "target_id": "A", "reduced": 2.0}, round=2)
+    cols.append(
+        {"type": "hazard", "hazard_id": "lava_zone", "target_id": "B", "effect_id": "burning"},
+        round=3,
+    )
+    assert len(cols) == 4
+    assert list(cols.cols["round"]) == [1, 2, 2, 3]
+    assert list(cols.cols["actor"]) == [0, 1, -1, -1]
+    assert list(cols.cols["target"]) == [1, 0, 0, 1]
+    # hazard and ability sources stay apart; effect ids are kept
+    assert list(cols.cols["ability"]) == [0, 1, -1, -1]
+    assert list(cols.cols["hazard"]) == [-1, -1, -1, 0]
+    assert list(cols.cols["effect"]) == [-1, -1, -1, 0]
+    assert cols.dictionaries["hazard"] == ["lava_zone"]
+    assert cols.dictionaries["effect"] == ["burning"]
+    assert cols.dictionaries["unit"] == ["A", "B"]
+    assert cols.dictionaries["ability"] == ["basic_attack", "fireball"]
+    assert list(cols.cols["crit"]) == [1, 0, 0, 0]
+    assert list(cols.cols["amount"]) == [4.5, 0.0, 2.0, 0.0]
+    cols.clear()
+    assert len(cols) == 0 and cols.code("unit", "B") == 1
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_sink_roundtrip_in_chunks(tmp_path, compress):
+    pytest.importorskip("numpy")
+    from combat.engine.event_columns import ColumnarEventSink, decode, load_events, read_manifest
+
+    with ColumnarEventSink(tmp_path, chunk_rows=4, compress=compress) as sink:
+        sink.extend([_hit("A", "B", float(i), crit=i % 2 == 0) for i in range(10)], round=3)
+    man = read_manifest(tmp_path)
+    assert man["rows"] == 10 and len(man["chunks"]) == 3
+    ev = load_events(tmp_path)
+    assert ev["amount"].tolist() == [float(i) for i in range(10)]
+    assert int(ev["crit"].sum()) == 5 and set(ev["round"].tolist()) == {3}
+    assert decode(ev["target"][:2], man["dictionaries"]["unit"]) == ["B", "B"]
+
+
+def test_sink_follows_encounter_clock(tmp_path):
+    pytest.importorskip("numpy")
+    from combat.engine.event_columns import ColumnarEventSink, load_events
+
+    a = Combatant("A", "A", {"ATT": 8, "DEX": 7, "ARM": 2, "WPN": 3}, 30, 0, team="alpha")
+    b = Combatant("B", "B", {"ATT": 7, "DEX": 6, "ARM": 2, "WPN": 2}, 30, 0, team="beta")
+    enc = Encounter([a, b], seed=5, content=ContentHandle(DATA))
+    sink = ColumnarEventSink(tmp_path, compress=False).bind(enc)
+    enc.run_until(max_rounds=20)
+    sink.close()
+    ev = load_events(tmp_path)
+    assert len(ev["round"]) == len(enc.events)
+    assert ev["round"].tolist() == sorted(ev["round"].tolist())
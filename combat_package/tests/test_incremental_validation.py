@@ -0,0 +1,67 @@
+from __future__ import annotations
+from pathlib import Path
+import copy
+
+from combat.loaders.pack_loader import load_base_bundle
+from combat.validators import IncrementalValidator, validate_bundle
+
+
+def _bundle():
+    return load_base_bundle(Path(__file__).parents[1] / "combat" / "data")
+
+
+def test_incremental_matches_full_validation():
+    b = _bundle()
+    v = IncrementalValidator()
+    assert v.validate(b) == validate_bundle(b)
+    b["abilities"].append({"id": "bad", "damage_type": "shadow", "cooldown": "soon"})
+    b["damage_types"].append({"id": 5})
+    assert v.validate(b) == validate_bundle(b)
+
+
+def test_unchanged_bundle_reruns_nothing():
+    b = _bundle()
+    v = IncrementalValidator()
+    v.validate(b)
+    assert "cross:abilities" in v.revalidated
+    v.validate(copy.deepcopy(b))
+    assert v.revalidated == []
+
+
+def test_only_touched_section_and_its_cross_refs_rerun():
+    b = _bundle()
+    v = IncrementalValidator()
+    v.validate(b)
+
+    # tweak a value that no id set depends on
+    b["status_effects"]["effects"]["burning"]["per_tick"] = "3"
+    v.validate(b)
+    assert v.revalidated == ["status_effects", "cross:status_effects"]
+
+    # a new ability only affects the abilities checks
+    b["abilities"].append({"id": "jab", "damage_type": "slashing"})
+    v.validate(b)
+    assert v.revalidated == ["abilities", "cross:abilities"]
+
+    # a new damage type invalidates both cross-reference checks
+    b["damage_types"].append({"id": "shadow"})
+    errs = v.validate(b)
+    assert v.revalidated == ["damage_types", "cross:abilities", "cross:status_effects"]
+    assert errs == validate_bundle(b)
+
+
+def test_section_keys_skip_hashing_unchanged_sections():
+    b = _bundle()
+    keys = {k: ("v1", k) for k in ("abilities", "damage_types", "narration", "body_parts")}
+    v = IncrementalValidator()
+    v.validate(b, keys)
+    # keyed sections are trusted as-is; only the unkeyed one is content-hashed
+    b["abilities"].append({"id": "bad", "cooldown": "soon"})
+    b["status_effects"]["effects"]["burning"]["per_tick"] = "3"
+    v.validate(b, keys)
+    assert v.revalidated == ["status_effects", "cross:status_effects"]
+
+    restored = IncrementalValidator(v.state)
+    keys["abilities"] = ("v2", "abilities")
+    assert restored.validate(b, keys) == validate_bundle(b)
+    assert restored.revalidated == ["abilities", "cross:abilities"]
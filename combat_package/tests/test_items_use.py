@@ -78,3 +78,39 @@ def test_cleanse_removes_burning():
     r = use_item([v], v, cd, [v.id], RandomSource(5))
     assert r["ok"]
     assert not any(s["id"] == "burning" for s in v.statuses)
+
+
+def test_item_catalog_compiles_and_merges_packs(tmp_path):
+    import shutil
+
+    from combat.engine.content import ContentHandle
+    from combat.engine.items import ItemCatalog
+
+    data = Path(__file__).parents[1] / "combat" / "data"
+    for name in ("items.yaml", "status_effects.yaml", "body_parts.yaml"):
+        shutil.copy(data / name, tmp_path / name)
+    (tmp_path / "content_packs.yaml").write_text(
+        "enabled: [extra]\npolicy: skip\n", encoding="utf-8"
+    )
+    pack = tmp_path / "packs" / "extra"
+    pack.mkdir(parents=True)
+    (pack / "items.yaml").write_text(
+        "items:\n"
+        "  venom_vial:\n    kind: consumable\n    effects: { apply_status: [poison] }\n"
+        "  healing_potion:\n    kind: consumable\n    effects: { heal_hp: 999 }\n",
+        encoding="utf-8",
+    )
+    content = ContentHandle(tmp_path)
+    cat = ItemCatalog.for_content(content)
+    assert ItemCatalog.for_content(content) is cat
+    assert "venom_vial" in cat and cat.get("healing_potion").heal_hp == 12.0  # policy: skip
+    assert cat.get("fire_bomb").ability["damage_type"] == "fire" and not cat.errors
+
+    v = Combatant("V", "V", {"INT": 5}, hp=20.0, mana=0.0, team="t1")
+    v.inventory = {"venom_vial": 1}
+    r = cat.use([v], v, "venom_vial", [], RandomSource(2))
+    assert r["ok"] and [s["id"] for s in v.statuses] == ["poison"]
+    assert cat.use([v], v, "nope", [], RandomSource(2))["reason"] == "unknown_item"
+
+    content.reload()
+    assert ItemCatalog.for_content(content) is not cat
@@ -0,0 +1,101 @@
+from pathlib import Path
+import statistics
+
+from combat.engine.combatant import Combatant
+from combat.engine.content import ContentHandle
+from combat.engine.encounter import Encounter
+from combat.engine.metrics import Histogram, MetricsAggregator, RunningStat
+
+DATA = Path(__file__).parents[1] / "combat" / "data"
+
+
+def test_running_stat_matches_statistics_and_merges():
+    xs = [3.0, 7.5, 1.0, 9.25, 4.0, 4.0, 12.0]
+    whole = RunningStat()
+    for x in xs:
+        whole.push(x)
+    assert abs(whole.mean - statistics.mean(xs)) < 1e-9
+    assert abs(whole.variance - statistics.variance(xs)) < 1e-9
+
+    a, b = RunningStat(), RunningStat()
+    for x in xs[:3]:
+        a.push(x)
+    for x in xs[3:]:
+        b.push(x)
+    a.merge(b)
+    assert abs(a.mean - whole.mean) < 1e-9 and abs(a.variance - whole.variance) < 1e-9
+    assert (a.min, a.max) == (1.0, 12.0)
+
+
+def test_histogram_buckets():
+    h = Histogram((0, 5, 10))
+    for x in (-1, 0, 4.9, 5, 10, 50):
+        h.add(x)
+    assert h.counts == [1, 2, 1, 2]
+
+
+def test_aggregator_events_summary_and_json_roundtrip():
+    abilities = {"abilities": [{"id": "fireball", "resource_cost": {"mana": 5}}]}
+    agg = MetricsAggregator(abilities)
+    agg.observe_outcome(
+        {
+            "ok": True,
+            "ability_id": "fireball",
+            "events": [
+                {
+                    "type": "hit",
+                    "ability_id": "fireball",
+                    "amount": 10.0,
+                    "dtype": "fire",
+                    "crit": True,
+                },
+                {"type": "effect", "ability_id": "fireball", "effect_id": "burning"},
+            ],
+        }
+    )
+    agg.observe({"type": "miss", "ability_id": "fireball"})
+    agg.observe({"type": "dot", "effect_id": "burning", "dtype": "fire", "amount": 2.0})
+    agg.observe({"type": "guard_block", "reduced": 3.0})
+    agg.observe(
+        {
+            "type": "hazard",
+            "hazard_id": "lava_zone",
+            "kind": "damage",
+            "amount": 4.0,
+            "dtype": "fire",
+        }
+    )
+    agg.observe_round(["lava_zone"])
+    agg.observe_round([])
+
+    s = agg.summary()
+    assert s["abilities"]["fireball"] == {
+        "hit_rate": 0.5,
+        "crit_rate": 1.0,
+        "total_damage": 10.0,
+        "damage_per_mana": 2.0,
+    }
+    assert s["hazards"]["lava_zone"]["uptime"] == 0.5
+    assert s["guard_blocked_total"] == 3.0
+    assert agg.sections["dtypes"]["fire"].stats["damage"].total == 16.0
+
+    back = MetricsAggregator.from_json(agg.to_json())
+    assert back.to_dict() == agg.to_dict()
+    merged = back.merge(agg)
+    assert merged.sections["effects"]["burning"].counts["applied"] == 2
+
+
+def test_encounter_listener_streams_events():
+    a = Combatant("A", "A", {"ATT": 8, "DEX": 7, "ARM": 2, "WPN": 3}, 30, 0, team="alpha")
+    b = Combatant("B", "B", {"ATT": 7, "DEX": 6, "ARM": 2, "WPN": 2}, 30, 0, team="beta")
+    enc = Encounter([a, b], seed=5, content=ContentHandle(DATA))
+    live = MetricsAggregator()
+    enc.subscribe(live)
+    enc.run_until(max_rounds=20)
+    post = MetricsAggregator()
+    post.observe_encounter(enc)
+    assert (
+        live.sections["abilities"]["basic_attack"].to_dict()
+        == post.sections["abilities"]["basic_attack"].to_dict()
+    )
+    assert live.sections["abilities"]["basic_attack"].counts["attacks"] > 0
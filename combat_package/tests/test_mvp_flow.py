@@ -79,7 +79,11 @@ def test_run_round_produces_log_and_damage():
     enc.run_round()
     assert len(enc.log) >= 1
     assert a.hp < 21.0 or b.hp < 21.0
-    assert "hits" in enc.log[0] or "slashes" in enc.log[0] or "takes" in enc.log[0]
+    # narrated from the encounter's content (combat/data/narration.yaml)
+    line = enc.log[0]
+    assert "Aria" in line and "Borin" in line
+    words = ["slashes", "cleaves", "carves", "hews", "rends", "Critical", "slips", "whistles"]
+    assert any(w in line for w in words)
 
 
 def test_effect_apply_and_tick_narration():
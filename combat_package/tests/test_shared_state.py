@@ -0,0 +1,133 @@
+from pathlib import Path
+import json
+import multiprocessing as mp
+import subprocess
+import sys
+
+import pytest
+
+from combat.engine.combatant import Combatant
+from combat.engine.content import ContentHandle
+from combat.engine.encounter import Encounter
+from combat.engine.shared_state import SharedParticipants
+
+DATA = Path(__file__).parents[1] / "combat" / "data"
+
+
+def _units():
+    a = Combatant("A", "Aria", {"ATT": 8, "DEX": 9, "ARM": 2, "WPN": 3}, 24, 5, team="alpha")
+    b = Combatant(
+        "B",
+        "Brute",
+        {"ATT": 9, "DEX": 5, "ARM": 3, "WPN": 2},
+        28,
+        0,
+        resist={"slashing": 0.1},
+        team="beta",
+    )
+    return [a, b]
+
+
+def _read_in_child(spec, out):
+    block = SharedParticipants.attach(spec)
+    try:
+        out.put({cid: block.row(cid) for cid in block.ids})
+    finally:
+        block.close()
+
+
+def test_columns_round_trip_and_attach_by_spec():
+    units = _units()
+    with SharedParticipants.create(units) as block:
+        row = block.row("B")
+        assert row["hp"] == 28.0 and row["team"] == "beta" and row["alive"]
+        assert row["stats"]["ATT"] == 9.0 and row["resist"]["slashing"] == 0.1
+        assert block.row("A")["resist"]["slashing"] == 0.0
+        reader = SharedParticipants.attach(block.spec)
+        try:
+            units[1].hp = 0.0
+            block.write(units)
+            # same memory, no copy: the reader sees the owner's write
+            assert reader.hp[1] == 0.0 and reader.living() == ["A"]
+            assert reader.living("beta") == [] and reader.seq % 2 == 0
+        finally:
+            reader.close()
+
+
+def test_encounter_mirrors_live_state():
+    units = _units()
+    enc = Encounter(units, seed=7, content=ContentHandle(DATA))
+    with SharedParticipants.create(units) as block:
+        enc.attach_shared(block)
+        snap = enc.snapshot()
+        enc.run_until(max_rounds=30)
+        for i, c in enumerate(units):
+            assert block.hp[i] == c.hp and bool(block.alive[i]) == c.is_alive()
+        enc.restore(snap)
+        assert list(block.hp) == [24.0, 28.0]
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_other_process_reads_without_copy(method):
+    if method not in mp.get_all_start_methods():
+        pytest.skip(f"needs {method}")
+    units = _units()
+    units[0].hp = 3.5
+    with SharedParticipants.create(units) as block:
+        ctx = mp.get_context(method)
+        out = ctx.Queue()
+        proc = ctx.Process(target=_read_in_child, args=(block.spec, out))
+        proc.start()
+        rows = out.get(timeout=60)
+        proc.join(timeout=60)
+        assert rows["A"]["hp"] == 3.5 and rows["B"]["team"] == "beta"
+
+
+@pytest.mark.skipif("spawn" not in mp.get_all_start_methods(), reason="needs spawn")
+def test_spawned_reader_keeps_the_owner_tracked():
+    # a spawn child shares the owner's resource tracker; unregistering there would drop the
+    # owner's entry and make the owner's unlink() fail inside the tracker
+    code = (
+        "import multiprocessing as mp\n"
+        "from combat.engine.shared_state import SharedParticipants\n"
+        "from combat.engine.combatant import Combatant\n"
+        "unit = Combatant('A', 'Aria', {'ATT': 8}, 24, 5, team='alpha')\n"
+        "with SharedParticipants.create([unit]) as block:\n"
+        "    ctx = mp.get_context('spawn')\n"
+        "    proc = ctx.Process(target=SharedParticipants.attach, args=(block.spec,))\n"
+        "    proc.start()\n"
+        "    proc.join(60)\n"
+        "    print(proc.exitcode)\n"
+    )
+    done = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parents[1],
+        timeout=120,
+    )
+    assert done.returncode == 0 and done.stdout.strip() == "0"
+    assert "KeyError" not in done.stderr and "leaked" not in done.stderr
+
+
+def test_unrelated_reader_process_leaves_block_alone():
+    units = _units()
+    with SharedParticipants.create(units) as block:
+        code = (
+            "import json, sys\n"
+            "from combat.engine.shared_state import SharedParticipants\n"
+            "b = SharedParticipants.attach(json.loads(sys.argv[1]))\n"
+            "print(b.row('A')['hp'])\n"
+            "b.close()\n"
+        )
+        done = subprocess.run(
+            [sys.executable, "-c", code, json.dumps(block.spec)],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parents[1],
+            timeout=60,
+        )
+        assert done.returncode == 0 and done.stdout.strip() == "24.0"
+        assert "leaked" not in done.stderr
+        # the reader's own resource tracker did not unlink the owner's block on exit
+        SharedParticipants.attach(block.spec).close()
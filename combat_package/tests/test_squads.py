@@ -0,0 +1,106 @@
+from pathlib import Path
+
+from combat.engine.combatant import Combatant
+from combat.engine.content import ContentHandle
+from combat.engine.rng import RandomSource
+from combat.engine.squads import ArmyBattle, group_units, make_squad, merge_squads, volley
+
+DATA = Path(__file__).parents[1] / "combat" / "data"
+
+
+def _unit(uid, team, hp=20.0, location="arena", **stats):
+    base = {"STR": 8, "DEX": 6, "INT": 4, "ARM": 2, "WPN": 3}
+    base.update(stats)
+    return Combatant(uid, uid.title(), base, hp, 10, team=team, location=location)
+
+
+def test_group_units_aggregates_homogeneous_units():
+    units = [_unit("a", "alpha") for _ in range(4)] + [_unit("b", "beta") for _ in range(3)]
+    units.append(_unit("c", "beta", hp=30))
+    squads = group_units(units)
+    assert sorted(s.count for s in squads) == [1, 3, 4]
+    four = next(s for s in squads if s.count == 4)
+    assert four.hp_pool == 80.0 and four.team == "alpha"
+
+
+def test_take_damage_kills_members_by_pool_threshold():
+    sq = make_squad(_unit("a", "alpha", hp=10), 5)
+    assert sq.take_damage(9) == 0 and sq.count == 5
+    assert sq.take_damage(12) == 2 and sq.count == 3
+    sq.heal(100)
+    assert sq.hp_pool == 30.0  # dead members are not revived
+    assert sq.take_damage(1000) == 3 and not sq.is_alive()
+
+
+def test_volley_bulk_rolls_are_deterministic_and_bounded():
+    ab = {"id": "basic_attack", "formula": "ATT + WPN - ARM*0.6", "damage_type": "slashing"}
+    res = []
+    for _ in range(2):
+        a = make_squad(_unit("a", "alpha"), 500)
+        b = make_squad(_unit("b", "beta"), 500)
+        res.append(volley(a, b, ab, RandomSource(7)))
+    assert res[0] == res[1]
+    ev = res[0]
+    assert 0 < ev["crits"] <= ev["hits"] <= ev["attacks"] == 500
+    assert ev["casualties"] > 0
+
+
+def test_partial_status_splits_squad_and_merge_restores_it():
+    content = ContentHandle(DATA)
+    lava = make_squad(_unit("lava_guys", "alpha", location="lava"), 400)
+    foes = make_squad(_unit("foes", "beta"), 1)
+    battle = ArmyBattle([lava, foes], seed=3, content=content)
+    battle._hazards("start_of_turn", [lava])
+    burning = [s for s in battle.squads if s.unit.statuses]
+    assert len(burning) == 1 and 0 < burning[0].count < 400
+    assert burning[0].count + lava.count <= 400
+    assert any(e["type"] == "hazard" and e["hazard_id"] == "lava_zone" for e in battle.events)
+
+    burning[0].unit.statuses.clear()
+    merged = merge_squads(battle.squads)
+    assert len([s for s in merged if s.team == "alpha"]) == 1
+
+
+def test_army_battle_with_thousands_of_units_rolls_per_squad():
+    content = ContentHandle(DATA)
+    alpha = [
+        make_squad(_unit("infantry", "alpha"), 2000),
+        make_squad(_unit("archers", "alpha", DEX=9), 500),
+    ]
+    beta = [make_squad(_unit("orcs", "beta", hp=26, STR=9), 2500)]
+    alpha[1].ability_id = "fireball"
+    battle = ArmyBattle(alpha + beta, seed=11, content=content)
+    draws = []
+    binomial = battle.rng.binomial
+    battle.rng.binomial = lambda n, p: draws.append(n) or binomial(n, p)
+    result = battle.run(max_rounds=200)
+    assert result["ended"] and result["winner_team"] in ("alpha", "beta")
+    assert set(result["survivors"]) == {result["winner_team"]}
+
+    # work scales with squads and rounds, not with the 5000 units
+    volleys = [e for e in battle.events if e["type"] == "volley"]
+    assert max(v["attacks"] for v in volleys) >= 2000
+    assert len(volleys) <= 8 * result["rounds"]
+    assert len(draws) <= 16 * result["rounds"]
+
+
+def test_binomial_is_exact_for_rare_events():
+    rng = RandomSource(11)
+    # n*p = 0.2: a clamped normal approximation rounds far too many draws to 0
+    draws = [rng.binomial(5000, 0.00004) for _ in range(20000)]
+    assert abs(draws.count(0) / len(draws) - (1 - 0.00004) ** 5000) < 0.01
+    assert abs(sum(draws) / len(draws) - 0.2) < 0.02
+    near_certain = [rng.binomial(1000, 0.999) for _ in range(2000)]
+    assert max(near_certain) <= 1000 and abs(sum(near_certain) / 2000 - 999) < 0.1
+
+
+def test_squad_casts_charge_each_member_once():
+    content = ContentHandle(DATA)
+    mages = make_squad(_unit("mages", "alpha", INT=12), 10)
+    mages.ability_id = "fireball"
+    foes = make_squad(_unit("foes", "beta", hp=500), 10)
+    battle = ArmyBattle([mages, foes], seed=5, content=content)
+    cost = float(content.ability("fireball")["resource_cost"]["mana"])
+    battle.take_turn(mages)
+    # mana on the squad's unit is each member's own pool: every member paid for one cast
+    assert mages.unit.mana == 10 - cost
@@ -0,0 +1,56 @@
+import copy
+
+from combat.engine.combatant import Combatant, StatDict
+from combat.engine.resolution import attack_context, pair_hit_chance
+
+
+def _c(cid, dex, team):
+    return Combatant(
+        cid, cid, {"ATT": 8, "DEX": dex, "ARM": 2, "WPN": 3, "INT": 5}, 20, 0, team=team
+    )
+
+
+def test_stats_are_versioned_on_every_write():
+    a = _c("A", 7, "alpha")
+    assert isinstance(a.stats, StatDict)
+    v0 = a.stats_version
+    a.stats["DEX"] = 9
+    v1 = a.stats_version
+    a.stats.update({"ATT": 1})
+    assert v0 < v1 < a.stats_version
+    assert copy.deepcopy(a).stats_version != a.stats_version
+
+
+def test_formula_context_cached_until_stats_change():
+    a = _c("A", 7, "alpha")
+    ctx = a.formula_context()
+    assert ctx == {"STR": 0.0, "DEX": 7.0, "INT": 5.0, "STA": 0.0}
+    assert a.formula_context() is ctx
+    a.stats["INT"] = 10
+    assert a.formula_context()["INT"] == 10.0
+    a.stats = {"DEX": 1}  # plain dict reassignment is picked up as well
+    assert a.formula_context()["DEX"] == 1.0 and isinstance(a.stats, StatDict)
+
+
+def test_pair_context_and_accuracy_follow_either_side():
+    a, b = _c("A", 7, "alpha"), _c("B", 5, "beta")
+    ctx = attack_context(a, b)
+    assert attack_context(a, b) is ctx
+    assert abs(pair_hit_chance(a, b) - 0.77) < 1e-9
+    b.stats["DEX"] = 15
+    assert attack_context(a, b)["T_DEX"] == 15.0
+    assert abs(pair_hit_chance(a, b) - 0.67) < 1e-9
+    a.stats["DEX"] = 20
+    assert abs(pair_hit_chance(a, b) - 0.80) < 1e-9
+
+
+def test_caches_are_not_copied_or_pickled():
+    import pickle
+
+    a, b = _c("A", 7, "alpha"), _c("B", 5, "beta")
+    a.formula_context()
+    a.pair_cached(b, lambda x, y: "payload")
+    for clone in (copy.deepcopy(a), copy.copy(a), pickle.loads(pickle.dumps(a))):
+        assert clone._self_ctx is None and clone._pair_cache == {}
+        assert clone.stats == a.stats
+    assert a._pair_cache and a._self_ctx is not None
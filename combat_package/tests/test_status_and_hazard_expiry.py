@@ -0,0 +1,88 @@
+from __future__ import annotations
+from pathlib import Path
+
+import yaml
+
+from combat.engine.combatant import Combatant
+from combat.engine.content import ContentHandle
+from combat.engine.effects import apply_status, status_remaining, tick_start_of_turn
+from combat.engine.encounter import Encounter
+from combat.engine.environment import Environment
+from combat.engine.rng import RandomSource
+from combat.loaders.status_effects_loader import load_status_effects
+
+
+def _cfg():
+    return load_status_effects(
+        Path(__file__).parents[1] / "combat" / "data" / "status_effects.yaml"
+    )
+
+
+def _hazards(duration: int):
+    return {
+        "hazards": [
+            {
+                "id": "brief_flames",
+                "phase": "start_of_turn",
+                "targeting": {"team": "any"},
+                "duration_rounds": duration,
+                "effects": {"damage": {"amount": 2, "damage_type": "fire"}},
+            }
+        ]
+    }
+
+
+def test_refresh_extends_expiry_without_per_turn_writes():
+    cfg = _cfg()
+    v = Combatant("V", "V", {"INT": 10}, hp=100.0, mana=0.0)
+    apply_status(v, "burning", cfg)  # duration 3
+    st = v.statuses[0]
+    rng = RandomSource(1)
+    tick_start_of_turn(v, cfg, rng)
+    tick_start_of_turn(v, cfg, rng)
+    assert status_remaining(v, st) == 1
+    assert set(st) == {"id", "source_id", "stacks", "expires_at"}
+    apply_status(v, "burning", cfg)  # refresh → 3 more ticks
+    for _ in range(3):
+        assert tick_start_of_turn(v, cfg, rng)
+    assert not v.statuses
+    assert not tick_start_of_turn(v, cfg, rng)
+
+
+def test_hand_built_remaining_statuses_still_expire():
+    cfg = _cfg()
+    v = Combatant("V", "V", {"INT": 10}, hp=100.0, mana=0.0)
+    v.statuses.append({"id": "poison", "source_id": None, "remaining": 2, "stacks": 1})
+    rng = RandomSource(2)
+    assert tick_start_of_turn(v, cfg, rng)
+    assert tick_start_of_turn(v, cfg, rng)
+    assert not v.statuses
+
+
+def test_finite_hazard_runs_out_on_schedule():
+    env = Environment(_hazards(2), start_round=1)
+    a = Combatant("A", "A", {}, hp=50.0, mana=0.0)
+    rng = RandomSource(3)
+    assert env.process_phase("start_of_turn", [a], rng)
+    assert env.tick_round_boundary(2) == []
+    assert env.remaining_rounds(env.hazards[0]) == 1
+    assert env.process_phase("start_of_turn", [a], rng)
+    assert env.tick_round_boundary(3) == ["brief_flames"]
+    assert not env.process_phase("start_of_turn", [a], rng)
+
+
+def test_encounter_rounds_expire_hazards_and_snapshot_keeps_them(tmp_path):
+    (tmp_path / "hazards.yaml").write_text(yaml.safe_dump(_hazards(1)), encoding="utf-8")
+    a = Combatant("A", "A", {"DEX": 5}, hp=50.0, mana=0.0, team="t1")
+    b = Combatant("B", "B", {"DEX": 4}, hp=50.0, mana=0.0, team="t2")
+    enc = Encounter([a, b], seed=4, content=ContentHandle(tmp_path))
+    apply_status(b, "poison", _cfg())
+    snap = enc.snapshot()
+    assert snap["participants"][1]["statuses"][0]["remaining"] == 4
+    enc.next_turn()
+    enc.next_turn()  # round 2 starts → 1-round hazard gone
+    assert not enc.env.hazards
+
+    enc.restore(snap)
+    assert [h["id"] for h in enc.env.hazards] == ["brief_flames"]
+    assert status_remaining(b, b.statuses[0]) == 4
@@ -0,0 +1,44 @@
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+import yaml
+
+from combat.loaders import yaml_utils
+from combat.loaders.pack_loader import load_base_bundle, load_pack_bundle
+
+
+def _data_root():
+    return Path(__file__).parents[1] / "combat" / "data"
+
+
+def test_fast_loader_matches_pure_python_parser():
+    for p in sorted(_data_root().rglob("*.yaml")):
+        with open(p, "r", encoding="utf-8") as fh:
+            expected = yaml.safe_load(fh)
+        assert yaml_utils.safe_load_path(p) == expected, p
+
+
+def test_load_parallel_keeps_job_order_and_raises():
+    jobs = {i: (lambda i=i: i * i) for i in range(20)}
+    out = yaml_utils.load_parallel(jobs)
+    assert list(out) == list(range(20))
+    assert out[7] == 49
+
+    def bad():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        yaml_utils.load_parallel({"a": lambda: 1, "b": bad})
+
+
+def test_parse_timings_report_slowest_files():
+    yaml_utils.reset_parse_timings()
+    load_base_bundle(_data_root())
+    load_pack_bundle(_data_root() / "packs" / "starter_plus")
+    timings = yaml_utils.parse_timings()
+    assert str(_data_root() / "abilities.yaml") in timings
+    assert str(_data_root() / "packs" / "starter_plus" / "abilities.yaml") in timings
+    top = yaml_utils.slowest_files(3)
+    assert len(top) == 3
+    assert top[0][1] >= top[-1][1]